@@ -6,7 +6,7 @@ from .helpers import *
 from .abstract import *
 from .core import *
 from .algorithms import *
-from .visualize import *
-from .experiments import *
-from .console import *
-from .tests import *
+
+# Visualization (matplotlib, pandas), experiments, console and tests
+# are imported on first access, so that importing the core is fast.
+__getattr__, __dir__ = lazy_exports(__name__, ['visualize', 'experiments', 'console', 'tests'])
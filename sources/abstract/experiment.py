@@ -10,24 +10,62 @@ variable. A list of values for the independent variable are along with the
 set of controlled variables are specified. To compare multiple algorithms or
 implementations, several data series can be provided. Provides method for
 outputing and generating CSV as well as visualizations, via matplotlib.
+matplotlib is only imported when a visualization is output.
+
+In benchmark mode, each timed measurement is preceded by warmup runs, is
+evaluated with the garbage collector disabled and is repeated until a
+minimum time budget is spent. The results are summarized per x-value and
+series with robust statistics (median, interquartile range and confidence
+interval of the median), and can be output as JSON.
+
+Memory measurements trace the Python memory allocations (via tracemalloc) of
+evaluating a function: the peak traced memory, the retained memory of its
+result and the number of traced memory blocks it retains, which can be
+recorded as additional Y components.
+
+The independent cells of an experiment (such as each x-value, series and
+round) can be evaluated in parallel, across a pool of worker processes, each
+optionally pinned to one processor core. Each cell is evaluated with its own
+deterministic seed, derived from the experiment's seed and the cell's index,
+so that the results do not depend on the number of workers, and the results
+are returned in the same order as the cells.
+
+Each measurement of an experiment (each x-value, series and round) can be
+recorded to an append-only checkpoint log, as soon as it is taken. An
+experiment that is resumed from its checkpoint log restores the recorded
+measurements (and the seed) instead of measuring them again.
 
 Classes:
 - Experiment
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from csv import DictWriter
 from dataclasses import dataclass
+from gc import collect, disable, enable, isenabled
+from json import dump, dumps, loads
+from math import ceil, floor, sqrt
 from inspect import FrameInfo, stack
-from io import FileIO
+from io import FileIO, StringIO
+from multiprocessing import get_all_start_methods, get_context
 from numbers import Number
-from os.path import basename
+import os
+from os import makedirs
+from os.path import basename, isfile, join
+from random import seed as pyseed
+from statistics import NormalDist
 from time import perf_counter, strftime
+from tracemalloc import Filter, get_traced_memory, is_tracing, reset_peak, take_snapshot
+from tracemalloc import __file__ as tracemalloc_file
+from tracemalloc import start as start_tracing, stop as stop_tracing
 from typing import \
-     Any, Callable, Dict, Generic, Iterable, List, \
+     Any, Callable, Dict, Generic, Iterable, Iterator, List, \
      NamedTuple, Tuple, TypeVar, Union
 
-from matplotlib import pyplot as plt
-from numpy import amax, amin, arange, mean
+from numpy import amax, amin, arange, mean, median, percentile, std
+from numpy.random import SeedSequence
+from numpy.random import seed as npseed
 
 from sources.helpers import Randoms
 
@@ -44,6 +82,58 @@ class Xseries(NamedTuple):
   series: str
 
 
+# The experiment, cell function and cells being evaluated in parallel,
+# inherited by the (forked) worker processes, as the cell functions are
+# usually closures that cannot be pickled.
+_parallel: Dict[str, Any] = {}
+
+
+def _initialize_worker(counter: Any, cores: List[int]):
+  """
+  Initialize a worker process of the parallel evaluation of cells by
+  pinning it to the next processor core, if cores are given.
+
+  Args:
+    counter:  The shared counter of initialized workers.
+    cores:    The processor cores to pin the workers to.
+  """
+  if len(cores) > 0:
+    from os import sched_setaffinity
+
+    with counter.get_lock():
+      index = counter.value
+      counter.value += 1
+    sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _evaluate_worker(index: int) -> Tuple[Any, str, List]:
+  """
+  Evaluate the cell at the given index, within a worker process, capturing
+  the entries logged to the experiment's logger and the measurements
+  recorded or restored by the cell.
+
+  Args:
+    index:  The index of the cell to evaluate.
+
+  Returns:
+    The result of the cell, the captured log entries
+    and the captured measurements, as a tuple.
+  """
+  exp, function, cells = _parallel['experiment'], _parallel['function'], _parallel['cells']
+  logger = exp.data.get('logger')
+  exp._measured = []
+
+  with StringIO() as output:
+    if logger is not None:
+      exp.data['logger'] = output
+    try:
+      result = exp.evaluate_cell(function, cells[index], index)
+    finally:
+      if logger is not None:
+        exp.data['logger'] = logger
+    return (result, output.getvalue(), exp._measured)
+
+
 @dataclass
 class Experiment(Generic[X, Y]): # pylint: disable=E1136
   """
@@ -66,6 +156,10 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     x, y:   The independent and dependent variable values.
             The dependent variable could have multiple
             components, as a named tuple.
+    timings:
+            The elapsed times, in seconds, of evaluating
+            each round of each x-value and series, for
+            comparisons against performance baselines.
     xname:  The name of the independent variable.
     ynames: The name of the dependent variable or the names
             of each component of the dependent variable.
@@ -73,25 +167,68 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
             evaluated from the same x and series.
             The dependent variable is the average value
             over these runs.
+    warmup: The number of untimed runs before each timed
+            measurement, in benchmark mode.
+    mintime:
+            The minimum total number of seconds spent on
+            the timed runs of each x-value and series, in
+            benchmark mode.
+    confidence:
+            The confidence level of the confidence
+            interval of the median.
+    jobs:   The number of worker processes to evaluate
+            the cells of this experiment with.
+    pin:    Whether or not to pin each worker process
+            to one processor core.
+    seed:   The seed from which the seed of each cell
+            is derived.
+    checkpoint:
+            The directory of the checkpoint log of the
+            recorded measurements, if any.
+    recorded:
+            The measurements within the checkpoint log,
+            when resumed, to be restored. Mapping of the
+            x-value, series and round to the y value
+            and elapsed time.
     data:   The controlled variables values and
             additional data properties.
     aggs:   The statistically methods for computing the
             aggregate Y value or Y component value.
             If 'noagg', returns all Y values as list or
             each Y component as a list of values.
+
+  Class Attributes:
+    MemoryMeasures:
+            The names of the memory measurements,
+            as returned by memit.
   """
+  MemoryMeasures = ['peak', 'retained', 'blocks']
+
   name:   str
   series: List[str]
   x:      List[X]
   y:      Dict[Xseries, List[Y]]
+  timings:    Dict[Xseries, List[float]]
   xname:  str
   ynames: Union[str, List[str]]
   rounds: int
+  warmup: int
+  mintime:    float
+  confidence: float
+  jobs:   int
+  pin:    bool
+  seed:   int
+  checkpoint: str
+  recorded:   Dict[Tuple[X, str, int], Tuple[Y, float]]
   data:   Dict[str, Any]
   aggs:   Dict[str, Callable[[Iterable[Y]], Yn]]
 
   def __init__(self, name: str, xname: str, ynames: Union[str, List[str]],
-                     series: List[str], x: List[X], rounds: int = 1, **data):
+                     series: List[str], x: List[X], rounds: int = 1,
+                     warmup: int = 0, mintime: float = 0.0,
+                     confidence: float = 0.95, jobs: int = 1,
+                     pin: bool = False, seed: int = None,
+                     checkpoint: str = None, resume: bool = False, **data):
     """
     Initialize this abstract experiment with the necessary data series,
     controlled variables, values for the independent variable and the data
@@ -109,9 +246,45 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
               evaluated from the same x and series.
               The dependent variable is the average value
               over these runs.
+      warmup: The number of untimed runs before each timed
+              measurement. Enables benchmark mode if > 0.
+      mintime:
+              The minimum total number of seconds spent on
+              the timed runs of each x-value and series.
+              Enables benchmark mode if > 0.
+      confidence:
+              The confidence level of the confidence
+              interval of the median.
+      jobs:   The number of worker processes to evaluate
+              the cells of this experiment with.
+      pin:    Whether or not to pin each worker process
+              to one processor core.
+      seed:   The seed from which the seed of each cell
+              is derived. If None, a random seed is drawn.
+      checkpoint:
+              The directory of the checkpoint log of the
+              recorded measurements. If None, measurements
+              are not recorded.
+      resume: Whether or not to resume from the existing
+              checkpoint log (and its seed), or to start
+              a new checkpoint log.
       data:   The controlled variables values and
               additional data properties.
+
+    Raises:
+      ValueError: If parallel jobs or pinning are
+                  unsupported on this platform.
     """
+    assert isinstance(warmup, int) and warmup >= 0
+    assert isinstance(mintime, Number) and mintime >= 0
+    assert 0 < confidence < 1
+    assert isinstance(jobs, int) and jobs > 0
+
+    if jobs > 1 and 'fork' not in get_all_start_methods():
+      raise ValueError('Parallel jobs require the fork start method, unsupported on this platform')
+    if pin and not (hasattr(os, 'sched_getaffinity') and hasattr(os, 'sched_setaffinity')):
+      raise ValueError('Pinning workers to processor cores is unsupported on this platform')
+
     ytups = lambda ys: all([isinstance(y, Tuple) for y in ys])
 
     self.name   = name
@@ -120,14 +293,28 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     self.xname  = xname
     self.ynames = ynames
     self.rounds = rounds
+    self.warmup = warmup
     self.data   = data
     self.y      = {}
+    self.timings    = {}
+    self.mintime    = mintime
+    self.confidence = confidence
+    self.jobs   = jobs
+    self.pin    = pin
+    self.seed   = SeedSequence(seed).entropy
+    self.checkpoint = checkpoint
+    self.recorded   = {}
+    self._measured  = None
+
+    if checkpoint is not None:
+      self.open_checkpoint(resume)
 
     self.aggs = {
-      'mean':  lambda ys: tuple(mean(ys, axis=0)) if ytups(ys) else mean(ys),
-      'max':   lambda ys: tuple(amax(ys, axis=0)) if ytups(ys) else amax(ys),
-      'min':   lambda ys: tuple(amin(ys, axis=0)) if ytups(ys) else amin(ys),
-      'noagg': lambda ys: tuple(map(list, zip(*ys))) if ytups(ys) else ys
+      'mean':   lambda ys: tuple(mean(ys, axis=0)) if ytups(ys) else mean(ys),
+      'median': lambda ys: tuple(median(ys, axis=0)) if ytups(ys) else median(ys),
+      'max':    lambda ys: tuple(amax(ys, axis=0)) if ytups(ys) else amax(ys),
+      'min':    lambda ys: tuple(amin(ys, axis=0)) if ytups(ys) else amin(ys),
+      'noagg':  lambda ys: tuple(map(list, zip(*ys))) if ytups(ys) else ys
     }
 
   ### Methods: Getters
@@ -236,6 +423,89 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
 
     return [kv[s] for s in self.series]
 
+  @property
+  def benchmark(self) -> bool:
+    """
+    Whether or not this experiment's timed measurements are evaluated in
+    benchmark mode: with warmup runs, with the garbage collector disabled
+    and with a minimum time budget.
+
+    Returns:
+      True:   If in benchmark mode.
+      False:  Otherwise.
+    """
+    return self.warmup > 0 or self.mintime > 0
+
+  @staticmethod
+  def summarize(ys: List[Number], confidence: float = 0.95) -> Dict[str, float]:
+    """
+    Returns the summary statistics of the given values: the number of
+    values, mean, standard deviation, median, first and third quartiles,
+    interquartile range (IQR), the distribution-free confidence interval of
+    the median (between order statistics) and the number of outliers (values
+    more than 1.5 IQR outside the quartiles).
+
+    Args:
+      ys:         The values to summarize.
+      confidence: The confidence level of the confidence
+                  interval of the median.
+
+    Returns:
+      The summary statistics.
+    """
+    assert len(ys) > 0
+
+    n = len(ys)
+    q1, q2, q3 = percentile(ys, [25, 50, 75]).tolist()
+    iqr = q3 - q1
+
+    # Order statistics bounding the median with the given confidence.
+    z  = NormalDist().inv_cdf((1 + confidence) / 2)
+    lo = max(floor(n/2 - z*sqrt(n)/2), 1)
+    hi = min(ceil(1 + n/2 + z*sqrt(n)/2), n)
+    ordered = sorted(ys)
+
+    return {
+      'n':        n,
+      'mean':     float(mean(ys)),
+      'stdev':    float(std(ys, ddof=1)) if n > 1 else 0.0,
+      'median':   q2,
+      'q1':       q1,
+      'q3':       q3,
+      'iqr':      iqr,
+      'ci_lower': float(ordered[lo - 1]),
+      'ci_upper': float(ordered[hi - 1]),
+      'outliers': sum([1 for y in ys if y < q1 - 1.5*iqr or q3 + 1.5*iqr < y])
+    }
+
+  def getstats(self, key: Union[Xseries, Tuple], measure: str = None) -> Dict[str, float]:
+    """
+    Returns the summary statistics of the dependent variable, y, values for
+    the given independent variable, x, and series pair, as summarized by
+    summarize. If a specific Y-component, measure, is given, summarizes
+    that component.
+
+    Args:
+      key:      The independent variable, x, and series pair.
+      measure:  The specific Y component.
+
+    Returns:
+      The summary statistics.
+      None, if there are no values.
+    """
+    assert isinstance(key, (Tuple, Xseries)) and len(key) == 2
+
+    if not isinstance(key, Xseries):
+      key = Xseries(*key)
+    if key not in self.y or len(self.y[key]) == 0:
+      return None
+
+    ys = self.y[key]
+    if isinstance(self.ynames, List) and measure in self.ynames:
+      ys = [y[self.ynames.index(measure)] for y in ys]
+
+    return self.summarize(ys, self.confidence)
+
   ### Methods: Setters
 
   def sety(self, key: Union[Xseries, Tuple], y: Y):
@@ -258,6 +528,372 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
 
     self.y[key].append(y)
 
+  def settiming(self, key: Union[Xseries, Tuple], elapsed: float):
+    """
+    Records the given elapsed time of evaluating one round of the
+    given independent variable, x, and series pair.
+
+    Args:
+      key:
+        The independent variable, x, and series pair.
+      elapsed:
+        The elapsed time, in seconds.
+    """
+    assert isinstance(key, (Tuple, Xseries)) and len(key) == 2
+
+    if not isinstance(key, Xseries):
+      key = Xseries(*key)
+    if key not in self.timings:
+      self.timings[key] = []
+
+    self.timings[key].append(elapsed)
+
+  def _apply(self, key: Xseries, y: Y, elapsed: float = None):
+    """
+    Assigns the given dependent variable, y, value and elapsed time
+    of one round to the given independent variable, x, and series pair,
+    and captures the measurement within a worker process.
+
+    Args:
+      key:      The independent variable, x, and series pair.
+      y:        The dependent variable, y, value.
+      elapsed:  The elapsed time, in seconds, if any.
+    """
+    self.sety(key, y)
+    if elapsed is not None:
+      self.settiming(key, elapsed)
+    if self._measured is not None:
+      self._measured.append((key, y, elapsed))
+
+  ### Methods: Checkpoints
+
+  @property
+  def checkpoint_path(self) -> str:
+    """
+    The file path of this experiment's checkpoint log.
+
+    Returns:
+      The file path of the checkpoint log.
+      None, if there is no checkpoint directory.
+    """
+    if self.checkpoint is None:
+      return None
+
+    return join(self.checkpoint, f'{self.name}.jsonl')
+
+  def open_checkpoint(self, resume: bool = False):
+    """
+    Opens this experiment's checkpoint log, in the line-delimited JSON (JSON
+    Lines) format: a header line with the experiment's name, parameters and
+    seed, followed by one line per recorded measurement. If resuming from an
+    existing checkpoint log, loads its seed and recorded measurements, to be
+    restored. Otherwise, starts a new checkpoint log.
+
+    Args:
+      resume: Whether or not to resume from the
+              existing checkpoint log.
+
+    Raises:
+      ValueError: If resuming from a checkpoint log whose
+                  x-values, series, rounds, warmup or
+                  mintime differ from this experiment's.
+    """
+    path = self.checkpoint_path
+    makedirs(self.checkpoint, exist_ok=True)
+
+    # Compares the headers as parsed from JSON, where tuples become lists.
+    header = loads(dumps({
+      'experiment': self.name, 'xname': self.xname, 'ynames': self.ynames,
+      'series': list(self.series), 'x': list(self.x), 'rounds': self.rounds,
+      'warmup': self.warmup, 'mintime': self.mintime
+    }))
+
+    if resume and isfile(path):
+      with open(path, 'r') as source:
+        lines  = [loads(line) for line in source if line.strip()]
+      stored = lines[0] if len(lines) > 0 else {}
+      if stored.get('experiment') == self.name:
+        differs = [k for k, v in header.items() if stored.get(k) != v]
+        if len(differs) > 0:
+          raise ValueError(f'Cannot resume from checkpoint log {path}: '
+                           f'its {", ".join(differs)} differ from the experiment\'s')
+
+        self.seed = stored['seed']
+        for line in lines[1:]:
+          y = tuple(line['y']) if isinstance(line['y'], List) else line['y']
+          self.recorded[(line['x'], line['series'], line['round'])] = (y, line['timing'])
+        return
+
+    with open(path, 'w') as output:
+      output.write(f'{dumps({**header, "seed": self.seed})}\n')
+
+  def isrecorded(self, key: Union[Xseries, Tuple], n: int) -> bool:
+    """
+    Whether or not the measurement of the given independent variable, x,
+    and series pair and round is recorded in the checkpoint log.
+
+    Args:
+      key:    The independent variable, x, and series pair.
+      n:      The round number.
+
+    Returns:
+      True:   If the measurement is recorded.
+      False:  Otherwise.
+    """
+    return (key[0], key[1], n) in self.recorded
+
+  def restore(self, key: Union[Xseries, Tuple], n: int) -> bool:
+    """
+    Restores the measurement of the given independent variable, x, and
+    series pair and round from the checkpoint log, if it is recorded.
+
+    Args:
+      key:    The independent variable, x, and series pair.
+      n:      The round number.
+
+    Returns:
+      True:   If the measurement is restored.
+      False:  If the measurement is not recorded,
+              and must be measured.
+    """
+    if not self.isrecorded(key, n):
+      return False
+
+    y, elapsed = self.recorded[(key[0], key[1], n)]
+    self._apply(Xseries(*key), y, elapsed)
+
+    return True
+
+  def record(self, key: Union[Xseries, Tuple], n: int, y: Y, elapsed: float = None):
+    """
+    Records the given dependent variable, y, value and elapsed time of the
+    given round of the given independent variable, x, and series pair. If
+    there is a checkpoint directory, appends the measurement to the
+    checkpoint log immediately.
+
+    Args:
+      key:      The independent variable, x, and series pair.
+      n:        The round number.
+      y:        The dependent variable, y, value.
+      elapsed:  The elapsed time, in seconds, if any.
+    """
+    assert isinstance(key, (Tuple, Xseries)) and len(key) == 2
+
+    if self.checkpoint is not None:
+      line = {'x': key[0], 'series': key[1], 'round': n, 'y': y, 'timing': elapsed}
+      with open(self.checkpoint_path, 'a') as output:
+        output.write(f'{dumps(line, default=lambda v: v.item())}\n')
+
+    self._apply(Xseries(*key), y, elapsed)
+
+  ### Methods: Measurements
+
+  @staticmethod
+  @contextmanager
+  def gcdisabled() -> Iterator[None]:
+    """
+    Context manager that collects garbage on entry, and disables
+    the garbage collector within the context.
+
+    Returns:
+      An Iterator of None.
+    """
+    enabled = isenabled()
+    collect()
+    disable()
+    try:
+      yield
+    finally:
+      if enabled:
+        enable()
+
+  def timeit(self, function: Callable, *args, **kwargs) -> Tuple[float, int]:
+    """
+    Measure the elapsed time of evaluating the given function once, for one
+    round of this experiment. In benchmark mode, evaluates the function
+    untimed for the warmup runs, then repeatedly evaluates the function with
+    the garbage collector disabled, until at least this round's share of the
+    minimum time budget has been spent, and measures the average elapsed
+    time per evaluation.
+
+    Args:
+      function:       The function to measure.
+      args, kwargs:   The arguments to the function.
+
+    Returns:
+      The elapsed time per evaluation and the
+      number of timed evaluations, as a tuple.
+    """
+    if not self.benchmark:
+      start = perf_counter()
+      function(*args, **kwargs)
+      return (perf_counter() - start, 1)
+
+    for _ in range(self.warmup):
+      function(*args, **kwargs)
+
+    budget  = self.mintime / max(self.rounds, 1)
+    repeats = 0
+
+    with self.gcdisabled():
+      start = perf_counter()
+      while repeats == 0 or perf_counter() - start < budget:
+        function(*args, **kwargs)
+        repeats += 1
+      elapsed = perf_counter() - start
+
+    return (elapsed / repeats, repeats)
+
+  @staticmethod
+  def memit(function: Callable, *args, **kwargs) -> Tuple[Any, Dict[str, int]]:
+    """
+    Measure the memory allocations of evaluating the given function once,
+    by tracing the Python memory allocations. Starts tracing if not already
+    tracing (and stops tracing afterwards). Garbage is collected before and
+    after the evaluation, so that the retained memory only includes the
+    memory still reachable, such as the function's result. The retained
+    blocks are counted from tracemalloc snapshots taken before and after the
+    evaluation, so include the blocks of every allocator traced, not only
+    those of pymalloc. Tracing slows down allocations and taking snapshots
+    is proportional to the number of traced blocks, the function should not
+    be timed at the same time.
+
+    Args:
+      function:       The function to measure.
+      args, kwargs:   The arguments to the function.
+
+    Returns:
+      The result of the function and the memory measures,
+      as a tuple. The memory measures are: 'peak', the peak
+      traced memory during the evaluation, in bytes;
+      'retained', the traced memory retained after the
+      evaluation, in bytes; and 'blocks', the number of
+      traced memory blocks retained after the evaluation.
+    """
+    tracing = is_tracing()
+    if not tracing:
+      start_tracing()
+
+    # Exclude the traces of the snapshots themselves
+    snapshot = lambda: take_snapshot().filter_traces([Filter(False, tracemalloc_file)])
+
+    try:
+      before  = snapshot()
+      collect()
+      current = get_traced_memory()[0]
+      reset_peak()
+
+      result = function(*args, **kwargs)
+
+      peak = get_traced_memory()[1]
+      collect()
+      retained = get_traced_memory()[0]
+      after    = snapshot()
+    finally:
+      if not tracing:
+        stop_tracing()
+
+    return (result, {
+      'peak':     max(peak - current, 0),
+      'retained': max(retained - current, 0),
+      'blocks':   max(len(after.traces) - len(before.traces), 0)
+    })
+
+  ### Methods: Evaluation
+
+  def cellseed(self, index: int) -> int:
+    """
+    Returns the deterministic seed of the cell at the given index,
+    derived from this experiment's seed.
+
+    Args:
+      index:  The index of the cell.
+
+    Returns:
+      The seed of the cell.
+    """
+    return int(SeedSequence(self.seed, spawn_key=(index,)).generate_state(1)[0])
+
+  def fixtureseed(self, replicate: int = 0) -> int:
+    """
+    Returns the deterministic seed of the given replicate of the randomly
+    generated datasets (fixtures) of this experiment, derived from this
+    experiment's seed, independently of the cells' seeds. Datasets with the
+    same parameters and replicate are the same across the cells of this
+    experiment, and across experiments with the same seed.
+
+    Args:
+      replicate:  The index of the replicate.
+
+    Returns:
+      The seed of the replicate.
+    """
+    return int(SeedSequence(self.seed, spawn_key=(1, replicate)).generate_state(1)[0])
+
+  def evaluate_cell(self, function: Callable[..., Any], cell: Tuple, index: int) -> Any:
+    """
+    Evaluate the given function for the given cell, after seeding the
+    random number generators with the seed of the cell's index.
+
+    Args:
+      function: The function to evaluate for the cell.
+      cell:     The arguments to the function.
+      index:    The index of the cell.
+
+    Returns:
+      The result of the function.
+    """
+    seed = self.cellseed(index)
+    npseed(seed)
+    pyseed(seed)
+
+    return function(*cell)
+
+  def evaluate_cells(self, function: Callable[..., Any], cells: List[Tuple]) -> Iterator[Any]:
+    """
+    Evaluate the given function for each of the given independent cells
+    (for example, each x-value, series and round), each with its own seed.
+    If jobs is greater than one, evaluates the cells in parallel across a
+    pool of (forked) worker processes, optionally pinned to one processor
+    core each; entries logged to this experiment's logger by the workers
+    are written in the order of the cells, and measurements recorded
+    or restored by the workers are assigned in the order of the cells.
+
+    Args:
+      function: The function to evaluate for each cell.
+                Its results must be picklable if evaluated
+                in parallel.
+      cells:    The arguments to the function, per cell.
+
+    Returns:
+      An Iterator of the results of the function,
+      in the same order as the cells.
+    """
+    if self.jobs == 1 or len(cells) <= 1:
+      for index, cell in enumerate(cells):
+        yield self.evaluate_cell(function, cell, index)
+      return
+
+    logger  = self.data.get('logger')
+    cores   = sorted(os.sched_getaffinity(0)) if self.pin else []
+    context = get_context('fork')
+    counter = context.Value('i', 0)
+
+    if logger is not None:
+      logger.flush()
+
+    _parallel.update({'experiment': self, 'function': function, 'cells': cells})
+    try:
+      with ProcessPoolExecutor(self.jobs, context, _initialize_worker, (counter, cores)) as executor:
+        for result, logged, measured in executor.map(_evaluate_worker, range(len(cells))):
+          if logger is not None:
+            logger.write(logged)
+          for key, y, elapsed in measured:
+            self._apply(key, y, elapsed)
+          yield result
+    finally:
+      _parallel.clear()
+
   ### Methods: Outputs
 
   def output_csv(self, output: FileIO, measure: Measure = None, orientation = True):
@@ -298,6 +934,51 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     for r in rows:
       writer.writerow({self.xname: r, **xy(r, measure)})
 
+  def output_json(self, output: FileIO, measure: str = None):
+    """
+    Outputs this experiment's parameters, results and the summary statistics
+    of each x-value and series to the given output file as JSON. Controlled
+    variables that are not JSON serializable are omitted.
+
+    Args:
+      output:   The JSON output file.
+      measure:  The specific Y component.
+    """
+    def serializable(value: Any) -> bool:
+      try:
+        dumps(value)
+        return True
+      except (TypeError, ValueError):
+        return False
+
+    points = []
+    for x in self.x:
+      for s in self.series:
+        key = Xseries(x, s)
+        points.append({
+          'x': x,
+          'series': s,
+          'stats': self.getstats(key, measure),
+          'y': self.y.get(key, []),
+          'timings': self.timings.get(key, [])
+        })
+
+    dump({
+      'name': self.name,
+      'xname': self.xname,
+      'ynames': self.ynames,
+      'measure': measure,
+      'series': list(self.series),
+      'x': list(self.x),
+      'rounds': self.rounds,
+      'warmup': self.warmup,
+      'mintime': self.mintime,
+      'confidence': self.confidence,
+      'seed': self.seed,
+      'data': dict((k, v) for k, v in self.data.items() if serializable(v)),
+      'points': points
+    }, output, indent=2)
+
   def output_lineplot(self, output: FileIO, measure: Measure = None, 
                             title: str = None, xscale: str = 'linear',
                             yscale: str = 'linear', **kwargs):
@@ -315,6 +996,8 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
       yscale:   The y-axis scale type to apply.
       kwargs:   Additonal arguments.
     """
+    from matplotlib import pyplot as plt
+
     dfs = {
       'subplots': {'subplot_kw': {'aspect': 'auto'}},
       'suptitle': {'fontsize': 16},
@@ -328,9 +1011,11 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     kwd  = lambda k: kw(k, dfs.get(k, {}))
 
     if isinstance(self.ynames, List):
-      assert measure in self.ynames
-    if isinstance(self.ynames, str):
+      assert (measure[0] if isinstance(measure, Tuple) else measure) in self.ynames
+    if isinstance(self.ynames, str) and not isinstance(measure, Tuple):
       measure = self.ynames
+
+    ylabel = f'{measure[0]} ({measure[1]})' if isinstance(measure, Tuple) else measure
     if not isinstance(title, str) or len(title) == 0:
       title = self.name
 
@@ -342,7 +1027,7 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
 
     ax.set_xlabel(self.xname, **kwd('xlabel'))
     ax.set_xscale(xscale,     **kwd('xscale'))
-    ax.set_ylabel(measure,    **kwd('ylabel'))
+    ax.set_ylabel(ylabel,     **kwd('ylabel'))
     ax.set_yscale(yscale,     **kwd('yscale'))
     ax.legend(**kwd('legend'))
 
@@ -366,6 +1051,8 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
       width:    The width of each bar in the chart.
       kwargs:   Additonal arguments.
     """
+    from matplotlib import pyplot as plt
+
     dfs = {
       'subplots': {'subplot_kw': {'aspect': 'auto'}},
       'suptitle': {'fontsize': 16},
@@ -380,9 +1067,11 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     kwd  = lambda k: kw(k, dfs.get(k, {}))
 
     if isinstance(self.ynames, List):
-      assert measure in self.ynames
-    if isinstance(self.ynames, str):
+      assert (measure[0] if isinstance(measure, Tuple) else measure) in self.ynames
+    if isinstance(self.ynames, str) and not isinstance(measure, Tuple):
       measure = self.ynames
+
+    ylabel = f'{measure[0]} ({measure[1]})' if isinstance(measure, Tuple) else measure
     if not isinstance(title, str) or len(title) == 0:
       title = self.name
 
@@ -397,7 +1086,7 @@ class Experiment(Generic[X, Y]): # pylint: disable=E1136
     ax.set_xlabel(self.xname,  **kwd('xlabel'))
     ax.set_xticks(idx,         **kwd('xticks'))
     ax.set_xticklabels(self.x, **kwd('xticklabels'))
-    ax.set_ylabel(measure,     **kwd('ylabel'))
+    ax.set_ylabel(ylabel,      **kwd('ylabel'))
     ax.set_yscale(yscale,      **kwd('yscale'))
     ax.legend(**kwd('legend'))
 
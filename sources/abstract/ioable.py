@@ -6,20 +6,31 @@ Base Definition for IOable class
 Defines an abstract class for serialization and deserialization of certain
 objects to/from various serialized data formats: JSON and Python Literal
 (parseable by ast.literal_eval). Provides base implements for to_output,
-from_text and from_source methods. Requires the concrete classes to implement
-the to_object and from_object method.
+from_text, from_source and from_stream methods. Requires the concrete classes
+to implement the to_object and from_object method. Serializes through the
+IOableEncoder, a JSON encoder that lets the concrete classes write their JSON
+text directly via to_chunks, instead of generating intermediate objects.
 
 Abstract Classes:
 - IOable
+
+Classes:
+- IOableEncoder
 """
 
 from abc import ABCMeta, abstractmethod
 from ast import literal_eval as PythonParse
+from dataclasses import fields, is_dataclass
 from io import TextIOBase
 from json import JSONEncoder
 from json import load as JSONLoader
 from json import loads as JSONParse
-from typing import Any, Callable, Dict
+from json.encoder import encode_basestring, encode_basestring_ascii
+from operator import itemgetter
+from types import GeneratorType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from sources.helpers import compressed
 
 
 class IOable(metaclass=ABCMeta):
@@ -29,7 +40,7 @@ class IOable(metaclass=ABCMeta):
   Serialization and deserialization of objects that implement this class
   (subclasses) to/from various serialized data formats: JSON and Python
   Literal (parseable by ast.literal_eval). Provides base implements for
-  to_output, from_text and from_source methods. Requires the concrete
+  to_output, from_text, from_source and from_stream methods. Requires the concrete
   classes to implement the to_object and from_object method.
   """
 
@@ -38,26 +49,34 @@ class IOable(metaclass=ABCMeta):
   @classmethod
   def to_output(cls, object: 'IOable',
                      output: TextIOBase, format: str = 'json',
-                     options: Dict = {}, **kwargs):
+                     options: Dict = {}, compression: str = None, **kwargs):
     """
     Outputs the given object to the given output stream in
-    the specified output data representation format.
+    the specified output data representation format. If compression
+    is specified, compresses the output incrementally as it is written.
 
     Args:
-      object:   The object to serialize.
-      output:   The output stream to serialize object to.
-      format:   The output serialization format: 'json'.
-      options:  The options to be passed to to_object
-                via json_encoder_default, used to customize
-                and tweak the object generation process.
-      kwargs:   Additional arguments to be passed to the
-                specific output format encoder.
+      object:       The object to serialize.
+      output:       The output stream to serialize object to.
+      format:       The output serialization format: 'json'.
+      options:      The options to be passed to to_object
+                    via json_encoder_default, used to customize
+                    and tweak the object generation process.
+      compression:  The compression format: 'gzip', 'bz2',
+                    'lzma', 'infer' from the output file
+                    name or None.
+      kwargs:       Additional arguments to be passed to the
+                    specific output format encoder.
 
     Raises:
       ValueError: If output format is unsupported.
     """
     assert output.writable()
 
+    if compression is not None:
+      with compressed(output, 'w', compression) as output:
+        return cls.to_output(object, output, format, options, **kwargs)
+
     default = JSONEncoder.default
 
     def json_encoder(value):
@@ -71,7 +90,7 @@ class IOable(metaclass=ABCMeta):
     if format == 'json':
       if 'indent' not in kwargs:
         kwargs['indent'] = 2
-      encoder = JSONEncoder(default=json_encoder, **kwargs)
+      encoder = IOableEncoder(options, default=json_encoder, **kwargs)
       for chunk in encoder.iterencode(object):
         output.write(chunk)
     else:
@@ -79,6 +98,28 @@ class IOable(metaclass=ABCMeta):
 
   ### Class Methods: Serialization
 
+  @classmethod
+  def to_chunks(cls, object: 'IOable', encoder: 'IOableEncoder',
+                     level: int, **kwargs) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given IOable object, as nested at
+    the given indentation level, using the given encoder. Defaults to encoding
+    the object generated by to_object. Concrete classes may override this to
+    write their JSON text directly, but must produce the same JSON text.
+
+    Args:
+      object:   The IOable object to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      kwargs:   Additional arguments to be passed to
+                to_object, used to customize and tweak
+                the object generation process.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    yield from encoder.chunks(cls.to_object(object, **kwargs), level)
+
   @classmethod
   @abstractmethod
   def to_object(cls, object: 'IOable', format: str = 'json', **kwargs) -> Any:
@@ -156,24 +197,29 @@ class IOable(metaclass=ABCMeta):
       raise ValueError(f'Unsupported "{format}" input format')
 
   @classmethod
-  def from_source(cls, source: TextIOBase,
-                       format: str = 'json', **kwargs) -> 'IOable':
+  def from_source(cls, source: TextIOBase, format: str = 'json',
+                       compression: str = None, **kwargs) -> 'IOable':
     """
     Construct a new IOable object from the conversion of the text from the
     given text input source. The given input source text can be either JSON or
     Python literal (parseable by ast.literal_eval). The parsed text is that
     passed to from_object to be converted into a IOable object; thus, must
-    have the necessary data structure and fields to be converted.
+    have the necessary data structure and fields to be converted. If
+    compression is specified, decompresses the input incrementally as it
+    is read.
 
     Args:
-      source:   The input source whose content is
-                to be converted into an IOable object.
-      format:   The serialization format: 'json' or
-                'literal' (for ast.literal_eval).
-      kwargs:   Additional arguments to be passed to
-                from_object for customizing and
-                tweaking the IOable object generation
-                process.
+      source:       The input source whose content is
+                    to be converted into an IOable object.
+      format:       The serialization format: 'json' or
+                    'literal' (for ast.literal_eval).
+      compression:  The compression format: 'gzip', 'bz2',
+                    'lzma', 'infer' from the input file
+                    name or None.
+      kwargs:       Additional arguments to be passed to
+                    from_object for customizing and
+                    tweaking the IOable object generation
+                    process.
 
     Returns:
       The newly constructed IOable object.
@@ -182,9 +228,413 @@ class IOable(metaclass=ABCMeta):
       ValueError: If input format is unsupported.
     """
     assert source.readable()
+
+    if compression is not None:
+      with compressed(source, 'r', compression) as source:
+        return cls.from_source(source, format, **kwargs)
+
     if format == 'json':
       return cls.from_object(JSONLoader(source), **kwargs)
     elif format == 'literal':
       return cls.from_object(PythonParse(source.read()), **kwargs)
     else:
       raise ValueError(f'Unsupported "{format}" input format')
+
+  @classmethod
+  def from_stream(cls, source: TextIOBase, compression: str = None, **kwargs) -> 'IOable':
+    """
+    Construct a new IOable object from the JSON text from the given text
+    input source, parsing it incrementally where supported by the concrete
+    class, so that the entire text and its full object tree are not held
+    in memory at once. Defaults to from_source.
+
+    Args:
+      source:       The input source whose JSON content is
+                    to be converted into an IOable object.
+      compression:  The compression format: 'gzip', 'bz2',
+                    'lzma', 'infer' from the input file
+                    name or None.
+      kwargs:       Additional arguments for customizing
+                    and tweaking the IOable object
+                    generation process.
+
+    Returns:
+      The newly constructed IOable object.
+    """
+    return cls.from_source(source, 'json', compression, **kwargs)
+
+
+class IOableEncoder(JSONEncoder):
+  """
+  JSON encoder that delegates the encoding of IOable objects to their
+  to_chunks class method, so that they can write their JSON text directly.
+  Produces the same JSON text as JSONEncoder.iterencode with the same
+  arguments, including sort_keys and check_circular. Generators are encoded
+  as JSON arrays, so that large arrays can be encoded without being
+  materialized.
+
+  Extends:
+    JSONEncoder
+
+  Attributes:
+    options:    The options to be passed to to_chunks,
+                used to customize and tweak the JSON
+                text generation process.
+    indentstr:  The string to indent with for each
+                indentation level, or None for no
+                newlines and indentation.
+    encodestr:  The function to encode strings with.
+    markers:    The IDs of the containers being encoded,
+                or None if check_circular is disabled.
+  """
+  options: Dict
+  indentstr: str
+  encodestr: Callable[[str], str]
+  markers: Dict[int, Any]
+
+  def __init__(self, options: Dict = {}, **kwargs):
+    """
+    Initialize a new JSON encoder for IOable objects.
+
+    Args:
+      options:  The options to be passed to to_chunks,
+                used to customize and tweak the JSON
+                text generation process.
+      kwargs:   Additional arguments to be passed
+                to JSONEncoder.
+    """
+    JSONEncoder.__init__(self, **kwargs)
+
+    indent = self.indent
+
+    self.options   = options
+    self.indentstr = ' ' * indent if isinstance(indent, int) else indent
+    self.encodestr = encode_basestring_ascii if self.ensure_ascii else encode_basestring
+    self.markers   = {} if self.check_circular else None
+
+  ### Methods: Helpers
+
+  def newline(self, level: int) -> str:
+    """
+    The newline and indentation for the given indentation level.
+
+    Args:
+      level:  The indentation level.
+
+    Returns:
+      The newline and indentation.
+    """
+    return '' if self.indentstr is None else '\n' + self.indentstr * level
+
+  def floatstr(self, value: float) -> str:
+    """
+    Encodes the given float value, as JSONEncoder does.
+
+    Args:
+      value:  The float value to be encoded.
+
+    Returns:
+      The JSON text for the value.
+
+    Raises:
+      ValueError: If value is out of range and
+                  allow_nan is disabled.
+    """
+    if value != value:
+      text = 'NaN'
+    elif value == float('inf'):
+      text = 'Infinity'
+    elif value == -float('inf'):
+      text = '-Infinity'
+    else:
+      return float.__repr__(value)
+
+    if not self.allow_nan:
+      raise ValueError(f'Out of range float values are not JSON compliant: {value}')
+
+    return text
+
+  def scalar(self, value: Any) -> str:
+    """
+    Encodes the given value if it is a JSON scalar value:
+    str, None, bool, int or float. Returns None otherwise.
+
+    Args:
+      value:  The value to be encoded.
+
+    Returns:
+      The JSON text for the value.
+      None, if value is not a scalar value.
+    """
+    if isinstance(value, str):
+      return self.encodestr(value)
+    elif value is None:
+      return 'null'
+    elif value is True:
+      return 'true'
+    elif value is False:
+      return 'false'
+    elif isinstance(value, int):
+      return int.__repr__(value)
+    elif isinstance(value, float):
+      return self.floatstr(value)
+    else:
+      return None
+
+  def key(self, key: Any) -> str:
+    """
+    Converts the given dict key to a str, as JSONEncoder does.
+    Returns None if the key is to be skipped.
+
+    Args:
+      key:  The dict key to be converted.
+
+    Returns:
+      The converted dict key.
+      None, if the key is to be skipped.
+
+    Raises:
+      TypeError: If the key is unsupported and
+                 skipkeys is disabled.
+    """
+    if isinstance(key, str):
+      return key
+    elif isinstance(key, float):
+      return self.floatstr(key)
+    elif isinstance(key, (bool, type(None), int)):
+      return self.scalar(key)
+    elif self.skipkeys:
+      return None
+    else:
+      raise TypeError(f'keys must be str, int, float, bool or None, '
+                      f'not {key.__class__.__name__}')
+
+  def mark(self, value: Any) -> int:
+    """
+    Marks the given container value as being encoded, to detect circular
+    references, as JSONEncoder does with check_circular. Must be unmarked
+    once encoded.
+
+    Args:
+      value:  The container value being encoded.
+
+    Returns:
+      The marker for the value.
+      None, if check_circular is disabled.
+
+    Raises:
+      ValueError: If the value is already being encoded.
+    """
+    if self.markers is None:
+      return None
+
+    marker = id(value)
+    if marker in self.markers:
+      raise ValueError('Circular reference detected')
+
+    self.markers[marker] = value
+    return marker
+
+  def unmark(self, marker: int):
+    """
+    Unmarks the container value of the given marker, once encoded.
+
+    Args:
+      marker: The marker for the value, as returned by mark.
+    """
+    if marker is not None:
+      del self.markers[marker]
+
+  ### Methods: Encoding
+
+  def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+    """
+    Encode the given object and yield each JSON text chunk as available.
+
+    Overrides:
+      JSONEncoder.iterencode
+
+    Args:
+      o:  The object to be encoded.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    self.markers = {} if self.check_circular else None
+    return self.chunks(o, 0)
+
+  def chunks(self, value: Any, level: int) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given value,
+    as nested at the given indentation level.
+
+    Args:
+      value:  The value to be encoded.
+      level:  The current indentation level.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    text = self.scalar(value)
+
+    if text is not None:
+      yield text
+      return
+
+    marker = self.mark(value)
+
+    if isinstance(value, (list, tuple, GeneratorType)):
+      yield from self.list_chunks(value, level)
+    elif isinstance(value, dict):
+      yield from self.dict_chunks(value.items(), level)
+    elif isinstance(value, IOable):
+      yield from value.__class__.to_chunks(value, self, level, **self.options)
+    else:
+      yield from self.chunks(self.default(value), level)
+
+    self.unmark(marker)
+
+  def list_chunks(self, values: Iterable, level: int,
+                        encode: Callable[[Any, int], Iterator[str]] = None) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for a JSON array of the given values,
+    as nested at the given indentation level.
+
+    Args:
+      values: The values of the JSON array.
+      level:  The current indentation level.
+      encode: The function to encode non-scalar values
+              with. Defaults to chunks.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    encode    = encode or self.chunks
+    newline   = self.newline(level + 1)
+    separator = self.item_separator + newline
+    first     = True
+
+    for value in values:
+      yield '[' + newline if first else separator
+      first = False
+      text  = self.scalar(value)
+      if text is not None:
+        yield text
+      else:
+        yield from encode(value, level + 1)
+
+    yield '[]' if first else self.newline(level) + ']'
+
+  def dict_chunks(self, items: Iterable[Tuple[Any, Any]], level: int,
+                        encode: Callable[[Any, int], Iterator[str]] = None) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for a JSON object of the given key-value
+    pairs, as nested at the given indentation level, sorted by key if
+    sort_keys is enabled.
+
+    Args:
+      items:  The key-value pairs of the JSON object.
+      level:  The current indentation level.
+      encode: The function to encode non-scalar values
+              with. Defaults to chunks.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    encode    = encode or self.chunks
+    newline   = self.newline(level + 1)
+    separator = self.item_separator + newline
+    first     = True
+
+    if self.sort_keys:
+      items = sorted(items, key=itemgetter(0))
+
+    for key, value in items:
+      key = self.key(key)
+      if key is None:
+        continue
+      yield '{' + newline if first else separator
+      first = False
+      yield self.encodestr(key) + self.key_separator
+      text  = self.scalar(value)
+      if text is not None:
+        yield text
+      else:
+        yield from encode(value, level + 1)
+
+    yield '{}' if first else self.newline(level) + '}'
+
+  def list_text(self, texts: List[str], level: int) -> str:
+    """
+    Generates the JSON text for a JSON array of the given
+    already encoded values, as nested at the given indentation level.
+
+    Args:
+      texts:  The JSON texts of the values of the JSON array.
+      level:  The current indentation level.
+
+    Returns:
+      The JSON text of the JSON array.
+    """
+    if len(texts) == 0:
+      return '[]'
+
+    newline = self.newline(level + 1)
+    return '[' + newline + (self.item_separator + newline).join(texts) + \
+           self.newline(level) + ']'
+
+  def dict_text(self, items: List[Tuple[str, str]], level: int) -> str:
+    """
+    Generates the JSON text for a JSON object of the given str keys and
+    already encoded values, as nested at the given indentation level,
+    sorted by key if sort_keys is enabled.
+
+    Args:
+      items:  The str keys and the JSON texts of the
+              values of the JSON object.
+      level:  The current indentation level.
+
+    Returns:
+      The JSON text of the JSON object.
+    """
+    if len(items) == 0:
+      return '{}'
+
+    if self.sort_keys:
+      items = sorted(items, key=itemgetter(0))
+
+    newline = self.newline(level + 1)
+    members = [self.encodestr(k) + self.key_separator + v for k, v in items]
+    return '{' + newline + (self.item_separator + newline).join(members) + \
+           self.newline(level) + '}'
+
+  def asdict_chunks(self, value: Any, level: int) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given value, as converted by
+    dataclasses.asdict, as nested at the given indentation level. Dataclass
+    instances are encoded as JSON objects of their fields, recursively,
+    instead of through to_chunks.
+
+    Args:
+      value:  The value to be encoded.
+      level:  The current indentation level.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    if not (isinstance(value, (list, tuple, dict)) or \
+            (is_dataclass(value) and not isinstance(value, type))):
+      yield from self.chunks(value, level)
+      return
+
+    marker = self.mark(value)
+
+    if is_dataclass(value):
+      items = ((f.name, getattr(value, f.name)) for f in fields(value))
+      yield from self.dict_chunks(items, level, self.asdict_chunks)
+    elif isinstance(value, (list, tuple)):
+      yield from self.list_chunks(value, level, self.asdict_chunks)
+    else:
+      yield from self.dict_chunks(value.items(), level, self.asdict_chunks)
+
+    self.unmark(marker)
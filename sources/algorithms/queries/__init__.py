@@ -3,4 +3,5 @@
 from .enumerate import *
 from .mrqenum import *
 from .srqenum import *
+from .rqcache import *
 from .rqenum import *
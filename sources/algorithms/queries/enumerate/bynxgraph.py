@@ -21,7 +21,7 @@ Classes:
 - EnumerateByNxGraph
 """
 
-from typing import Any, Callable, Iterator, Union
+from typing import Any, Callable, Iterator, List, Union
 
 from networkx import networkx as nx
 
@@ -84,7 +84,7 @@ class EnumerateByNxGraph:
     """
     graph = self.G
 
-    for clique in nx.enumerate_all_cliques(graph.G):
+    for clique in self.cliques():
       if len(clique) > 1:
         intersect = [graph.region(r) for r in clique]
         region    = Region.from_intersect(intersect, linked=True)
@@ -92,6 +92,17 @@ class EnumerateByNxGraph:
         assert isinstance(region, Region)
         yield (region, intersect)
 
+  def cliques(self) -> Iterator[List[str]]:
+    """
+    The Iterator of all cliques within the Region intersection graph,
+    as lists of Region IDs, in order of the number of Regions involved.
+
+    Returns:
+      The Iterator of all cliques as lists
+      of Region IDs.
+    """
+    return nx.enumerate_all_cliques(self.G.G)
+
   ### Class Methods: Evaluation
 
   @classmethod
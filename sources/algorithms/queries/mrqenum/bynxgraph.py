@@ -8,9 +8,10 @@ Implements the enumeration of intersecting Regions from a subsetted set of
 Regions via a Region intersection graph.
 
 Implements the MRQEnumByNxGraph class that takes a Region intersection
-graph, based on NetworkX and a subset of Regions. Subgraphs the given Region
-intersection graph with the given Region subset and enumerates all intersecting
-Regions (all cliques) with the generated subgraph.
+graph, based on NetworkX and a subset of Regions. Enumerates all intersecting
+Regions (all cliques) within the given Region intersection graph that only
+involve Regions from the given Region subset. The subset is applied as a mask
+over the adjacency of the given graph; no subgraph is constructed.
 
 The construction of the Region intersection graph is performed via the one-pass
 sweep-line algorithm, through a subscription to RegionSweep. The enumeration
@@ -21,9 +22,9 @@ Classes:
 - MRQEnumByNxGraph
 """
 
-from typing import Any, Callable, Iterable, Iterator, List, Union
-
-from networkx import networkx as nx
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, List, Union
 
 from sources.abstract import Subscriber
 from sources.core import NxGraph, Region, RegionGrp, RegionId, RegionSet
@@ -37,9 +38,10 @@ class MRQEnumByNxGraph(EnumerateByNxGraph):
   Region Intersection Graph
 
   Computes an Iterator of subsetted intersecting Regions by enumerating
-  all cliques belonging to a subgraph of the given Region intersection graph.
-  Subgraph the given Region intersection graph and enumerates all intersecting
-  Regions (all cliques) with the generated subgraph.
+  all cliques belonging to the subgraph induced by the given subset of Regions
+  within the given Region intersection graph. The induced subgraph is never
+  constructed; the subset masks the neighbors of each Region within the
+  adjacency of the given Region intersection graph.
 
   Extends:
     EnumerateByNxGraph
@@ -48,8 +50,12 @@ class MRQEnumByNxGraph(EnumerateByNxGraph):
     subset:
       The list of Region unique identifiers to include
       within the enumeration of intersecting Regions.
+    mask:
+      The set of Region unique identifiers to include
+      within the enumeration of intersecting Regions.
   """
   subset: List[str]
+  mask: FrozenSet[str]
 
   def __init__(self, graph: NxGraph, subset: List[RegionId]):
     """
@@ -69,13 +75,46 @@ class MRQEnumByNxGraph(EnumerateByNxGraph):
     assert all([isinstance(r, (Region, str)) for r in subset])
 
     region_id = lambda r: r.id if isinstance(r, Region) else r
-    G, subset = graph.G, [region_id(r) for r in subset]
+    G, subset = graph.G, list(dict.fromkeys([region_id(r) for r in subset]))
 
     assert all([isinstance(r, str) and r in G.nodes for r in subset])
 
-    G = nx.subgraph(G, subset)
-    EnumerateByNxGraph.__init__(self, NxGraph(graph.dimension, G))
+    EnumerateByNxGraph.__init__(self, graph)
     self.subset = subset
+    self.mask = frozenset(subset)
+
+  ### Methods: Computations
+
+  def cliques(self) -> Iterator[List[str]]:
+    """
+    The Iterator of all cliques within the subgraph induced by the subset
+    of Regions, as lists of Region IDs, in order of the number of Regions
+    involved. Neighbors are read from the adjacency of the given Region
+    intersection graph and filtered by the subset mask once per Region.
+
+    Overrides:
+      EnumerateByNxGraph.cliques
+
+    Returns:
+      The Iterator of all cliques as lists
+      of Region IDs.
+    """
+    adj, mask = self.G.G.adj, self.mask
+    index, nbrs = {}, {}
+
+    for u in self.subset:
+      index[u] = len(index)
+      nbrs[u] = {v for v in adj[u] if v in mask and v not in index}
+
+    queue = deque(([u], sorted(nbrs[u], key=index.__getitem__)) \
+                  for u in self.subset)
+
+    while queue:
+      base, cnbrs = map(list, queue.popleft())
+      yield base
+      for i, u in enumerate(cnbrs):
+        queue.append((chain(base, [u]), \
+                      filter(nbrs[u].__contains__, islice(cnbrs, i + 1, None))))
 
   ### Class Methods: Evaluation
 
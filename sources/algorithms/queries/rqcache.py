@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+
+"""
+Region Query Results Cache
+
+Implements a least-recently-used (LRU) cache of the results of Region queries
+evaluated over Region intersection graphs. Cached results are keyed on the
+graph's unique identifier, a token unique to the graph object (so that
+distinct graph objects with the same identifier, such as reloaded graphs, do
+not share results) and modification counter (version), the query type and
+algorithm, the normalized queried Region IDs and any additional query
+arguments. Mutating the graph increments its version, which invalidates all
+of the cached results for the graph. The cache is bounded by an approximate
+memory budget, and evicts the least-recently-used results once exceeded.
+
+Types:
+- RQCacheKey
+
+Classes:
+- RQCache
+"""
+
+from collections import OrderedDict
+from itertools import count
+from sys import getsizeof
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from sources.core import NxGraph, Region
+
+from .enumerate.common import RegionIntersect
+
+
+RQCacheKey = Tuple[Hashable, ...]
+
+
+class RQCache:
+  """
+  Least-recently-used (LRU) cache of the results of Region queries
+  evaluated over Region intersection graphs.
+
+  Only queries over NxGraph contexts are cached; queries over RegionSets
+  construct a new Region intersection graph on each evaluation and are
+  always evaluated. Cached results are shared between evaluations;
+  the Regions within them must not be mutated.
+
+  Attributes:
+    maxsize:    The memory budget for the cached results,
+                as the approximate number of bytes.
+    size:       The approximate number of bytes used by
+                the cached results.
+    entries:    The cached results along with their
+                approximate number of bytes, in order
+                from least to most recently used.
+    versions:   The mapping of graph IDs and tokens to the
+                latest graph version seen by this cache.
+    hits:       The number of evaluations answered from
+                the cached results.
+    misses:     The number of evaluations computed and
+                added to the cached results.
+    evictions:  The number of cached results evicted to
+                stay within the memory budget.
+
+  Class Attributes:
+    Tokens:     The token unique to each graph object seen
+                by the caches, weakly keyed by the graph
+                object, so that a new graph object never
+                reuses the token of a collected one.
+    NextToken:  The counter of the graph object tokens.
+  """
+  maxsize: int
+  size: int
+  entries: Dict[RQCacheKey, Tuple[List[RegionIntersect], int]]
+  versions: Dict[Tuple[str, int], int]
+  hits: int
+  misses: int
+  evictions: int
+
+  Tokens    = WeakKeyDictionary()
+  NextToken = count()
+
+  def __init__(self, maxsize: int = 64 * 2**20):
+    """
+    Initialize an empty cache of Region query results
+    with the given memory budget.
+
+    Args:
+      maxsize:  The memory budget for the cached results,
+                as the approximate number of bytes.
+    """
+    assert isinstance(maxsize, int) and maxsize > 0
+
+    self.maxsize = maxsize
+    self.clear()
+
+  ### Properties: Getters
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    """
+    The cache statistics: the number of hits, misses and evictions,
+    the number of cached results and the approximate number of bytes
+    used by the cached results.
+
+    Returns:
+      The cache statistics.
+    """
+    return {
+      'hits': self.hits,
+      'misses': self.misses,
+      'evictions': self.evictions,
+      'length': len(self.entries),
+      'size': self.size,
+      'maxsize': self.maxsize
+    }
+
+  ### Methods: Helpers
+
+  @staticmethod
+  def sizeof(results: List[RegionIntersect]) -> int:
+    """
+    Estimate the number of bytes used by the given query results.
+
+    Args:
+      results:  The query results.
+
+    Returns:
+      The approximate number of bytes.
+    """
+    size = getsizeof(results)
+
+    for region, intersect in results:
+      size += getsizeof(region) + getsizeof(region.data)
+      size += getsizeof(region.dimensions) + getsizeof(intersect)
+      size += region.dimension * getsizeof(region.dimensions[0])
+
+    return size
+
+  @classmethod
+  def token(cls, ctx: NxGraph) -> int:
+    """
+    Retrieve the token unique to the given graph object,
+    generating a new token the first time it is seen.
+
+    Args:
+      ctx:  The graph object.
+
+    Returns:
+      The token unique to the graph object.
+    """
+    token = cls.Tokens.get(ctx)
+    if token is None:
+      token = cls.Tokens.setdefault(ctx, next(cls.NextToken))
+
+    return token
+
+  @classmethod
+  def key(cls, clz: Type, alg: str, ctx: Any, *args, **kwargs) -> RQCacheKey:
+    """
+    Generate the cache key for the query with the given query type,
+    algorithm, context object and additional arguments. Returns None
+    if the query cannot be cached.
+
+    Args:
+      clz:          The query type.
+      alg:          The name of the algorithm.
+      ctx:          The context object.
+      args, kwargs: Additional query arguments, the first
+                    of which may be the queried Region(s).
+
+    Returns:
+      The cache key for the query.
+      None, if the query cannot be cached.
+    """
+    if not isinstance(ctx, NxGraph):
+      return None
+
+    regionid = lambda r: r.id if isinstance(r, Region) else r
+
+    if len(args) > 0 and isinstance(args[0], (Region, str)):
+      args = (regionid(args[0]), *args[1:])
+    elif len(args) > 0 and isinstance(args[0], List):
+      args = (tuple(sorted(set(map(regionid, args[0])))), *args[1:])
+
+    key = (ctx.id, cls.token(ctx), ctx.version, clz.__name__, alg, args,
+           tuple(sorted(kwargs.items())))
+
+    try:
+      hash(key)
+    except TypeError:
+      return None
+
+    return key
+
+  ### Methods: Queries
+
+  def __len__(self) -> int:
+    """
+    Determine the number of cached query results.
+
+    Returns:
+      The number of cached query results.
+    """
+    return len(self.entries)
+
+  def get(self, key: RQCacheKey) -> List[RegionIntersect]:
+    """
+    Retrieve the cached results for the given cache key and mark them as
+    most recently used. Returns None if the results are not cached.
+
+    Args:
+      key:  The cache key for the query.
+
+    Returns:
+      The cached query results.
+      None, if the results are not cached.
+    """
+    if key not in self.entries:
+      return None
+
+    self.entries.move_to_end(key)
+    return self.entries[key][0]
+
+  ### Methods: Insertion + Removal
+
+  def put(self, key: RQCacheKey, results: List[RegionIntersect]):
+    """
+    Add the given query results for the given cache key as the most recently
+    used results. Evicts the least-recently-used results until the cached
+    results fit within the memory budget. Results larger than the memory
+    budget are not cached.
+
+    Args:
+      key:      The cache key for the query.
+      results:  The query results.
+    """
+    size = self.sizeof(results)
+
+    if key in self.entries:
+      self.size -= self.entries.pop(key)[1]
+    if size > self.maxsize:
+      return
+
+    while self.size + size > self.maxsize:
+      _, (_, evicted) = self.entries.popitem(last=False)
+      self.size -= evicted
+      self.evictions += 1
+
+    self.entries[key] = (results, size)
+    self.size += size
+
+  def invalidate(self, graphid: str, version: int = None, token: int = None):
+    """
+    Remove the cached results for the graph with the given ID, for all graph
+    versions, or for all graph versions other than the given graph version,
+    of all graph objects with that ID, or of the graph object with the
+    given token.
+
+    Args:
+      graphid:  The unique identifier of the graph.
+      version:  The graph version whose cached results
+                are kept, or None to remove all results.
+      token:    The token of the graph object, or None
+                for all graph objects.
+    """
+    for key in [k for k in self.entries.keys() if k[0] == graphid]:
+      if (token is None or key[1] == token) and (version is None or key[2] != version):
+        self.size -= self.entries.pop(key)[1]
+
+  def clear(self):
+    """
+    Remove all of the cached results and reset the cache statistics.
+    """
+    self.entries   = OrderedDict()
+    self.versions  = {}
+    self.size      = 0
+    self.hits      = 0
+    self.misses    = 0
+    self.evictions = 0
+
+  ### Methods: Evaluation
+
+  def wrap(self, clz: Type, alg: str, evaluate: Callable[..., Iterator[RegionIntersect]],
+                 ctx: Any, *args, **kwargs) -> Callable[..., Iterator[RegionIntersect]]:
+    """
+    Wraps the given query evaluator function to answer from the cached
+    results when possible, or to evaluate the query and cache the results.
+    Returns the given evaluator function unchanged if the query cannot be
+    cached.
+
+    Args:
+      clz:          The query type.
+      alg:          The name of the algorithm.
+      evaluate:     The query evaluator function.
+      ctx:          The context object.
+      args, kwargs: Additional query arguments.
+
+    Returns:
+      The wrapped query evaluator function.
+    """
+    if self.key(clz, alg, ctx, *args, **kwargs) is None:
+      return evaluate
+
+    def evaluate_cached(*eargs, **ekwargs) -> Iterator[RegionIntersect]:
+      key   = self.key(clz, alg, ctx, *args, **kwargs)
+      graph = (ctx.id, self.token(ctx))
+
+      if self.versions.get(graph, ctx.version) != ctx.version:
+        self.invalidate(ctx.id, ctx.version, graph[1])
+      self.versions[graph] = ctx.version
+
+      results = self.get(key)
+      if results is None:
+        self.misses += 1
+        results = list(evaluate(*eargs, **ekwargs))
+        self.put(key, results)
+      else:
+        self.hits += 1
+
+      return iter(results)
+
+    return evaluate_cached
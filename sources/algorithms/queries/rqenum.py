@@ -15,6 +15,8 @@ from typing import Any, Type, Union
 
 from sources.core import RegionSet
 
+from .rqcache import RQCache
+
 
 class RQEnum(metaclass=ABCMeta):
   """
@@ -23,12 +25,24 @@ class RQEnum(metaclass=ABCMeta):
   Binds together multiple implementations and algorithms into
   common single, abstracted interface.
 
+  Example:
+  >>> RQEnum.cache = RQCache(maxsize=256 * 2**20) # cache query results
+  >>> results = SRQEnum.results('slig', nxgraph, query)
+  >>> results = SRQEnum.results('slig', nxgraph, query) # cache hit
+  >>> RQEnum.cache.stats
+  >>> RQEnum.cache = None # disable caching
+
   Class Attributes:
     algorithms:
       The mapping of algorithm names to
       algorithm implementation classes.
+    cache:
+      The cache of query results for queries over
+      Region intersection graphs, shared by all of
+      the query types. None to disable caching.
   """
   algorithms = {}
+  cache: RQCache = None
 
   @classmethod
   def get(cls, alg: str, *args, **kwargs):
@@ -37,7 +51,9 @@ class RQEnum(metaclass=ABCMeta):
     Returns the algorithm's implementation class.
     If additional arguments are given, passes the arguments to the prepare
     class method of the algorithm's implementation class, and returns the
-    evaluator function for evaluating the query instead.
+    evaluator function for evaluating the query instead. If the query results
+    cache is enabled, the evaluator function answers from the cache when
+    possible.
 
     Args:
       alg:
@@ -56,8 +72,15 @@ class RQEnum(metaclass=ABCMeta):
     algorithm = cls.algorithms[alg]
     assert callable(getattr(algorithm, 'prepare'))
 
-    return algorithm if len(args) + len(kwargs) == 0 \
-                     else algorithm.prepare(*args, **kwargs)
+    if len(args) + len(kwargs) == 0:
+      return algorithm
+
+    evaluate = algorithm.prepare(*args, **kwargs)
+
+    if cls.cache is None:
+      return evaluate
+
+    return cls.cache.wrap(cls, alg, evaluate, *args, **kwargs)
 
   @classmethod
   def results(cls, alg: str, ctx: Any, *args, **kwargs) -> RegionSet:
@@ -8,11 +8,10 @@ Implements the enumeration of intersecting Regions to intersect with a
 specified Region, via a Region intersection graph.
 
 Implements the SRQEnumByNxGraph class that takes a Region intersection
-graph, based on NetworkX and a specific Region within the graph. Subgraphs the
+graph, based on NetworkX and a specific Region within the graph. Masks the
 given Region intersection graph with the specified Region and its neighbors,
-then enumerates all intersecting Regions (all cliques) with the generated
-subgraph, and outputs only the intersecting Regions that all intersect with
-the specified Region.
+then enumerates only the intersecting Regions (cliques) that include the
+specified Region, by expanding each clique from the specified Region.
 
 The construction of the Region intersection graph is performed via the one-pass
 sweep-line algorithm, through a subscription to RegionSweep. The enumeration
@@ -23,6 +22,8 @@ Classes:
 - SRQEnumByNxGraph
 """
 
+from collections import deque
+from itertools import chain, islice
 from typing import Any, Callable, Iterable, Iterator, List, Union
 
 from networkx import networkx as nx
@@ -40,10 +41,10 @@ class SRQEnumByNxGraph(MRQEnumByNxGraph):
   a specific Region by Region Intersection Graph
 
   Computes an Iterator of intersecting Regions that all intersect with a
-  specific Region by enumerating all cliques belonging to a subgraph of the
-  given Region intersection graph, where the subgraph is generated by only
-  keeping the specified Region and its neighbors. The output only includes
-  cliques that include the specified Region.
+  specific Region by enumerating the cliques belonging to the subgraph of the
+  given Region intersection graph induced by the specified Region and its
+  neighbors. Cliques are expanded from the specified Region, so only the
+  cliques that include the specified Region are ever generated.
 
   Extends:
     MRQEnumByNxGraph
@@ -80,22 +81,36 @@ class SRQEnumByNxGraph(MRQEnumByNxGraph):
 
   ### Methods: Computations
 
-  def compute(self) -> Iterator[RegionIntersect]:
+  def cliques(self) -> Iterator[List[str]]:
     """
-    The resulting Iterator of intersecting Regions that all intersect with
-    the specified Region as tuple of Region intersection and RegionIntns.
+    The Iterator of all cliques that include the specified Region, as lists
+    of Region IDs, in order of the number of Regions involved. Expands each
+    clique from the specified Region, with its neighbors as the initial
+    candidates; never generates cliques amongst only its neighbors.
 
     Overrides:
-      EnumerateByNxGraph.compute
+      MRQEnumByNxGraph.cliques
 
     Returns:
-      The resulting Iterator of intersecting Regions
-      that all intersect with the specified Region as
-      tuple of Region intersection and RegionIntns.
+      The Iterator of all cliques that include
+      the specified Region as lists of Region IDs.
     """
-    for region, intersect in EnumerateByNxGraph.compute(self):
-      if self.region in intersect:
-        yield (region, intersect)
+    adj, r = self.G.G.adj, self.region.id
+    neighbors = [v for v in self.subset if v != r]
+    index = dict((v, i) for i, v in enumerate(neighbors))
+    nbrs = {}
+
+    for u in neighbors:
+      nbrs[u] = {v for v in adj[u] if v in index and index[u] < index[v]}
+
+    queue = deque([([r], neighbors)])
+
+    while queue:
+      base, cnbrs = map(list, queue.popleft())
+      yield base
+      for i, u in enumerate(cnbrs):
+        queue.append((chain(base, [u]), \
+                      filter(nbrs[u].__contains__, islice(cnbrs, i + 1, None))))
 
   ### Class Methods: Evaluation
 
@@ -4,7 +4,9 @@
 Common Commands for Regions and RIGraph Console Command-line
 
 Implements shared and common commands in the CommonConsole command group for
-the RegionsConsole and RIGraphConsole command-line interfaces.
+the RegionsConsole and RIGraphConsole command-line interfaces. matplotlib
+is only imported by the visualization commands, so that the other commands
+start fast.
 
 Helper Classes:
 - CommonConsoleNS
@@ -18,25 +20,29 @@ Commands:
 - enumerate
 - visualize
 - visualenum
+- serve
+- loadgen
 """
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum
-from io import FileIO
+from io import FileIO, StringIO
+from os.path import isfile
+from re import split as resplit
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
 
-from matplotlib import pyplot
-from matplotlib.cm import ScalarMappable, get_cmap
-from matplotlib.colors import Normalize, to_rgb
 from networkx import networkx as nx
+from numpy import ndarray, percentile
 
 from sources.abstract import IOable
 from sources.algorithms import Enumerate, MRQEnum, NxGraphSweepCtor, SRQEnum
 from sources.core import NxGraph, Region, RegionId, RegionSet
-from sources.helpers import Randoms
-from sources.visualize import draw_regions, draw_rigraph
+from sources.helpers import Randoms, is_compressed
 
 from .console import Choice, File, Group, argument, option, pass_context
+from .server import RIGClient, RIGServer
 
 
 Context   = Union[RegionSet,NxGraph]
@@ -48,9 +54,47 @@ CtxTypes  = {
 
 
 class CommonConsoleNS:
+  """
+  Implementations of the common commands for the Regions
+  and RIGraph console command-line interfaces.
+
+  Class Attributes:
+    StreamFlushLines: The maximum number of JSON lines written
+                      between flushes in streaming output mode.
+    StreamFlushSecs:  The maximum number of seconds elapsed
+                      between flushes in streaming output mode.
+    BatchWorkerCtx:   The algorithm and context object to
+                      evaluate queries over, within a batch
+                      mode worker process.
+  """
+  StreamFlushLines = 1024
+  StreamFlushSecs  = 1.0
+  BatchWorkerCtx   = None
 
   ### Class Methods: Helpers
 
+  @classmethod
+  def columnar_path(cls, file: FileIO) -> str:
+    """
+    Returns the file path on disk of the given input or output file in the
+    columnar file format. The columnar file format is memory-mapped, and
+    stored alongside its JSON sidecar file, so it cannot be read from
+    standard input or written to standard output, nor be compressed.
+
+    Args:
+      file: The input or output columnar file.
+    Returns:
+      The file path on disk.
+    Raises:
+      ValueError: If the file is not an uncompressed file on disk.
+    """
+    path = getattr(file, 'name', None)
+    if not isinstance(path, str) or not isfile(path):
+      raise ValueError(f'Columnar files must be a file on disk, not {path or "a stream"}')
+    if is_compressed(file):
+      raise ValueError(f'Columnar files cannot be compressed: {path}')
+    return path
+
   @classmethod
   def resolve_ctxtype(cls, kind: str) -> Tuple[str, Type]:
     """
@@ -72,32 +116,123 @@ class CommonConsoleNS:
     return None
 
   @classmethod
-  def read(cls, source: FileIO, kind: str) -> Context:
+  def read(cls, source: FileIO, kind: str, jobs: int = 1) -> Context:
     """
     Deserialize the given input JSON file as the specified object type.
+    Parses the JSON incrementally. Region intersection graphs in the
+    binary RIG file format and collections of Regions in the columnar file
+    format are recognized automatically and memory-mapped. Compressed files
+    are decompressed incrementally, and are not memory-mapped. Collections
+    of Regions in the line-delimited JSON file format (.jsonl) are parsed
+    in parallel by the given number of worker processes.
 
     Args:
-      source: The input JSON file.
+      source: The input JSON, JSON Lines, binary RIG
+              or columnar file.
       kind:   The context object type.
+      jobs:   The number of worker processes for
+              parsing JSON Lines files.
     Returns:
       The parsed object.
+    Raises:
+      ValueError: If a columnar file is not an uncompressed file on disk.
     """
     assert source.readable()
     _, clz = cls.resolve_ctxtype(kind)
-    return clz.from_source(source)
+    if clz is NxGraph and NxGraph.is_binary(source):
+      return NxGraph.from_binary(source)
+    if clz is RegionSet and not is_compressed(source) and RegionSet.is_columnar(source):
+      return RegionSet.from_columnar(cls.columnar_path(source))
+    if clz is RegionSet and RegionSet.is_lines(source):
+      return RegionSet.from_lines(source, jobs)
+    return clz.from_stream(source)
 
   @classmethod
-  def write(cls, output: FileIO, ctx: Context):
+  def write(cls, output: FileIO, ctx: Context,
+                  binary: bool = False, indexed: bool = False):
     """
-    Serialize the given context object to the given output JSON file.
+    Serialize the given context object to the given output JSON file,
+    or to the binary RIG file format for Region intersection graphs, or to
+    the columnar file format (and its JSON sidecar file) for collections
+    of Regions. Collections of Regions are written in the line-delimited
+    JSON file format if the output file has the .jsonl extension.
 
     Args:
-      output: The destination JSON file.
-      ctx:    The context object.
+      output:   The destination JSON, JSON Lines, binary
+                RIG or columnar file.
+      ctx:      The context object.
+      binary:   Boolean flag whether or not to output
+                the binary RIG or columnar file format.
+      indexed:  Boolean flag whether or not to output
+                Region intersection graphs in the
+                node_index JSON format.
+    Raises:
+      ValueError: If a columnar file is not an uncompressed file on disk.
     """
     assert output.writable()
     assert isinstance(ctx, (IOable, Dict, List, Tuple))
-    IOable.to_output(ctx, output, options={'compact': True})
+    if binary and isinstance(ctx, RegionSet):
+      path = cls.columnar_path(output)
+      output.flush()
+      RegionSet.to_columnar(ctx, path)
+    elif binary:
+      assert isinstance(ctx, NxGraph)
+      output.flush()
+      NxGraph.to_binary(ctx, output.buffer)
+      output.buffer.flush()
+    elif isinstance(ctx, RegionSet) and RegionSet.is_lines(output):
+      RegionSet.to_lines(ctx, output)
+    elif indexed and isinstance(ctx, NxGraph):
+      IOable.to_output(ctx, output, options={'compact': True, 'json_graph': 'node_index'})
+    else:
+      IOable.to_output(ctx, output, options={'compact': True})
+
+  @classmethod
+  def write_chunks(cls, output: FileIO, regionset: RegionSet, length: int,
+                        chunks: Iterable[ndarray], binary: bool = False):
+    """
+    Serialize the given chunks of the columnar representation of Regions
+    (as given by RegionSet.random_chunks) to the given output file, one chunk
+    at a time, in the columnar file format (and its JSON sidecar file), or in
+    the line-delimited JSON file format.
+
+    Args:
+      output:     The destination JSON Lines or columnar file.
+      regionset:  The empty collection of Regions, with the
+                  ID, dimension and bounds of the Regions.
+      length:     The total number of Regions in all chunks.
+      chunks:     The chunks of the columnar representation
+                  of the Regions.
+      binary:     Boolean flag whether or not to output
+                  the columnar file format.
+    Raises:
+      ValueError: If a columnar file is not an uncompressed file on disk.
+    """
+    assert output.writable()
+    if binary:
+      path = cls.columnar_path(output)
+      output.flush()
+      metadata = {'id': regionset.id, 'dimension': regionset.dimension,
+                  'bounds': regionset.bounds, 'data': {}}
+      RegionSet.to_columnar_chunks(chunks, path, length, metadata)
+    else:
+      header = {'id': regionset.id, 'dimension': regionset.dimension,
+                'length': length, 'bounds': regionset.bounds}
+      RegionSet.to_lines_chunks(chunks, output, header)
+
+  @classmethod
+  def writeline(cls, output: FileIO, ctx: Any):
+    """
+    Serialize the given object to the given output file
+    as a single JSON line (JSON Lines format).
+
+    Args:
+      output: The destination JSON Lines file.
+      ctx:    The object to serialize.
+    """
+    assert output.writable()
+    IOable.to_output(ctx, output, options={'compact': True}, indent=None)
+    output.write('\n')
 
   @classmethod
   def context(cls, ctx: Context) -> Context:
@@ -178,6 +313,38 @@ class CommonConsoleNS:
       clz, qs = (SRQEnum, qs[0]) if len(qs) == 1 else (MRQEnum, qs)
       return clz.get(alg, ctx, qs)
 
+  @classmethod
+  def read_queries(cls, batch: FileIO) -> List[List[str]]:
+    """
+    Parse the given file of queries, one query per line, as Region IDs
+    separated by whitespace or commas. Blank lines and lines starting
+    with '#' are skipped.
+
+    Args:
+      batch:  The file of queries.
+    Returns:
+      The list of queries, each as a list of Region IDs.
+    """
+    lines = [line.strip() for line in batch]
+    return [[q for q in resplit(r'[\s,]+', line) if len(q) > 0]
+            for line in lines if len(line) > 0 and not line.startswith('#')]
+
+  @classmethod
+  def latency(cls, elapses: List[float]) -> Dict[str, float]:
+    """
+    Summarize the given query latencies as the minimum, median (p50),
+    99th percentile (p99), maximum and mean latencies.
+
+    Args:
+      elapses:  The latency of each query.
+    Returns:
+      The latency summary.
+    """
+    assert len(elapses) > 0
+    p50, p99 = percentile(elapses, [50, 99]).tolist()
+    return {'min': min(elapses), 'p50': p50, 'p99': p99,
+            'max': max(elapses), 'mean': sum(elapses) / len(elapses)}
+
   @classmethod
   def colorize_components(cls, ctx: Union[Context,CtxBundle]):
     """
@@ -210,7 +377,11 @@ class CommonConsoleNS:
                     nregions: int,
                     dimension: int, **kwargs):
     """
-    Randomly generate a new collection or intersection graph of Regions. \f
+    Randomly generate a new collection or intersection graph of Regions.
+    Collections of Regions written in the JSON Lines or columnar file
+    formats (and not colored) are generated in fixed-size chunks, each
+    streamed to the output file as it is generated, so that memory usage
+    stays constant. \f
 
     Args:
       output:
@@ -240,18 +411,50 @@ class CommonConsoleNS:
         Boolean flag for whether to color code the
         connected Regions and save the associated
         colors in each Region's data properties.
+      binary:
+        Boolean flag for whether to save the Region
+        intersection graph in the binary RIG file
+        format, or the collection of Regions in the
+        columnar file format, instead of JSON.
+      indexed:
+        Boolean flag for whether to save the Region
+        intersection graph JSON with the edges as
+        pairs of node indices (node_index format).
+      chunksize:
+        The number of Regions per generated chunk,
+        when streaming the collection of Regions.
+      seed:
+        The master seed of the independent random
+        number generator streams of each chunk, for
+        reproducible output. The same seed and chunk
+        size generate the same Regions.
+      jobs:
+        The number of worker processes generating
+        chunks in parallel. The output for a given
+        seed is the same for any number of workers.
     """
     kwargs['bounds'] = Region.from_object((dimension, kwargs['bounds']))
     kwargs['sizepc'] = Region.from_object((dimension, kwargs['sizepc']))
 
-    colored = kwargs.pop('colored', False)
-    regions = RegionSet.from_random(nregions, **kwargs)
+    colored   = kwargs.pop('colored', False)
+    binary    = kwargs.pop('binary', False)
+    indexed   = kwargs.pop('indexed', False)
+    chunksize = kwargs.pop('chunksize', None)
+
+    streamed = RegionSet.is_lines(output) or (binary and not is_compressed(output))
+    if cls.resolve_ctxtype(kind)[1] is RegionSet and streamed and not colored:
+      regionset = RegionSet(kwargs.pop('id'), kwargs.pop('bounds'))
+      chunks    = RegionSet.random_chunks(nregions, regionset.bounds, chunksize, **kwargs)
+      cls.write_chunks(output, regionset, nregions, chunks, binary)
+      return
+
+    regions = RegionSet.from_random(nregions, chunksize=chunksize, **kwargs)
     bundle  = cls.bundle(regions)
 
     if colored:
       cls.colorize_components(bundle)
 
-    cls.write(output, cls.unbundle(bundle, kind))
+    cls.write(output, cls.unbundle(bundle, kind), binary, indexed)
 
   @classmethod
   def convert(cls, source: FileIO,
@@ -280,15 +483,30 @@ class CommonConsoleNS:
         Boolean flag for whether to color code the
         connected Regions and save the associated
         colors in each Region's data properties.
+      binary:
+        Boolean flag for whether to save the Region
+        intersection graph in the binary RIG file
+        format, or the collection of Regions in the
+        columnar file format, instead of JSON.
+      indexed:
+        Boolean flag for whether to save the Region
+        intersection graph JSON with the edges as
+        pairs of node indices (node_index format).
+      jobs:
+        The number of worker processes for parsing
+        the source file, if in the JSON Lines format.
     """
     colored = kwargs.pop('colored', False)
-    context = cls.read(source, srckind)
+    binary  = kwargs.pop('binary', False)
+    indexed = kwargs.pop('indexed', False)
+    jobs    = kwargs.pop('jobs', 1)
+    context = cls.read(source, srckind, jobs)
     bundle  = cls.bundle(context)    
 
     if colored:
       cls.colorize_components(bundle)
 
-    cls.write(output, cls.unbundle(bundle, outkind))
+    cls.write(output, cls.unbundle(bundle, outkind), binary, indexed)
 
   ### Class Methods: Query Evaluation Commands
 
@@ -300,12 +518,20 @@ class CommonConsoleNS:
     """
     Enumerate over the set or graph of Regions in the given input source file.
     Outputs the results to as a JSON with performance data and the results
-    as a RegionSet of intersecting Regions.
+    as a RegionSet of intersecting Regions. In streaming mode, outputs each
+    intersecting Region as a JSON line as soon as it is enumerated, followed
+    by a trailer JSON line with the header and performance data.
 
     If no Regions given in the query, enumerate all intersecting Regions.
     If a single Region is given in the query, enumerate all intersecting
     Regions that includes that Region. If multiple Regions given in the query,
-    enumerate all intersecting Regions amongst the subset of Regions. \f
+    enumerate all intersecting Regions amongst the subset of Regions.
+
+    In batch mode, evaluates each query in the given batch file (one query
+    per line, as Region IDs separated by whitespace or commas) over the same
+    loaded or constructed context, and outputs the results and latency of
+    each query as a JSON line, followed by a trailer JSON line with the
+    header and performance data. \f
 
     Args:
       source:   The input source file to load.
@@ -319,9 +545,25 @@ class CommonConsoleNS:
         Boolean flag for whether to use the naive
         sweep-line algorithm instead of querying
         via the region intersection graph.
+      stream:
+        Boolean flag for whether to output the results
+        as JSON lines while enumerating, instead of a
+        single JSON document once finished.
+      batch:
+        The file of queries to evaluate in batch mode,
+        instead of the given queries.
+      jobs:
+        The number of worker processes for parsing
+        the source file, if in the JSON Lines format,
+        and for evaluating the queries in batch mode.
     """
+    if kwargs.get('batch') is not None:
+      assert len(queries) == 0
+      return cls.enumerate_batch(source, output, srckind, **kwargs)
+
     queries    = list(queries)
-    context    = cls.read(source, srckind)
+    stream     = kwargs.get('stream', False)
+    context    = cls.read(source, srckind, kwargs.get('jobs', 1))
     intersects = RegionSet(dimension=context.dimension)
     counts     = {}
 
@@ -346,20 +588,308 @@ class CommonConsoleNS:
 
     start = perf_counter()
     elapse_ctor, enumerator = get_enumerator()
+    flushed, unflushed = start, 0
 
     for region, intersect in enumerator():
       k = len(intersect)
       if k not in counts:
         counts[k] = 0
       counts[k] += 1
+
+      if not stream:
+        intersects.add(region)
+        continue
+
+      cls.writeline(output, region)
+      unflushed += 1
+      if unflushed >= cls.StreamFlushLines or \
+         perf_counter() - flushed >= cls.StreamFlushSecs:
+        output.flush()
+        flushed, unflushed = perf_counter(), 0
+
+    elapse_query = perf_counter() - start
+    header = {**get_header(context), 'query': queries, 'count': counts}
+
+    if stream:
+      cls.writeline(output, {'header': header})
+      output.flush()
+    else:
+      cls.write(output, {'header': header, 'results': intersects})
+
+  @classmethod
+  def enumerate_query(cls, alg: str, ctx: Context, query: List[RegionId]) -> Tuple[float, str]:
+    """
+    Evaluate the given query with the specified algorithm over the given
+    context object, and serialize the results as a single JSON line. If any
+    of the queried Region IDs is not within the context object, serializes
+    an error record for the query instead, without evaluating it.
+
+    Args:
+      alg:    The name of the algorithm.
+      ctx:    The collection or RIGraph of Regions.
+      query:  The list of Regions to be queried.
+    Returns:
+      The elapsed time of evaluating the query (or None,
+      if not evaluated) and the JSON line of the results
+      or the error, as a tuple.
+    """
+    unknown = [q for q in query if q not in ctx]
+    if len(unknown) > 0:
+      with StringIO() as output:
+        cls.writeline(output, {'query': query,
+                               'error': f'Unknown queried Region ID(s): {", ".join(unknown)}'})
+        return (None, output.getvalue())
+
+    start      = perf_counter()
+    intersects = RegionSet(dimension=ctx.dimension)
+    counts     = {}
+
+    for region, intersect in cls.enumerator(alg, ctx, query)():
+      k = len(intersect)
+      counts[k] = counts.get(k, 0) + 1
       intersects.add(region)
 
+    elapsed = perf_counter() - start
+
+    with StringIO() as output:
+      cls.writeline(output, {'query': query, 'elapse_query': elapsed,
+                             'count': counts, 'results': intersects})
+      return (elapsed, output.getvalue())
+
+  @classmethod
+  def _enumerate_worker_init(cls, alg: str, ctx: Context):
+    """
+    Initializes a batch mode worker process with the
+    algorithm and context object to evaluate queries over.
+
+    Args:
+      alg:  The name of the algorithm.
+      ctx:  The collection or RIGraph of Regions.
+    """
+    cls.BatchWorkerCtx = (alg, ctx)
+
+  @classmethod
+  def _enumerate_worker(cls, query: List[RegionId]) -> Tuple[float, str]:
+    """
+    Evaluate the given query within a batch mode worker process.
+
+    Args:
+      query:  The list of Regions to be queried.
+    Returns:
+      The elapsed time of evaluating the query (or None,
+      if not evaluated) and the JSON line of the results
+      or the error, as a tuple.
+    """
+    return cls.enumerate_query(*cls.BatchWorkerCtx, query)
+
+  @classmethod
+  def enumerate_batch(cls, source: FileIO,
+                           output: FileIO,
+                           srckind: str, **kwargs):
+    """
+    Enumerate over the set or graph of Regions in the given input source file
+    for each query in the given batch file. Loads the context, and constructs
+    the Region intersection graph if needed, once. Evaluates the queries in
+    order, or across a pool of worker processes, and outputs the results and
+    latency of each query as JSON lines, in the same order as the queries,
+    followed by a trailer JSON line with the header and performance data.
+    Queries of Region IDs not within the context are not evaluated, and are
+    output as error records instead, with an 'error' field.
+
+    Args:
+      source:   The input source file to load.
+      output:   The destination JSON Lines file to save results.
+      srckind:  The input data type.
+      kwargs:   Additional arguments.
+
+    Keyword Args:
+      batch:
+        The file of queries, one query per line, as
+        Region IDs separated by whitespace or commas.
+        Blank lines and lines starting with '#' are
+        skipped.
+      naive:
+        Boolean flag for whether to use the naive
+        sweep-line algorithm instead of querying
+        via the region intersection graph.
+      jobs:
+        The number of worker processes for parsing
+        the source file and evaluating the queries.
+    """
+    jobs    = kwargs.get('jobs', 1)
+    queries = cls.read_queries(kwargs['batch'])
+
+    start   = perf_counter()
+    context = cls.read(source, srckind, jobs)
+    elapse_load = perf_counter() - start
+
+    start = perf_counter()
+    if isinstance(context, NxGraph):
+      alg, ctx = 'slig', context
+    elif kwargs.get('naive', False):
+      alg, ctx = 'naive', context
+    else:
+      alg, ctx = 'slig', NxGraphSweepCtor.prepare(context)()
+    elapse_ctor = perf_counter() - start
+
+    start = perf_counter()
+    if jobs > 1 and len(queries) > 1:
+      with ProcessPoolExecutor(jobs, initializer=cls._enumerate_worker_init,
+                                     initargs=(alg, ctx)) as executor:
+        results = executor.map(cls._enumerate_worker, queries)
+        elapses = [cls.write_result(output, r) for r in results]
+    else:
+      elapses = [cls.write_result(output, cls.enumerate_query(alg, ctx, q)) for q in queries]
     elapse_query = perf_counter() - start
-    header = get_header(context)
-    cls.write(output, {
-      'header': {**header, 'query': queries, 'count': counts},
-      'results': intersects
-    })
+    errors       = elapses.count(None)
+    elapses      = [elapsed for elapsed in elapses if elapsed is not None]
+
+    header = {
+      'id': context.id,
+      'type': type(context).__name__,
+      'dimension': context.dimension,
+      'length': len(context),
+      'elapse_load': elapse_load,
+      'elapse_ctor': elapse_ctor,
+      'elapse_query': elapse_query,
+      'queries': len(queries),
+      'errors': errors,
+      'jobs': jobs
+    }
+
+    if len(elapses) > 0:
+      header['latency'] = cls.latency(elapses)
+
+    cls.writeline(output, {'header': header})
+    output.flush()
+
+  @classmethod
+  def write_result(cls, output: FileIO, result: Tuple[float, str]) -> float:
+    """
+    Write the given JSON line of a batch mode query result
+    to the given output file.
+
+    Args:
+      output: The destination JSON Lines file.
+      result: The elapsed time of evaluating the query
+              (or None, if not evaluated) and the JSON
+              line of the results or the error.
+    Returns:
+      The elapsed time of evaluating the query,
+      or None, if not evaluated.
+    """
+    elapsed, line = result
+    output.write(line)
+    return elapsed
+
+  ### Class Methods: Query Server Commands
+
+  @classmethod
+  def serve(cls, source: FileIO,
+                 srckind: str,
+                 address: str, **kwargs):
+    """
+    Start a long-running query server that keeps the Region intersection
+    graph of the given input source file resident in memory. Loads the
+    context, and constructs the Region intersection graph if needed, once.
+    Listens on a Unix domain socket ('unix:PATH') or a localhost TCP port
+    ('HOST:PORT') and answers line-delimited JSON requests: 'enumerate'
+    (all, single-Region or multi-Region queries), 'insert' and 'delete'
+    of Regions, 'stats' and 'shutdown'. Queries are evaluated within a pool
+    of worker threads; insertions and deletions update the resident graph
+    once the running queries have finished. \f
+
+    Args:
+      source:   The input source file to load.
+      srckind:  The input data type.
+      address:  The address to listen on.
+      kwargs:   Additional arguments.
+
+    Keyword Args:
+      threads:
+        The number of worker threads for
+        evaluating queries.
+      jobs:
+        The number of worker processes for parsing
+        the source file, if in the JSON Lines format.
+      log:
+        The file to output the server's bound address
+        and graph statistics to, once listening.
+    """
+    start   = perf_counter()
+    context = cls.read(source, srckind, kwargs.get('jobs', 1))
+    graph   = context if isinstance(context, NxGraph) else cls.context(context)
+    elapsed = perf_counter() - start
+    server  = RIGServer(graph, kwargs.get('threads', 4))
+
+    def started(address):
+      header = {**server.stats(), 'address': address, 'elapse_load': elapsed}
+      cls.writeline(kwargs['log'], {'header': header})
+      kwargs['log'].flush()
+
+    try:
+      asyncio.run(server.serve(RIGServer.parse_address(address), started))
+    except KeyboardInterrupt:
+      pass
+
+  @classmethod
+  def loadgen(cls, queries: FileIO,
+                   output: FileIO,
+                   address: str, **kwargs):
+    """
+    Measure the latency of a running query server, by sending each query in
+    the given file of queries (one query per line, as Region IDs separated
+    by whitespace or commas) over a number of concurrent connections. Outputs
+    the latency and reply of each query as JSON lines, in the same order as
+    the queries, followed by a trailer JSON line with the client-observed
+    and server-side latency percentiles (p50, p99) and throughput. \f
+
+    Args:
+      queries:  The file of queries to send.
+      output:   The destination JSON Lines file.
+      address:  The address of the query server.
+      kwargs:   Additional arguments.
+
+    Keyword Args:
+      concurrency:
+        The number of concurrent connections.
+      repeat:
+        The number of times to send each query.
+      counts:
+        Boolean flag for whether or not to only
+        request the number of intersecting Regions,
+        instead of the intersecting Regions.
+    """
+    counts   = kwargs.get('counts', False)
+    repeat   = kwargs.get('repeat', 1)
+    requests = [{'op': 'enumerate', 'query': q, 'counts': counts}
+                for q in cls.read_queries(queries)] * repeat
+    client   = RIGClient(RIGServer.parse_address(address))
+
+    start = perf_counter()
+    elapses, replies = asyncio.run(client.load(requests, kwargs.get('concurrency', 1)))
+    elapsed = perf_counter() - start
+
+    for elapse, reply in zip(elapses, replies):
+      cls.writeline(output, {'elapse': elapse, **reply})
+
+    succeeded = [r for r in replies if r['ok']]
+    header = {
+      'address': address,
+      'requests': len(requests),
+      'errors': len(requests) - len(succeeded),
+      'concurrency': kwargs.get('concurrency', 1),
+      'elapsed': elapsed,
+      'throughput': len(requests) / elapsed if elapsed > 0 else 0.0
+    }
+
+    if len(elapses) > 0:
+      header['latency'] = cls.latency(elapses)
+    if len(succeeded) > 0:
+      header['latency_server'] = cls.latency([r['elapse_query'] for r in succeeded])
+
+    cls.writeline(output, {'header': header})
+    output.flush()
 
   ### Class Methods: Visualization Commands
 
@@ -396,7 +926,14 @@ class CommonConsoleNS:
         Boolean flag for whether or not to reduce the
         bounding size to the minimum bounding Region,
         instead of the defined bounds.
+      raster:
+        Boolean flag for whether or not to draw the
+        collection of Regions as a density raster
+        image, or None to decide by its size.
     """
+    from matplotlib import pyplot
+    from sources.visualize import draw_regions, draw_rigraph
+
     figure, ax = pyplot.subplots(subplot_kw={'aspect': 'equal'}, figsize=(20, 10))
     colored = kwargs.get('colored')
     bundle  = cls.bundle(cls.read(source, srckind))
@@ -453,7 +990,18 @@ class CommonConsoleNS:
         Boolean flag for whether or not to reduce the
         bounding size to the minimum bounding Region,
         instead of the defined bounds.
+      raster:
+        Boolean flag for whether or not to draw the
+        collection of Regions as a density raster
+        image, or None to decide by its size. The
+        queried and intersecting Regions are always
+        drawn as rectangles, on top.
     """
+    from matplotlib import pyplot
+    from matplotlib.cm import ScalarMappable, get_cmap
+    from matplotlib.colors import Normalize
+    from sources.visualize import draw_regions, draw_rigraph
+
     figure, ax = pyplot.subplots(subplot_kw={'aspect': 'equal'}, figsize=(20, 10))
     regions, rigraph = cls.bundle(cls.read(source, srckind))
     intersects = RegionSet(dimension=regions.dimension)
@@ -488,6 +1036,7 @@ class CommonConsoleNS:
 
     if isinstance(ctx, RegionSet):
       ctx = ctx.merge([intersects])
+      kwargs['overlay'] = [ctx[q] for q in queries] + ctx.regions[len(regions):]
 
     draw_plot(ctx, ax, colored=True, **kwargs)
 
@@ -509,6 +1058,11 @@ CommonConsole = Group()
 @option('--sizepc',    type=(float, float), default=(0, 0.05), show_default=True)
 @option('--precision', type=int, default=5, show_default=True)
 @option('--colored',   is_flag=True)
+@option('--binary',    is_flag=True)
+@option('--indexed',   is_flag=True)
+@option('--chunksize', type=int, default=65536, show_default=True)
+@option('--seed',      type=int, default=None)
+@option('--jobs',      type=int, default=1, show_default=True)
 @pass_context
 def cc_generate(ctx, **kwargs):
   CommonConsoleNS.generate(**kwargs)
@@ -519,6 +1073,9 @@ def cc_generate(ctx, **kwargs):
 @argument('srckind', type=Choice(CtxTypes.keys(), case_sensitive=False))
 @argument('outkind', type=Choice(CtxTypes.keys(), case_sensitive=False))
 @option('--colored', is_flag=True)
+@option('--binary',  is_flag=True)
+@option('--indexed', is_flag=True)
+@option('--jobs',    type=int, default=1, show_default=True)
 @pass_context
 def cc_convert(ctx, **kwargs):
   CommonConsoleNS.convert(**kwargs)
@@ -529,6 +1086,9 @@ def cc_convert(ctx, **kwargs):
 @argument('srckind', type=Choice(CtxTypes.keys(), case_sensitive=False))
 @argument('queries', type=str, nargs=-1)
 @option('--naive',   is_flag=True)
+@option('--stream',  is_flag=True)
+@option('--batch',   type=File('r'))
+@option('--jobs',    type=int, default=1, show_default=True)
 @pass_context
 def cc_enumerate(ctx, **kwargs):
   CommonConsoleNS.enumerate(**kwargs)
@@ -542,6 +1102,7 @@ def cc_enumerate(ctx, **kwargs):
 @option('--communities', is_flag=True)
 @option('--tightbounds', is_flag=True)
 @option('--forced',      is_flag=True)
+@option('--raster/--vector', default=None)
 @pass_context
 def cc_visualize(ctx, **kwargs):
   CommonConsoleNS.visualize(**kwargs)
@@ -555,6 +1116,29 @@ def cc_visualize(ctx, **kwargs):
 @option('--colormap', type=str, default='jet')
 @option('--forced',      is_flag=True)
 @option('--tightbounds', is_flag=True)
+@option('--raster/--vector', default=None)
 @pass_context
 def cc_visualenum(ctx, **kwargs):
   CommonConsoleNS.visualenum(**kwargs)
+
+@CommonConsole.command('serve', help=CommonConsoleNS.serve.__doc__)
+@argument('source',  type=File('r'))
+@argument('srckind', type=Choice(CtxTypes.keys(), case_sensitive=False))
+@option('--address', type=str, default='localhost:8750', show_default=True)
+@option('--threads', type=int, default=4, show_default=True)
+@option('--jobs',    type=int, default=1, show_default=True)
+@option('--log',     type=File('w'), default='-')
+@pass_context
+def cc_serve(ctx, **kwargs):
+  CommonConsoleNS.serve(**kwargs)
+
+@CommonConsole.command('loadgen', help=CommonConsoleNS.loadgen.__doc__)
+@argument('queries', type=File('r'))
+@argument('output',  type=File('w'), default='-')
+@option('--address', type=str, default='localhost:8750', show_default=True)
+@option('--concurrency', type=int, default=1, show_default=True)
+@option('--repeat',  type=int, default=1, show_default=True)
+@option('--counts',  is_flag=True)
+@pass_context
+def cc_loadgen(ctx, **kwargs):
+  CommonConsoleNS.loadgen(**kwargs)
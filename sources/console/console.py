@@ -11,6 +11,7 @@ Classes:
 - Command   (ConsoleCommand)
 - Group     (ConsoleGroup)
 - Argument  (ConsoleArgument)
+- File      (ConsoleFile)
 
 Decorators:
 - command   (console_command)
@@ -18,7 +19,8 @@ Decorators:
 - argument  (console_argument)
 """
 
-from typing import Callable, Dict, List, Tuple as PyTuple
+from os import PathLike
+from typing import IO, Callable, Dict, List, Tuple as PyTuple
 
 import click
 
@@ -30,6 +32,8 @@ from docutils.utils import new_document
 from sphinxcontrib.napoleon import Config
 from sphinxcontrib.napoleon.docstring import GoogleDocstring
 
+from sources.helpers import compression_of, open_compressed
+
 
 def _deindent(text: str) -> List[str]:
   """
@@ -447,6 +451,69 @@ class ConsoleArgument(click.Argument):
     return (f'{self.human_readable_name}:', help)
 
 
+class ConsoleFile(click.File):
+  """
+  Extends click.File to transparently compress or decompress files in the
+  gzip, bz2 or lzma (xz) formats, chosen by the given compression format or
+  inferred from the file extension. The file content is compressed or
+  decompressed incrementally as it is written or read. Standard input and
+  output ('-') and uncompressed files are handled as by click.File.
+
+  Extends:
+    click.File
+
+  Attributes:
+    compression:  The compression format: 'gzip', 'bz2',
+                  'lzma', 'infer' from the file extension
+                  or None.
+  """
+  compression: str
+
+  def __init__(self, mode: str = 'r', compression: str = 'infer', **attrs):
+    """
+    Initialize extended click.File to support compressed files.
+
+    Args:
+      mode:
+        The file mode, as for click.File.
+      compression:
+        The compression format: 'gzip', 'bz2', 'lzma',
+        'infer' from the file extension or None.
+      attrs:
+        Arguments to be passed to click.File.
+    """
+    super().__init__(mode, **attrs)
+
+    self.compression = compression
+
+  def convert(self, value, param, ctx) -> IO:
+    """
+    Opens the given file path, through a compressed stream if the file
+    is compressed, and closes it along with the given context.
+
+    Args:
+      value:  The file path or file object.
+      param:  The parameter being converted.
+      ctx:    The context object.
+
+    Returns:
+      The opened file object.
+    """
+    if isinstance(value, (str, PathLike)) and value != '-':
+      compression = compression_of(value, self.compression)
+      if compression is not None:
+        try:
+          file = open_compressed(value, self.mode, compression,
+                                 encoding=self.encoding, errors=self.errors)
+        except OSError as e:
+          self.fail(f"'{value}': {e.strerror}", param, ctx)
+        if ctx is not None:
+          ctx.call_on_close(file.close)
+        return file
+
+    return super().convert(value, param, ctx)
+
+
 ### Decorators
 
 def console_command(name = None, cls = None, **attrs):
@@ -463,6 +530,7 @@ def console_argument(*param_decls, cls = None, **attrs):
 Command   = ConsoleCommand
 Group     = ConsoleGroup
 Argument  = ConsoleArgument
+File      = ConsoleFile
 
 command   = console_command
 group     = console_group
@@ -9,10 +9,11 @@ Methods:
 """
 
 from itertools import chain
+from json import dumps
 from typing import Iterable
-from sys import argv, stdout
+from sys import argv, exit, stdout
 
-from sources.experiments import ExperimentsOnRIGScale, ExperimentsOnRIQPerf
+from sources.experiments import ExperimentsOnRIGScale, ExperimentsOnRIQPerf, ExperimentsRegression
 
 from .console import File, argument, command, option
 
@@ -20,8 +21,24 @@ from .console import File, argument, command, option
 @command()
 @option('--logger', type=File('w'), default=stdout)
 @option('--test/--full', default=True)
+@option('--warmup',  type=int, default=0, show_default=True)
+@option('--mintime', type=float, default=0.0, show_default=True)
+@option('--jobs',    type=int, default=1, show_default=True)
+@option('--pin/--no-pin', default=False)
+@option('--seed',    type=int, default=None)
+@option('--checkpoint', type=str, default=None)
+@option('--resume/--restart', default=False)
+@option('--fixtures', type=str, default=None)
+@option('--save-baseline', 'baseline', type=str, default=None)
+@option('--compare',       type=str, default=None)
+@option('--threshold',     type=float, default=ExperimentsRegression.Threshold, show_default=True)
+@option('--baseline-dir',  'baselinedir', type=str, default=ExperimentsRegression.BaselineDir, show_default=True)
 @argument('experiments', nargs=-1)
-def ExperimentsConsole(logger = stdout, test = True, experiments = []):
+def ExperimentsConsole(logger = stdout, test = True, warmup = 0, mintime = 0.0,
+                       jobs = 1, pin = False, seed = None,
+                       checkpoint = None, resume = False, fixtures = None,
+                       baseline = None, compare = None, threshold = ExperimentsRegression.Threshold,
+                       baselinedir = ExperimentsRegression.BaselineDir, experiments = []):
   """
   Evaluate experiments that are specified by the given list of experiments,
   as exact/prefix matches or regular expressions.
@@ -30,7 +47,30 @@ def ExperimentsConsole(logger = stdout, test = True, experiments = []):
   number of Region overlaps, as well as relationship with between Regions and
   overlaps when the density and size of Regions is changed. Experiments to
   analyze the performance of queries over Region sets and Region intersection
-  graphs. Analyzes the performance of the algorithms for each query type. \f
+  graphs. Analyzes the performance of the algorithms for each query type.
+
+  Benchmark mode is enabled if warmup or mintime are given: each timed
+  measurement is preceded by warmup runs, runs with the garbage collector
+  disabled and is repeated until mintime seconds are spent per point. The
+  median, IQR and confidence interval per point are output as JSON.
+
+  The independent cells of each experiment are evaluated in parallel by the
+  given number of worker processes (jobs), optionally pinned to one core
+  each. Each cell is seeded from the given seed, so that the results are
+  reproducible regardless of the number of jobs.
+
+  If a checkpoint directory is given, each measurement is appended to the
+  experiment's checkpoint log as soon as it is taken, and the generated
+  datasets and graphs are cached. With resume, the measurements already
+  recorded are skipped, and the cached datasets and graphs are reused.
+  Datasets and graphs are cached in the given fixtures directory instead,
+  keyed by their parameters and seed, to be reused by later evaluations.
+
+  The timings of each point can be saved as a named baseline, and compared
+  against a previously saved baseline. Points whose median timing is slower
+  than the baseline's by more than the threshold, with non-overlapping
+  confidence intervals, are flagged as regressions, and the command exits
+  with a non-zero status. The comparison is output as CSV and bar chart. \f
 
   Args:
     logger:
@@ -40,15 +80,74 @@ def ExperimentsConsole(logger = stdout, test = True, experiments = []):
       X or series values (full experiment).
       True for test mode with reduced X or series values;
       False for full experiment.
+    warmup:
+      The number of untimed runs before each timed
+      measurement, in benchmark mode.
+    mintime:
+      The minimum total number of seconds spent on
+      the timed runs of each point, in benchmark mode.
+    jobs:
+      The number of worker processes to evaluate the
+      cells of each experiment with.
+    pin:
+      Whether or not to pin each worker process to
+      one processor core.
+    seed:
+      The seed from which the seed of each cell is
+      derived. If None, a random seed is drawn.
+    checkpoint:
+      The directory of the checkpoint logs and of the
+      cached datasets and graphs.
+    resume:
+      Whether or not to resume from the existing
+      checkpoint logs, or to restart them.
+    fixtures:
+      The directory of the cached datasets and graphs.
+    baseline:
+      The name of the baseline to save the timings of
+      each point as.
+    compare:
+      The name of the baseline to compare the timings
+      of each point against.
+    threshold:
+      The fraction of the baseline's median timing by
+      which a point must be slower to be a regression.
+    baselinedir:
+      The directory of the baseline files.
     experiments:
       The list of experiments to evaluate (including
       experiment prefixes or regular expressions).
       If None given, evaluates all experiments.
   """
   experiments = list(experiments)
+  regressions = []
+  cells = {'jobs': jobs, 'pin': pin, 'seed': seed, 'checkpoint': checkpoint, 'resume': resume,
+           'fixtures': fixtures}
   with logger as output:
-    ExperimentsOnRIGScale.evaluate(experiments, output, test)
-    ExperimentsOnRIQPerf.evaluate(experiments, output, test)
+    evaluated = [
+      *ExperimentsOnRIGScale.evaluate(experiments, output, test, **cells),
+      *ExperimentsOnRIQPerf.evaluate(experiments, output, test, warmup=warmup, mintime=mintime, **cells)
+    ]
+
+    if baseline is not None:
+      path = ExperimentsRegression.save_baseline(baseline, evaluated, baselinedir)
+      output.write(f'Saved baseline: {path}\n')
+
+    if compare is not None:
+      base = ExperimentsRegression.load_baseline(compare, baselinedir)
+      name = f'regression_{compare}'
+      report, comparisons = ExperimentsRegression.compare(base, evaluated, threshold, name)
+      regressions = [c for c in comparisons if c['regression']]
+
+      if len(report.x) > 0:
+        ExperimentsRegression.output_report(report, f'data/{name}')
+      for comparison in comparisons:
+        output.write(f'{dumps(comparison)}\n')
+      output.write(f'Compared {len(comparisons)} points against baseline "{compare}": '
+                   f'{len(regressions)} regressions\n')
+
+  if len(regressions) > 0:
+    exit(1)
 
 
 def _list_experiments() -> Iterable[str]:
@@ -15,6 +15,8 @@ Commands:
 - enumerate
 - visualize
 - visualenum
+- serve
+- loadgen
 """
 
 from .common import CommonConsole
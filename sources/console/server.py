@@ -0,0 +1,548 @@
+#!/usr/bin/env python
+
+"""
+Region Intersection Graph Query Server and Client
+
+Implements a long-running query server that keeps a Region intersection
+graph resident in memory, and answers queries sent by clients over a Unix
+domain socket or a localhost TCP port, along with a client for sending
+queries and measuring the latency of the server.
+
+The protocol is line-delimited JSON: each request is a single JSON object
+on its own line, and the server replies to each request, in order, with a
+single JSON object on its own line. Each request has an 'op' field with the
+operation to perform, and an optional 'seq' field that is echoed back
+within the reply. Each reply has an 'ok' field that is False if the request
+failed, along with an 'error' field with the error message.
+
+Operations:
+- enumerate:  Enumerate the intersecting Regions. If the
+              'query' field lists no Region IDs, enumerate
+              all intersecting Regions; if one Region ID,
+              evaluate a single-Region query (SRQ); if many,
+              evaluate a multi-Region query (MRQ). Replies
+              with the number of intersecting Regions per
+              number of Regions involved ('count') and,
+              unless the 'counts' field is True, with the
+              intersecting Regions ('results').
+- insert:     Insert the Region(s) in the 'regions' field
+              into the graph.
+- delete:     Delete the Region ID(s) in the 'regions' field
+              from the graph.
+- stats:      Reply with the graph and server statistics.
+- shutdown:   Stop the server once the reply is sent.
+
+Queries are evaluated within a pool of worker threads, so that the server
+remains responsive while evaluating long-running queries. Insertions and
+deletions are applied exclusively, once all of the running queries have
+finished, and the queries received afterwards observe the updated graph.
+
+Types:
+- Address
+
+Classes:
+- RIGServer
+- RIGClient
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from json import dumps, loads
+from os import remove
+from os.path import exists
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
+
+from sources.abstract import IOable
+from sources.algorithms import Enumerate, MRQEnum, SRQEnum
+from sources.core import NxGraph, Region, RegionSet
+
+
+Address = Union[str, Tuple[str, int]]
+
+
+class RIGServer:
+  """
+  Long-running query server that keeps a Region intersection graph resident
+  in memory and answers the line-delimited JSON requests of its clients.
+
+  Attributes:
+    graph:      The resident Region intersection graph.
+    threads:    The number of worker threads for
+                evaluating queries.
+    executor:   The pool of worker threads.
+    readers:    The number of queries being evaluated.
+    writing:    Whether or not an insertion or deletion
+                is pending or being applied.
+    condition:  The condition on which queries, insertions
+                and deletions wait for their turn.
+    stopped:    The event set when the server is to stop.
+    clients:    The streams of the replies to the
+                connected clients.
+    requests:   The number of requests replied to.
+    errors:     The number of failed requests.
+
+  Class Attributes:
+    LineLimit:  The maximum length of a request or reply
+                line, as the number of bytes.
+  """
+  graph: NxGraph
+  threads: int
+  executor: ThreadPoolExecutor
+  readers: int
+  writing: bool
+  condition: asyncio.Condition
+  stopped: asyncio.Event
+  clients: Set[asyncio.StreamWriter]
+  requests: int
+  errors: int
+
+  LineLimit = 2**28
+
+  def __init__(self, graph: NxGraph, threads: int = 4):
+    """
+    Initialize a new query server over the given Region intersection graph.
+
+    Args:
+      graph:    The Region intersection graph to keep
+                resident in memory.
+      threads:  The number of worker threads for
+                evaluating queries.
+    """
+    assert isinstance(graph, NxGraph)
+    assert isinstance(threads, int) and threads > 0
+
+    self.graph    = graph
+    self.threads  = threads
+    self.requests = 0
+    self.errors   = 0
+
+  ### Class Methods: Helpers
+
+  @classmethod
+  def parse_address(cls, address: str) -> Address:
+    """
+    Parse the given server address: either a Unix domain socket path, as
+    'unix:PATH', or a TCP host and port, as 'HOST:PORT' or 'PORT'.
+
+    Args:
+      address:  The server address.
+
+    Returns:
+      The Unix domain socket path.
+      The TCP host and port as a tuple.
+    """
+    if address.startswith('unix:'):
+      return address[len('unix:'):]
+
+    host, _, port = address.rpartition(':')
+    return (host or 'localhost', int(port))
+
+  @classmethod
+  def evaluate(cls, graph: NxGraph, query: List[str], counts: bool = False) -> Dict:
+    """
+    Evaluate the given query over the given Region intersection graph.
+    If no Regions given in the query, enumerate all intersecting Regions.
+    If a single Region is given in the query, enumerate all intersecting
+    Regions that includes that Region. If multiple Regions given in the query,
+    enumerate all intersecting Regions amongst the subset of Regions.
+
+    Args:
+      graph:  The Region intersection graph.
+      query:  The list of Region IDs to be queried.
+      counts: Boolean flag for whether or not to omit
+              the intersecting Regions from the reply.
+
+    Returns:
+      The reply, with the elapsed time, the counts and
+      the intersecting Regions.
+    """
+    if len(query) == 0:
+      enumerator = Enumerate.get('slig', graph)
+    elif len(query) == 1:
+      enumerator = SRQEnum.get('slig', graph, query[0])
+    else:
+      enumerator = MRQEnum.get('slig', graph, query)
+
+    start      = perf_counter()
+    intersects = RegionSet(dimension=graph.dimension)
+    count      = {}
+
+    for region, intersect in enumerator():
+      k = len(intersect)
+      count[k] = count.get(k, 0) + 1
+      if not counts:
+        intersects.add(region)
+
+    reply = {'elapse_query': perf_counter() - start, 'count': count}
+    if not counts:
+      reply['results'] = intersects
+
+    return reply
+
+  ### Methods: Helpers
+
+  def _encode(self, reply: Dict) -> bytes:
+    """
+    Serialize the given reply as a single JSON line.
+
+    Args:
+      reply:  The reply to serialize.
+
+    Returns:
+      The JSON line, as UTF-8 encoded bytes.
+    """
+    with StringIO() as output:
+      IOable.to_output(reply, output, options={'compact': True}, indent=None)
+      output.write('\n')
+      return output.getvalue().encode('utf-8')
+
+  async def _read(self, function: Callable, *args) -> Any:
+    """
+    Evaluate the given function within a worker thread, concurrently with
+    other reads, once no insertion or deletion is pending or being applied.
+
+    Args:
+      function: The function to evaluate.
+      args:     The arguments to the function.
+
+    Returns:
+      The result of the function.
+    """
+    async with self.condition:
+      await self.condition.wait_for(lambda: not self.writing)
+      self.readers += 1
+
+    try:
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(self.executor, function, *args)
+    finally:
+      async with self.condition:
+        self.readers -= 1
+        self.condition.notify_all()
+
+  async def _write(self, function: Callable, *args) -> Any:
+    """
+    Evaluate the given function within a worker thread exclusively, once
+    all running reads have finished, so that the event loop keeps accepting
+    connections and requests meanwhile. Reads received afterwards (queries
+    and stats) wait for it to finish.
+
+    Args:
+      function: The function to evaluate.
+      args:     The arguments to the function.
+
+    Returns:
+      The result of the function.
+    """
+    async with self.condition:
+      await self.condition.wait_for(lambda: not self.writing)
+      self.writing = True
+      await self.condition.wait_for(lambda: self.readers == 0)
+
+    try:
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(self.executor, function, *args)
+    finally:
+      async with self.condition:
+        self.writing = False
+        self.condition.notify_all()
+
+  ### Methods: Operations
+
+  def enumerate(self, query: List[str], counts: bool = False) -> Dict:
+    """
+    Evaluate the given query over the Region intersection graph, as given by
+    RIGServer.evaluate, once validated that the queried Region IDs are within
+    the graph. Must be evaluated as a read, so that no deletion removes the
+    queried Regions between the validation and the evaluation.
+
+    Args:
+      query:  The list of Region IDs to be queried.
+      counts: Boolean flag for whether or not to omit
+              the intersecting Regions from the reply.
+
+    Returns:
+      The reply, with the elapsed time, the counts and
+      the intersecting Regions.
+
+    Raises:
+      KeyError: If a queried Region ID is not within the graph.
+    """
+    unknown = [q for q in query if q not in self.graph]
+    if len(unknown) > 0:
+      raise KeyError(f'Unknown queried Region ID(s): {", ".join(unknown)}')
+
+    return self.evaluate(self.graph, query, counts)
+
+  def insert(self, regions: List[Any]) -> Dict:
+    """
+    Insert the given Regions into the Region intersection graph.
+
+    Args:
+      regions:  The objects to be converted to the
+                Regions to be inserted.
+
+    Returns:
+      The reply, with the number of Regions inserted.
+    """
+    regions = [Region.from_object(r) for r in regions]
+    self.graph.insert_regions(regions)
+    return {'inserted': len(regions), 'length': len(self.graph)}
+
+  def delete(self, regions: List[str]) -> Dict:
+    """
+    Delete the given Region IDs from the Region intersection graph.
+    Region IDs that are not within the graph are ignored.
+
+    Args:
+      regions:  The Region IDs to be deleted.
+
+    Returns:
+      The reply, with the number of Regions deleted.
+    """
+    regions = [r for r in regions if r in self.graph]
+    self.graph.remove_regions(regions)
+    return {'deleted': len(regions), 'length': len(self.graph)}
+
+  def stats(self) -> Dict:
+    """
+    Returns the statistics of the Region intersection graph and the server.
+    Must be evaluated as a read, so that the graph is not mutated while
+    its nodes and edges are counted.
+
+    Returns:
+      The reply, with the statistics.
+    """
+    return {
+      'id': self.graph.id,
+      'dimension': self.graph.dimension,
+      'length': len(self.graph),
+      'overlaps': self.graph.G.number_of_edges(),
+      'version': self.graph.version,
+      'threads': self.threads,
+      'requests': self.requests,
+      'errors': self.errors
+    }
+
+  async def dispatch(self, request: Dict) -> Dict:
+    """
+    Perform the operation of the given request.
+
+    Args:
+      request:  The parsed request.
+
+    Returns:
+      The reply to the request.
+
+    Raises:
+      ValueError: If the operation is unsupported.
+    """
+    op = request.get('op', 'enumerate')
+
+    if op == 'enumerate':
+      query  = [str(q) for q in request.get('query', [])]
+      counts = bool(request.get('counts', False))
+      return await self._read(self.enumerate, query, counts)
+    if op == 'insert':
+      regions = request['regions']
+      regions = regions if isinstance(regions, List) else [regions]
+      return await self._write(self.insert, regions)
+    if op == 'delete':
+      regions = request['regions']
+      regions = regions if isinstance(regions, List) else [regions]
+      return await self._write(self.delete, [str(r) for r in regions])
+    if op == 'stats':
+      return await self._read(self.stats)
+    if op == 'shutdown':
+      return {}
+
+    raise ValueError(f'Unsupported "{op}" operation')
+
+  async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Reply to each of the requests of a connected client, in order,
+    until the client disconnects or the server is to stop.
+
+    Args:
+      reader: The stream of the client's requests.
+      writer: The stream of the replies to the client.
+    """
+    self.clients.add(writer)
+    try:
+      while not self.stopped.is_set():
+        line = await reader.readline()
+        if len(line) == 0:
+          break
+        if len(line.strip()) == 0:
+          continue
+
+        seq, request = None, {}
+        try:
+          parsed = loads(line)
+          if not isinstance(parsed, Dict):
+            raise ValueError('Request must be a JSON object')
+          request = parsed
+          seq     = request.get('seq')
+          reply   = {'seq': seq, 'ok': True, **await self.dispatch(request)}
+          data    = await self._read(self._encode, reply)
+        except Exception as e:
+          self.errors += 1
+          data = self._encode({'seq': seq, 'ok': False, 'error': f'{type(e).__name__}: {e}'})
+
+        self.requests += 1
+        writer.write(data)
+        await writer.drain()
+
+        # Stop once the reply to the shutdown request is sent.
+        if request.get('op') == 'shutdown':
+          self.stopped.set()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+      pass
+    finally:
+      self.clients.discard(writer)
+      writer.close()
+
+  async def serve(self, address: Address, started: Callable[[Address], None] = None):
+    """
+    Listen on the given address and reply to the requests of
+    the connected clients, until a shutdown request is received.
+
+    Args:
+      address:  The Unix domain socket path, or
+                the TCP host and port as a tuple.
+      started:  The function called with the bound
+                address once listening.
+    """
+    self.readers   = 0
+    self.writing   = False
+    self.condition = asyncio.Condition()
+    self.stopped   = asyncio.Event()
+    self.clients   = set()
+
+    with ThreadPoolExecutor(self.threads) as self.executor:
+      if isinstance(address, str):
+        if exists(address):
+          remove(address)
+        server = await asyncio.start_unix_server(self.handle, address, limit=self.LineLimit)
+      else:
+        server = await asyncio.start_server(self.handle, *address, limit=self.LineLimit)
+        address = server.sockets[0].getsockname()[0:2]
+
+      if started is not None:
+        started(address)
+
+      async with server:
+        await self.stopped.wait()
+        for writer in list(self.clients):
+          writer.close()
+
+      if isinstance(address, str) and exists(address):
+        remove(address)
+
+
+class RIGClient:
+  """
+  Client of the Region intersection graph query server,
+  for sending requests and measuring the server's latency.
+
+  Attributes:
+    address:  The server address.
+  """
+  address: Address
+
+  def __init__(self, address: Address):
+    """
+    Initialize a new client of the query server at the given address.
+
+    Args:
+      address:  The Unix domain socket path, or
+                the TCP host and port as a tuple.
+    """
+    self.address = address
+
+  ### Methods: Helpers
+
+  async def connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Open a new connection to the query server.
+
+    Returns:
+      The streams of the replies and requests, as a tuple.
+    """
+    if isinstance(self.address, str):
+      return await asyncio.open_unix_connection(self.address, limit=RIGServer.LineLimit)
+    return await asyncio.open_connection(*self.address, limit=RIGServer.LineLimit)
+
+  @staticmethod
+  async def request(reader: asyncio.StreamReader,
+                    writer: asyncio.StreamWriter, request: Dict) -> Dict:
+    """
+    Send the given request over the given connection,
+    and wait for its reply.
+
+    Args:
+      reader:   The stream of the server's replies.
+      writer:   The stream of the requests to the server.
+      request:  The request to send.
+
+    Returns:
+      The parsed reply.
+    """
+    writer.write((dumps(request) + '\n').encode('utf-8'))
+    await writer.drain()
+    return loads(await reader.readline())
+
+  ### Methods: Requests
+
+  async def send(self, requests: List[Dict]) -> List[Dict]:
+    """
+    Send the given requests, in order, over a single
+    connection, and wait for their replies.
+
+    Args:
+      requests: The requests to send.
+
+    Returns:
+      The parsed replies, in the same order.
+    """
+    reader, writer = await self.connect()
+    try:
+      return [await self.request(reader, writer, r) for r in requests]
+    finally:
+      writer.close()
+
+  async def load(self, requests: List[Dict], concurrency: int = 1) -> Tuple[List[float], List[Dict]]:
+    """
+    Send the given requests over the given number of concurrent
+    connections, each sending its next request as soon as the reply
+    to its previous request is received, and measure the latency
+    of each request as observed by the client.
+
+    Args:
+      requests:     The requests to send.
+      concurrency:  The number of concurrent connections.
+
+    Returns:
+      The latency of each request and the parsed
+      replies, in the same order as the requests.
+    """
+    assert isinstance(concurrency, int) and concurrency > 0
+
+    elapses = [0.0] * len(requests)
+    replies = [None] * len(requests)
+    pending = iter(range(len(requests)))
+
+    async def worker():
+      reader, writer = await self.connect()
+      try:
+        for i in pending:
+          start      = perf_counter()
+          replies[i] = await self.request(reader, writer, {'seq': i, **requests[i]})
+          elapses[i] = perf_counter() - start
+      finally:
+        writer.close()
+
+    await asyncio.gather(*[worker() for _ in range(min(concurrency, max(len(requests), 1)))])
+    return elapses, replies
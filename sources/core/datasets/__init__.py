@@ -2,3 +2,4 @@
 
 from .regionset import *
 from .regiontime import *
+from .regionindex import *
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+"""
+Spatial Index for Regions
+
+Implements the RegionIndex class, a sorted index of Regions ordered by the
+lower bounds of the Regions along a specific dimension. Provides methods for
+adding and removing Regions, individually or in batches, and for finding
+all of the indexed Regions that overlap with a given Region without a full
+scan over the indexed Regions.
+
+Classes:
+- RegionIndex
+"""
+
+from collections import abc
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, Tuple
+
+from sortedcontainers import SortedKeyList, SortedList
+
+from ..shapes import Region, RegionId
+
+
+class RegionIndex(abc.Container, abc.Sized):
+  """
+  A sorted index of Regions ordered by the lower bounds of the Regions
+  along a specific dimension.
+
+  Finds the candidate overlapping Regions for a given Region by only visiting
+  the indexed Regions whose lower bound lies within the given Region's
+  Interval along the indexed dimension, extended by the length of the
+  longest indexed Region along that dimension.
+
+  Extends:
+    abc.Container
+    abc.Sized
+
+  Attributes:
+    dimension:  The dimension on which to order the
+                indexed Regions.
+    regions:    The mapping of Region IDs to the
+                indexed Regions.
+    lowers:     The sorted list of lower bounds along
+                the indexed dimension and Region IDs.
+    lengths:    The sorted list of the lengths of the
+                indexed Regions along the indexed
+                dimension.
+  """
+  dimension: int
+  regions: Dict[str, Region]
+  lowers: SortedKeyList
+  lengths: SortedList
+
+  def __init__(self, regions: Iterable[Region] = [], dimension: int = 0):
+    """
+    Initialize a new index of Regions ordered by the lower bounds
+    of the Regions along the given dimension.
+
+    Args:
+      regions:    The Regions to be indexed.
+      dimension:  The dimension on which to order the
+                  indexed Regions.
+    """
+    assert isinstance(dimension, int) and dimension >= 0
+
+    self.dimension = dimension
+    self.regions   = {}
+    self.lowers    = SortedKeyList(key=itemgetter(0))
+    self.lengths   = SortedList()
+
+    self.update(regions)
+
+  ### Methods: Helpers
+
+  def _entry(self, region: Region) -> Tuple[float, str]:
+    """
+    Returns the sorted list entry for the given Region.
+
+    Args:
+      region: The Region to compute the entry for.
+
+    Returns:
+      The lower bound along the indexed dimension
+      and the Region ID as a tuple.
+    """
+    return (region[self.dimension].lower, region.id)
+
+  ### Properties: Getters
+
+  @property
+  def maxlength(self) -> float:
+    """
+    The length of the longest indexed Region along the indexed dimension.
+    Shrinks as the longest indexed Regions are removed.
+
+    Returns:
+      The maximum length of the indexed Regions,
+      or 0 if no Regions are indexed.
+    """
+    return self.lengths[-1] if len(self.lengths) > 0 else 0.0
+
+  ### Methods: Queries
+
+  def __len__(self) -> int:
+    """
+    Determine the number of Regions within this index.
+
+    Returns:
+      The number of indexed Regions.
+    """
+    return len(self.regions)
+
+  def __contains__(self, value: RegionId) -> bool:
+    """
+    Determine if the given Region or Region ID is contained
+    within this index.
+
+    Syntactic Sugar:
+      value in self
+
+    Args:
+      value:  The Region or Region ID to test if
+              exists within this index.
+
+    Returns:
+      True:   If Region exists within this index.
+      False:  Otherwise.
+    """
+    return (value.id if isinstance(value, Region) else value) in self.regions
+
+  def __iter__(self) -> Iterator[Region]:
+    """
+    Return an iterator over the indexed Regions, ordered by the
+    lower bounds of the Regions along the indexed dimension.
+
+    Returns:
+      An iterator over the indexed Regions.
+    """
+    for _, rid in self.lowers:
+      yield self.regions[rid]
+
+  def overlaps(self, region: Region) -> Iterator[Region]:
+    """
+    Return an iterator over the indexed Regions that overlap with the given
+    Region, ordered by the lower bounds of the Regions along the indexed
+    dimension. Excludes the indexed Region with the same ID as the given
+    Region.
+
+    Args:
+      region: The Region to find the overlapping
+              indexed Regions of.
+
+    Returns:
+      An iterator over the overlapping indexed Regions.
+    """
+    assert isinstance(region, Region)
+
+    interval = region[self.dimension]
+    lower    = interval.lower - self.maxlength
+
+    for _, rid in self.lowers.irange_key(lower, interval.upper):
+      if rid == region.id:
+        continue
+      if region.overlaps(self.regions[rid]):
+        yield self.regions[rid]
+
+  ### Methods: Insertion
+
+  def add(self, region: Region):
+    """
+    Add the given Region to this index. If a Region with the same ID
+    is already indexed, replaces the previously indexed Region.
+
+    Args:
+      region: The Region to be indexed.
+    """
+    self.update([region])
+
+  def update(self, regions: Iterable[Region]):
+    """
+    Add all of the given Regions to this index in a single batch.
+    If a Region with the same ID is already indexed, replaces the
+    previously indexed Region.
+
+    Args:
+      regions:  The Regions to be indexed.
+    """
+    batch = {}
+
+    for region in regions:
+      assert isinstance(region, Region)
+      if region.id in self.regions:
+        self.remove(region.id)
+
+      batch[region.id] = region
+
+    self.regions.update(batch)
+    self.lowers.update(map(self._entry, batch.values()))
+    self.lengths.update(r[self.dimension].length for r in batch.values())
+
+  ### Methods: Removal
+
+  def remove(self, region: RegionId):
+    """
+    Remove the given Region or Region ID from this index.
+    Does nothing if the Region is not indexed.
+
+    Args:
+      region: The Region or Region ID to be removed.
+    """
+    rid = region.id if isinstance(region, Region) else region
+
+    if rid in self.regions:
+      region = self.regions.pop(rid)
+      self.lowers.remove(self._entry(region))
+      self.lengths.remove(region[self.dimension].length)
+
+  def clear(self):
+    """
+    Remove all of the Regions from this index.
+    """
+    self.regions.clear()
+    self.lowers.clear()
+    self.lengths.clear()
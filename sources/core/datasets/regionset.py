@@ -5,21 +5,38 @@ Regions Collection
 
 Implements the RegionSet class, a data class that represents a collection of
 Regions dataset. Provides methods for generating new datasets, and loading
-from or saving to a file, in the JSON or CSV file formats. This collection of
+from or saving to a file, in the JSON or CSV file formats, in a columnar
+NumPy (.npy) file format that can be memory-mapped, or in a line-delimited
+JSON file format that can be parsed in parallel. Large datasets can be
+randomly generated in fixed-size chunks, reproducibly in parallel from a
+seed, streamed to either of the latter file formats. This collection of
 Regions is then passed to the Intersection Graph construction algorithm.
 
+Types:
+- RegionColumnsChunk
+
 Classes:
 - RegionSet
 """
 
-from collections import abc
+from collections import abc, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, astuple, dataclass
-from random import shuffle
-from typing import Any, Dict, Iterable, Iterator, List, Union
-from uuid import uuid4
-
-from sources.abstract import IOable
-from sources.helpers import RandomFn, Randoms, to_base26
+from io import BufferedIOBase, TextIOBase
+from json import load as JSONLoader
+from json import loads as JSONParse
+from os.path import getsize, isfile, splitext
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+from uuid import UUID, uuid4
+
+from numpy import argsort, array, concatenate, empty, load, ndarray, save
+from numpy.lib.format import dtype_to_descr, write_array_header_1_0
+from numpy.random import Generator, SeedSequence
+
+from sources.abstract import IOable, IOableEncoder
+from sources.helpers import \
+  JSONStream, RandomFn, Randoms, \
+  compressed, compression_of, is_compressed, open_compressed, to_base26
 
 from ..shapes import Interval, Region, RegionId, RegionPair
 from .regiontime import RegionEvtKind
@@ -30,6 +47,9 @@ except ImportError:
   pass
 
 
+RegionColumnsChunk = Tuple[Dict, List[str], ndarray, ndarray, Dict[str, Dict]]
+
+
 @dataclass
 class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
   """
@@ -51,12 +71,24 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     bounds:     The bounding Region that must enclose
                 all Regions in this collection.
                 Or None, for no outer bounding Region.
+
+  Class Attributes:
+    ColumnarMagic:    The leading bytes that identify the
+                      columnar NumPy (.npy) file format.
+    LinesExtensions:  The file extensions that identify the
+                      line-delimited JSON file format.
+    RandomChunkSize:  The default number of Regions per chunk,
+                      when randomly generating Regions in chunks.
   """
   id: str
   dimension: int
   bounds: Region
   regions: List[Region]
 
+  ColumnarMagic   = b'\x93NUMPY'
+  LinesExtensions = ['.jsonl', '.ndjson']
+  RandomChunkSize = 65536
+
   def __init__(self, id: str = '', bounds: Region = None, dimension: int = 1):
     """
     Initialize a new Regions collection dataset, with the given id, the
@@ -90,6 +122,46 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
 
   ### Properties: Getters
 
+  @property
+  def regions(self) -> List[Region]:
+    """
+    The collection of Regions. If constructed from a columnar representation
+    (RegionSet.from_columns), constructs the Regions from the columns and
+    their data properties on first access.
+
+    Returns:
+      The collection of Regions.
+    """
+    if self._pending is not None:
+      self._build_pending()
+
+    return self._regions
+
+  @regions.setter
+  def regions(self, regions: List[Region]):
+    """
+    Assigns the collection of Regions, discarding any
+    columns not yet constructed into Regions.
+
+    Args:
+      regions:  The collection of Regions.
+    """
+    self._pending = None
+    self._regions = regions
+
+  def _build_pending(self):
+    """
+    Construct the Regions from the columnar representation
+    and the pending Region data properties.
+    """
+    columns, data = self._columns, self._pending
+
+    self._pending = None
+    self._regions = [Region(lower, upper, id=rid, dimension=self.dimension, **data.get(rid, {}))
+                     for rid, lower, upper in zip(columns['id'].tolist(),
+                                                  columns['lower'].tolist(),
+                                                  columns['upper'].tolist())]
+
   @property
   def _instance_invariant(self) -> bool:
     """
@@ -103,6 +175,10 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       True: If instance invariant holds
       False: Otherwise.
     """
+    # Columns not yet constructed were checked over all Regions at once
+    if self._pending is not None:
+      return True
+
     return all([all([isinstance(r, Region),
                      r.dimension == self.dimension,
                      self.bounds == None or self.bounds.encloses(r)]) \
@@ -116,6 +192,9 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     Returns:
       The number of Regions in this collection.
     """
+    if self._pending is not None:
+      return len(self._columns)
+
     return len(self.regions)
 
   @property
@@ -150,6 +229,32 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     assert self._instance_invariant
     return self.minbounds if self.bounds == None else self.bounds
 
+  @property
+  def columns(self) -> ndarray:
+    """
+    The columnar representation of the Regions within this collection:
+    a NumPy record array with an 'id' field and (n, d) float64 'lower' and
+    'upper' fields, in the same order as the Regions. If this collection was
+    loaded from a columnar file, returns the (memory-mapped) loaded array,
+    until a Region is added. Otherwise, builds a new array on each access.
+
+    Note:
+      The loaded array is not updated when the
+      Regions are modified in place.
+
+    Returns:
+      The columnar representation of the Regions.
+    """
+    if hasattr(self, '_columns'):
+      return self._columns
+
+    idlength = max([len(r.id) for r in self.regions], default=1)
+    dtype = [('id', f'<U{idlength}'),
+             ('lower', '<f8', (self.dimension,)),
+             ('upper', '<f8', (self.dimension,))]
+
+    return array([(r.id, r.lower, r.upper) for r in self.regions], dtype=dtype)
+
   @property
   def timeline(self) -> 'RegionTimeln':
     """
@@ -233,6 +338,10 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       An Iterator over this collection of Regions,
       as Region unique identifiers.
     """
+    if self._pending is not None:
+      yield from self._columns['id'].tolist()
+      return
+
     for region in self.regions:
       yield region.id
 
@@ -267,6 +376,9 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
 
     self.regions.append(region)
 
+    if hasattr(self, '_columns'):
+      del self._columns
+
   def streamadd(self, regions: Iterable[Region]):
     """
     Add all of the Regions returned from the Iterable.
@@ -351,7 +463,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
   def shuffle(self, random: RandomFn = Randoms.uniform()) -> 'RegionSet':
     """
     Clone this collection of Regions and returns the
-    copied and shuffled collection of Regions.
+    copied and shuffled collection of Regions, ordered
+    by one random value drawn for each Region.
 
     Args:
       random:   The random number generator.
@@ -361,7 +474,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       this collection of the Regions.
     """
     regions = self.copy()
-    shuffle(regions.regions, random=random)
+    order   = argsort(random(len(regions.regions)), kind='stable')
+    regions.regions = [regions.regions[i] for i in order.tolist()]
     return regions
 
   ### Methods: Queries
@@ -398,6 +512,10 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       True:   If Region exists within this RegionSet.
       False:  Otherwise.
     """
+    if self._pending is not None:
+      value = value.id if isinstance(value, Region) else value
+      return bool((self._columns['id'] == value).any())
+
     return self.get(value.id if isinstance(value, Region) \
                              else value) != None
 
@@ -539,14 +657,147 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
 
   ### CLass Methods: Generators
 
+  @classmethod
+  def _random_chunk(cls, bounds: Region, start: int, count: int,
+                         base26_ids: bool, idlength: int,
+                         generator: Generator, kwargs: Dict) -> ndarray:
+    """
+    Randomly generate the columnar representation of a chunk of N Regions,
+    numbered from the given offset, drawn from the given random number
+    generator. The position and size random number generators given by name
+    are resolved with Randoms.get, and bound to the random number generator.
+
+    Args:
+      bounds:     The bounding Region that all randomly
+                  generated Regions must be enclosed by.
+      start:      The offset of the first Region in the chunk.
+      count:      The number of Regions in the chunk.
+      base26_ids: Whether or not the randonly generated
+                  Regions will be assign numeric IDs,
+                  encoded in Base26 (A - Z).
+      idlength:   The maximum length of the Region IDs.
+      generator:  The random number generator, or None for
+                  the global random number generator.
+      kwargs:     Additional arguments passed through to
+                  Region.random_bounds.
+
+    Returns:
+      The columnar representation of the chunk
+      of randomly generated Regions.
+    """
+    kwargs = dict(kwargs)
+    for rng in ['posnrng', 'sizerng']:
+      if isinstance(kwargs.get(rng, 'uniform'), str):
+        kwargs[rng] = Randoms.get(kwargs.get(rng, 'uniform'), generator=generator)
+
+    dimension = bounds.dimension
+    lowers, uppers = bounds.random_bounds(count, **kwargs)
+
+    # Check that the bounds enclose all Regions at once, instead of per Region
+    assert (lowers >= bounds.lower).all() and (uppers <= bounds.upper).all()
+
+    columns = empty(count, dtype=[('id', f'<U{idlength}'),
+                                  ('lower', '<f8', (dimension,)),
+                                  ('upper', '<f8', (dimension,))])
+    if base26_ids:
+      columns['id'] = [to_base26(start + n + 1) for n in range(count)]
+    elif generator is not None:
+      columns['id'] = [str(UUID(bytes=generator.bytes(16), version=4)) for _ in range(count)]
+    else:
+      columns['id'] = [str(uuid4()) for _ in range(count)]
+    columns['lower'] = lowers
+    columns['upper'] = uppers
+
+    return columns
+
+  @classmethod
+  def random_chunks(cls, nregions: int, bounds: Region,
+                         chunksize: int = None, base26_ids: bool = True,
+                         generator: Generator = None, seed: int = None,
+                         jobs: int = 1, **kwargs) -> Iterator[ndarray]:
+    """
+    Randomly generate N Regions in fixed-size chunks, as the columnar
+    representation of each chunk of Regions (as given by RegionSet.columns).
+    No Region objects are constructed. All randomly generated Regions must be
+    enclosed by the given bounding Region.
+
+    Without a seed, the chunks are drawn in order from the given random
+    number generator (or the global random number generator). With a seed,
+    each chunk is drawn from its own independent stream, spawned from the
+    seed (as given by Randoms.stream), so that the chunks can be generated
+    in parallel by the given number of worker processes, in order, with at
+    most twice as many chunks as workers held in memory. The same seed and
+    chunk size generate the same Regions, regardless of the number of
+    workers. The position and size random number generators must then be
+    given by name (see Randoms.list), to be bound to each stream.
+
+    Args:
+      nregions:   The number of Regions to be generated.
+      bounds:     The bounding Region that all randomly
+                  generated Regions must be enclosed by.
+      chunksize:  The number of Regions per chunk, or None
+                  for RegionSet.RandomChunkSize.
+      base26_ids: Whether or not the randonly generated
+                  Regions will be assign numeric IDs,
+                  encoded in Base26 (A - Z).
+      generator:  The random number generator, or None for
+                  the global random number generator.
+      seed:       The master seed of the independent random
+                  number generator streams of each chunk.
+                  Drawn at random, if None and jobs > 1.
+      jobs:       The number of worker processes.
+      kwargs:     Additional arguments passed through to
+                  Region.random_bounds (sizepc, posnrng,
+                  sizerng and precision).
+
+    Returns:
+      An iterator of the columnar representation
+      of each chunk of randomly generated Regions.
+    """
+    chunksize = chunksize or cls.RandomChunkSize
+
+    assert isinstance(nregions, int) and nregions > 0
+    assert isinstance(chunksize, int) and chunksize > 0
+    assert isinstance(jobs, int) and jobs > 0
+
+    if seed is None and jobs > 1:
+      seed = SeedSequence().entropy
+    if seed is not None:
+      assert generator is None
+      assert all(isinstance(kwargs.get(rng, ''), str) for rng in ['posnrng', 'sizerng'])
+
+    idlength = len(to_base26(nregions)) if base26_ids else len(str(uuid4()))
+    starts   = range(0, nregions, chunksize)
+    chunks   = ((start, min(chunksize, nregions - start),
+                 generator if seed is None else Randoms.stream(seed, index))
+                for index, start in enumerate(starts))
+
+    if jobs == 1:
+      for start, count, rng in chunks:
+        yield cls._random_chunk(bounds, start, count, base26_ids, idlength, rng, kwargs)
+      return
+
+    with ProcessPoolExecutor(jobs) as executor:
+      pending = deque()
+      for start, count, rng in chunks:
+        pending.append(executor.submit(cls._random_chunk, bounds, start, count,
+                                       base26_ids, idlength, rng, kwargs))
+        if len(pending) >= 2 * jobs:
+          yield pending.popleft().result()
+      while len(pending) > 0:
+        yield pending.popleft().result()
+
   @classmethod
   def from_random(cls, nregions: int, bounds: Region,
                        id: str = '', base26_ids: bool = True,
-                       **kwargs) -> 'RegionSet':
+                       chunksize: int = None, **kwargs) -> 'RegionSet':
     """
     Construct a new RegionSet with N randomly generated Regions. All randomly
     generated Regions must be enclosed by the given bounding Region. All
     subregions must have the same number of dimensions as the bounding Region.
+    The lower and upper bounds of the Regions are generated in chunks, as
+    given by RegionSet.random_chunks (as a single chunk, unless seeded), and
+    are kept as RegionSet.columns.
 
     Args:
       nregions:   The number of Regions to be generated.
@@ -556,20 +807,33 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       base26_ids: Whether or not the randonly generated
                   Regions will be assign numeric IDs,
                   encoded in Base26 (A - Z).
+      chunksize:  The number of Regions per chunk, if seeded,
+                  or None for RegionSet.RandomChunkSize.
       kwargs:     Additional arguments passed through to
-                  Region.from_intervals.
+                  RegionSet.random_chunks (generator, seed
+                  and jobs) or Region.random_bounds (sizepc,
+                  posnrng, sizerng and precision) or
+                  otherwise, to Region.__init__.
 
     Returns:
       The newly generated RegionSet.
     """
     assert isinstance(nregions, int) and nregions > 0
 
+    generate  = ['generator', 'seed', 'jobs', 'sizepc', 'posnrng', 'sizerng', 'precision']
+    randomkw  = dict((k, kwargs.pop(k)) for k in generate if k in kwargs)
+    seeded    = randomkw.get('seed') is not None or randomkw.get('jobs', 1) > 1
+    chunksize = chunksize if seeded else nregions
+    dimension = bounds.dimension
+    columns   = concatenate(list(cls.random_chunks(nregions, bounds, chunksize,
+                                                   base26_ids, **randomkw)))
+
     regionset = cls(id, bounds)
-    regions = bounds.random_regions(nregions, **kwargs)
-    for n, region in enumerate(regions):
-      if base26_ids:
-        region.id = to_base26(n + 1)
-      regionset.add(region)
+    regionset.regions = [Region(lower, upper, id=rid, dimension=dimension, **kwargs)
+                         for rid, lower, upper in zip(columns['id'].tolist(),
+                                                      columns['lower'].tolist(),
+                                                      columns['upper'].tolist())]
+    regionset._columns = columns
 
     return regionset
 
@@ -631,6 +895,58 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     else:
       return asdict(object)
 
+  @classmethod
+  def to_chunks(cls, object: 'RegionSet', encoder: IOableEncoder,
+                     level: int, **kwargs) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given RegionSet object, writing
+    each Region directly, without the deep copies made by to_object or
+    dataclasses.asdict.
+    Produces the same JSON text as encoding the object generated by
+    to_object.
+
+    Overrides:
+      IOable.to_chunks
+
+    Args:
+      object:   The RegionSet to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      kwargs:   Additional arguments or options to customize
+                and tweak the JSON text generation process.
+
+    kwargs:
+      compact:
+        Boolean flag for whether or not the data
+        representation of the output JSON is a compact,
+        abbreviated representation or the full data
+        representation with all fields.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    assert isinstance(object, RegionSet)
+
+    fieldnames = ['id', 'dimension', 'length', 'bounds', 'regions']
+
+    def asdict_chunks(value: Any, level: int) -> Iterator[str]:
+      text = None
+      if isinstance(value, Region):
+        text = Region.to_asdict_text(value, encoder, level)
+      if text is not None:
+        yield text
+      elif isinstance(value, List):
+        yield from encoder.list_chunks(value, level, asdict_chunks)
+      else:
+        yield from encoder.asdict_chunks(value, level)
+
+    if 'compact' in kwargs and kwargs['compact']:
+      items = map(lambda f: (f, getattr(object, f)), fieldnames)
+      yield from encoder.dict_chunks(items, level)
+    else:
+      items = map(lambda f: (f, getattr(object, f)), ['id', 'dimension', 'bounds', 'regions'])
+      yield from encoder.dict_chunks(items, level, asdict_chunks)
+
   @classmethod
   def from_dict(cls, object: Dict, id: str = '', refset: 'RegionSet' = None) -> 'RegionSet':
     """
@@ -643,8 +959,8 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       dimension (int)
 
     Note:
-    - Region-equivalent means parseable by
-      Region.from_object.
+    - Region-equivalent means a Region or
+      parseable by Region.from_object.
 
     Args:
       object:
@@ -691,7 +1007,9 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
       raise ValueError('Unrecognized RegionSet representation')
 
     for region in object['regions']:
-      regionset.add(Region.from_object(region))
+      if not isinstance(region, Region):
+        region = Region.from_object(region)
+      regionset.add(region)
 
     if isinstance(refset, RegionSet):
       assert regionset.dimension == refset.dimension
@@ -734,9 +1052,503 @@ class RegionSet(Iterable[Region], abc.Container, abc.Sized, IOable):
     if isinstance(object, Dict):
       return cls.from_dict(object, **kwargs)
     elif isinstance(object, List):
+      if len(object) == 0:
+        raise ValueError('RegionSet representation as a List must have Regions')
       regions = list(map(Region.from_object, object))
       dimension = regions[0].dimension
       assert all([r.dimension == dimension for r in regions])
       return cls.from_dict({'regions': regions, 'dimension': dimension}, **kwargs)
     else:
       raise ValueError('Unrecognized RegionSet representation')
+
+  @classmethod
+  def from_stream(cls, source: TextIOBase, compression: str = None, **kwargs) -> 'RegionSet':
+    """
+    Construct a new RegionSet from the JSON text from the given text input
+    source, parsing the 'regions' array incrementally. Each Region is
+    constructed as soon as it is parsed, so memory stays proportional to
+    the resulting RegionSet rather than the JSON text or its object tree.
+
+    Overrides:
+      IOable.from_stream
+
+    Args:
+      source:
+        The input source whose JSON content is
+        to be converted into a RegionSet.
+      compression:
+        The compression format: 'gzip', 'bz2', 'lzma',
+        'infer' from the input file name or None.
+      kwargs:
+        Additional arguments to be passed to
+        RegionSet.from_dict.
+
+    Returns:
+      The newly constructed RegionSet.
+
+    Raises:
+      ValueError:
+        If the JSON content is not a RegionSet
+        representation.
+    """
+    if compression is not None:
+      with compressed(source, 'r', compression) as source:
+        return cls.from_stream(source, **kwargs)
+
+    stream  = JSONStream(source)
+    regions = lambda: [Region.from_object(stream.value()) for _ in stream.elements()]
+    object  = {}
+
+    if stream.peek() == '[':
+      object['regions'] = regions()
+      if len(object['regions']) == 0:
+        raise ValueError('RegionSet representation as a List must have Regions')
+      object['dimension'] = object['regions'][0].dimension
+    else:
+      for key in stream.members():
+        object[key] = regions() if key == 'regions' else stream.value()
+
+    return cls.from_dict(object, **kwargs)
+
+  @classmethod
+  def to_columnar(cls, object: 'RegionSet', path: str):
+    """
+    Outputs the given RegionSet object to the given file path in the columnar
+    NumPy (.npy) file format. The Regions are stored as a NumPy record array
+    of the Region IDs and the lower and upper bounds of the Regions, as given
+    by RegionSet.columns, which can be memory-mapped when loaded. The
+    RegionSet ID, dimension, bounds and the Region data properties are stored
+    in a JSON sidecar file, alongside with the '.meta.json' extension.
+
+    Args:
+      object:   The RegionSet object to serialize.
+      path:     The file path to serialize the object to.
+    """
+    assert isinstance(object, RegionSet)
+    assert isinstance(path, str)
+
+    metadata = {
+      'id': object.id,
+      'dimension': object.dimension,
+      'bounds': object.bounds,
+      'data': {}
+    }
+
+    for region in object.regions:
+      data = Region.to_object(region, compact=True).get('data')
+      if data is not None:
+        metadata['data'][region.id] = data
+
+    with open(path, 'wb') as output:
+      save(output, object.columns, allow_pickle=False)
+    with open(cls.columnar_metapath(path), 'w') as output:
+      IOable.to_output(metadata, output, options={'compact': True})
+
+  @classmethod
+  def to_columnar_chunks(cls, chunks: Iterable[ndarray], path: str,
+                              length: int, metadata: Dict):
+    """
+    Outputs the given chunks of the columnar representation of Regions (as
+    given by RegionSet.random_chunks) to the given file path in the columnar
+    NumPy (.npy) file format, one chunk at a time. The NumPy header is
+    written upfront for the given total number of Regions, so that the
+    Regions are never held in memory at once. The given metadata (the
+    RegionSet ID, dimension, bounds and Region data properties) is stored
+    in the JSON sidecar file, as in RegionSet.to_columnar.
+
+    Args:
+      chunks:   The chunks of the columnar representation
+                of the Regions to serialize.
+      path:     The file path to serialize the Regions to.
+      length:   The total number of Regions in all chunks.
+      metadata: The RegionSet ID, dimension, bounds and
+                Region data properties.
+    """
+    assert isinstance(path, str)
+    assert isinstance(length, int) and length > 0
+
+    count = 0
+    with open(path, 'wb') as output:
+      for columns in chunks:
+        if count == 0:
+          write_array_header_1_0(output, {'descr': dtype_to_descr(columns.dtype),
+                                          'fortran_order': False, 'shape': (length,)})
+        columns.tofile(output)
+        count += len(columns)
+
+    assert count == length
+
+    with open(cls.columnar_metapath(path), 'w') as output:
+      IOable.to_output(metadata, output, options={'compact': True})
+
+  @classmethod
+  def columnar_metapath(cls, path: str) -> str:
+    """
+    Returns the file path of the JSON sidecar file for the
+    given file path in the columnar NumPy (.npy) file format.
+
+    Args:
+      path:   The file path in the columnar file format.
+
+    Returns:
+      The file path of the JSON sidecar file.
+    """
+    return f'{splitext(path)[0]}.meta.json'
+
+  @classmethod
+  def is_columnar(cls, source: Union[str, BufferedIOBase, TextIOBase]) -> bool:
+    """
+    Determine if the given input file path or input source is in the columnar
+    NumPy (.npy) file format, by inspecting its leading bytes without
+    consuming them.
+
+    Args:
+      source:   The input file path or input source.
+
+    Returns:
+      True:   If the input is in the columnar file format.
+      False:  Otherwise.
+    """
+    magic = cls.ColumnarMagic
+
+    if isinstance(source, str):
+      with open(source, 'rb') as f:
+        return f.read(len(magic)) == magic
+
+    source = getattr(source, 'buffer', source)
+    if hasattr(source, 'peek'):
+      return source.peek(len(magic))[:len(magic)] == magic
+
+    return False
+
+  @classmethod
+  def from_columnar(cls, path: str, mmap: bool = True, **kwargs) -> 'RegionSet':
+    """
+    Construct a new RegionSet object from the given file path in the
+    columnar NumPy (.npy) file format and its JSON sidecar file. Memory-maps
+    the record array of the Regions instead of reading it, which remains
+    available as RegionSet.columns.
+
+    Args:
+      path:     The file path in the columnar file format.
+      mmap:     Boolean flag whether or not to memory-map
+                the record array of the Regions.
+      kwargs:   Additional arguments to be passed to
+                RegionSet.from_dict.
+
+    Returns:
+      The newly constructed RegionSet.
+
+    Raises:
+      ValueError: If input is not in the columnar file format.
+    """
+    assert isinstance(path, str) and isfile(path)
+
+    if not cls.is_columnar(path):
+      raise ValueError(f'Unsupported columnar input format')
+
+    columns  = load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+    metadata = {}
+
+    if isfile(cls.columnar_metapath(path)):
+      with open(cls.columnar_metapath(path), 'r') as source:
+        metadata = JSONLoader(source)
+
+    return cls.from_columns(columns, metadata, **kwargs)
+
+  @classmethod
+  def from_columns(cls, columns: ndarray, metadata: Dict = {}, **kwargs) -> 'RegionSet':
+    """
+    Construct a new RegionSet object from the given columnar representation
+    of the Regions, as given by RegionSet.columns, and the given metadata:
+    the RegionSet ID, dimension, bounds and the mapping of Region IDs to
+    Region data properties. The given array is kept, without copying, as
+    RegionSet.columns, and the Regions are only constructed from it when first
+    accessed, unless their data properties link to other Regions.
+
+    Args:
+      columns:  The columnar representation of the Regions.
+      metadata: The RegionSet ID, dimension, bounds and
+                Region data properties.
+      kwargs:   Additional arguments to be passed to
+                RegionSet.from_dict.
+
+    Returns:
+      The newly constructed RegionSet.
+    """
+    assert columns.dtype.names == ('id', 'lower', 'upper')
+
+    data      = metadata.get('data', {})
+    dimension = metadata.get('dimension', columns.dtype['lower'].shape[0])
+    linked    = any(['intersect' in d or 'union' in d for d in data.values()])
+    regions   = []
+
+    assert dimension == columns.dtype['lower'].shape[0]
+
+    # Backlinks amongst the Regions are resolved by RegionSet.from_dict
+    if linked:
+      for rid, lower, upper in zip(columns['id'].tolist(),
+                                   columns['lower'].tolist(),
+                                   columns['upper'].tolist()):
+        regions.append(Region(lower, upper, id=rid, **data.get(rid, {})))
+
+    object    = {'regions': regions, 'dimension': dimension}
+    regionset = cls.from_dict(object, **{'id': metadata.get('id', ''), **kwargs})
+
+    # Check that the bounds enclose all Regions over the columns at once
+    if metadata.get('bounds') is not None:
+      bounds = Region.from_object(metadata['bounds'])
+      assert bounds.dimension == dimension
+      assert (columns['lower'] >= bounds.lower).all()
+      assert (columns['upper'] <= bounds.upper).all()
+      regionset.bounds = bounds
+
+    regionset._columns = columns
+    if not linked:
+      regionset._pending = data
+
+    return regionset
+
+  @classmethod
+  def to_lines(cls, object: 'RegionSet', output: TextIOBase):
+    """
+    Outputs the given RegionSet object to the given output stream in the
+    line-delimited JSON (JSON Lines) format: a header line with the RegionSet
+    ID, dimension and bounds, followed by one line per Region in the
+    compact JSON representation.
+
+    Args:
+      object:   The RegionSet object to serialize.
+      output:   The output stream to serialize the object to.
+    """
+    assert isinstance(object, RegionSet)
+    assert output.writable()
+
+    options = {'compact': True}
+    header  = {'id': object.id, 'dimension': object.dimension,
+               'length': object.length, 'bounds': object.bounds}
+
+    IOable.to_output({'header': header}, output, options=options, indent=None)
+    output.write('\n')
+
+    for region in object.regions:
+      Region.to_output(region, output, options=options, indent=None)
+      output.write('\n')
+
+  @classmethod
+  def to_lines_chunks(cls, chunks: Iterable[ndarray], output: TextIOBase, header: Dict):
+    """
+    Outputs the given chunks of the columnar representation of Regions (as
+    given by RegionSet.random_chunks) to the given output stream in the
+    line-delimited JSON (JSON Lines) format, one chunk at a time: the given
+    header line with the RegionSet ID, dimension, length and bounds, followed
+    by one line per Region, as in RegionSet.to_lines.
+
+    Args:
+      chunks:   The chunks of the columnar representation
+                of the Regions to serialize.
+      output:   The output stream to serialize the Regions to.
+      header:   The RegionSet ID, dimension, length and bounds.
+    """
+    assert output.writable()
+
+    options = {'compact': True}
+
+    IOable.to_output({'header': header}, output, options=options, indent=None)
+    output.write('\n')
+
+    for columns in chunks:
+      for rid, lower, upper in zip(columns['id'].tolist(),
+                                   columns['lower'].tolist(),
+                                   columns['upper'].tolist()):
+        Region.to_output(Region(lower, upper, id=rid), output, options=options, indent=None)
+        output.write('\n')
+
+  @classmethod
+  def is_lines(cls, source: Union[str, TextIOBase]) -> bool:
+    """
+    Determine if the given input file path or input source is in the
+    line-delimited JSON (JSON Lines) format, by its file extension:
+    '.jsonl' or '.ndjson', optionally followed by a compression extension.
+
+    Args:
+      source:   The input file path or input source.
+
+    Returns:
+      True:   If the input is in the line-delimited format.
+      False:  Otherwise.
+    """
+    path = source if isinstance(source, str) else getattr(source, 'name', None)
+
+    if not isinstance(path, str):
+      return False
+    if compression_of(path) is not None:
+      path = splitext(path)[0]
+
+    return splitext(path)[1].lower() in cls.LinesExtensions
+
+  @classmethod
+  def _parse_lines(cls, lines: Iterable[Union[str, bytes]]) -> RegionColumnsChunk:
+    """
+    Parse and validate the given lines of line-delimited JSON into the
+    bounds of the Regions as arrays, without constructing the Regions.
+    Lines in the 'dimensions' representation with [lower, upper] pairs (as
+    output by RegionSet.to_lines) are read directly; any other Region
+    representation is parsed by Region.from_object. Header lines update
+    the metadata.
+
+    Args:
+      lines:  The lines of line-delimited JSON.
+
+    Returns:
+      The metadata, Region IDs, lower and upper bounds
+      of the Regions and the Region data properties.
+
+    Raises:
+      ValueError: If the bounds are not numeric or do not have
+                  the same number of dimensions.
+    """
+    header, ids, bounds, data = {}, [], [], {}
+
+    for line in lines:
+      if len(line.strip()) == 0:
+        continue
+
+      object = JSONParse(line)
+      if isinstance(object, Dict) and 'header' in object:
+        header.update(object['header'])
+        continue
+
+      if isinstance(object, Dict) and isinstance(object.get('dimensions'), List) and \
+         all([isinstance(i, List) for i in object['dimensions']]):
+        rid, regiondata = object.get('id', ''), object.get('data', {})
+        dimensions = object['dimensions']
+        assert isinstance(rid, str) and isinstance(regiondata, Dict)
+        assert len(dimensions) > 0
+        assert object.get('dimension', len(dimensions)) == len(dimensions)
+        rid = rid if len(rid) > 0 else str(uuid4())
+        regiondata = dict((k, v) for k, v in regiondata.items() if not k.startswith('_'))
+      else:
+        region = Region.from_object(object)
+        rid, dimensions = region.id, [[i.lower, i.upper] for i in region.dimensions]
+        regiondata = Region.to_object(region, compact=True).get('data', {})
+
+      ids.append(rid)
+      bounds.append(dimensions)
+      if len(regiondata) > 0:
+        data[rid] = regiondata
+
+    if len(bounds) == 0:
+      return (header, ids, empty((0, 0), dtype='<f8'), empty((0, 0), dtype='<f8'), data)
+
+    # Check the bounds over all of the lines at once
+    try:
+      bounds = array(bounds)
+    except ValueError:
+      raise ValueError('Regions must have the same number of dimensions')
+    if bounds.ndim != 3 or bounds.shape[2] != 2 or bounds.dtype.kind not in 'biuf':
+      raise ValueError('Region bounds must be numeric [lower, upper] pairs')
+
+    bounds = bounds.astype('<f8')
+    return (header, ids, bounds.min(axis=2), bounds.max(axis=2), data)
+
+  @classmethod
+  def _parse_range(cls, path: str, start: int, end: int) -> RegionColumnsChunk:
+    """
+    Parse and validate the lines of line-delimited JSON that begin within
+    the given byte range of the given file, into the bounds of the Regions
+    as arrays. A line that spans the start of the byte range belongs to the
+    preceding byte range.
+
+    Args:
+      path:   The file path in the line-delimited format.
+      start:  The first byte offset of the byte range.
+      end:    The byte offset after the byte range.
+
+    Returns:
+      The metadata, Region IDs, lower and upper bounds
+      of the Regions and the Region data properties.
+    """
+    with open(path, 'rb') as source:
+      position = start
+      if start > 0:
+        source.seek(start - 1)
+        position += len(source.readline()) - 1
+
+      def lines() -> Iterator[bytes]:
+        nonlocal position
+        while position < end:
+          line = source.readline()
+          if len(line) == 0:
+            return
+          position += len(line)
+          yield line
+
+      return cls._parse_lines(lines())
+
+  @classmethod
+  def from_lines(cls, source: Union[str, TextIOBase], jobs: int = 1, **kwargs) -> 'RegionSet':
+    """
+    Construct a new RegionSet object from the given input file path or input
+    source in the line-delimited JSON (JSON Lines) format. If jobs is greater
+    than one and the input is an uncompressed file on disk, splits the file
+    into byte ranges that are parsed and validated in parallel by worker
+    processes, and concatenates the resulting bounds in order. The Regions
+    are stored in the same order as in the input, and the bounds are kept as
+    RegionSet.columns, from which the Regions are constructed on first access.
+
+    Args:
+      source:   The input file path or input source.
+      jobs:     The number of worker processes.
+      kwargs:   Additional arguments to be passed to
+                RegionSet.from_dict.
+
+    Returns:
+      The newly constructed RegionSet.
+
+    Raises:
+      ValueError: If the input has no Regions or dimension.
+    """
+    assert isinstance(jobs, int) and jobs > 0
+
+    path = source if isinstance(source, str) else getattr(source, 'name', None)
+
+    if jobs > 1 and isinstance(path, str) and isfile(path) and \
+       compression_of(path) is None and not is_compressed(source):
+      size   = getsize(path)
+      starts = [size * i // jobs for i in range(jobs)]
+      ends   = starts[1:] + [size]
+      with ProcessPoolExecutor(jobs) as executor:
+        chunks = list(executor.map(cls._parse_range, [path] * jobs, starts, ends))
+    elif isinstance(source, str):
+      with open_compressed(source, 'r') as source:
+        chunks = [cls._parse_lines(source)]
+    else:
+      chunks = [cls._parse_lines(source)]
+
+    header, ids, data = {}, [], {}
+    for chunkheader, chunkids, _, _, chunkdata in chunks:
+      header.update(chunkheader)
+      ids.extend(chunkids)
+      data.update(chunkdata)
+
+    bounds = [(lowers, uppers) for _, chunkids, lowers, uppers, _ in chunks if len(chunkids) > 0]
+    if len(bounds) == 0:
+      raise ValueError('Unrecognized RegionSet representation')
+
+    lowers    = concatenate([lowers for lowers, _ in bounds])
+    uppers    = concatenate([uppers for _, uppers in bounds])
+    dimension = lowers.shape[1]
+    idlength  = max(map(len, ids))
+    columns   = empty(len(ids), dtype=[('id', f'<U{idlength}'),
+                                       ('lower', '<f8', (dimension,)),
+                                       ('upper', '<f8', (dimension,))])
+
+    columns['id']    = ids
+    columns['lower'] = lowers
+    columns['upper'] = uppers
+
+    metadata = {'id': header.get('id', ''), 'dimension': dimension,
+                'bounds': header.get('bounds'), 'data': data}
+
+    return cls.from_columns(columns, metadata, **kwargs)
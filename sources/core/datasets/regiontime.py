@@ -19,7 +19,7 @@ from enum import IntEnum, auto, unique
 from functools import total_ordering
 from typing import Iterator, List, Union
 
-from sortedcontainers import SortedList
+from numpy import argsort, concatenate, empty, full, lexsort, where
 
 from sources.abstract import MdTEvent, MdTimeline, Timeline
 
@@ -217,7 +217,10 @@ class RegionTimeln(MdTimeline[Region]):
     """
     Returns an iterator of sorted RegionEvents generated from a set of
     RegionSet along a given dimension. Each Region maps to two RegionEvents:
-    a beginning RegionEvent and a ending RegionEvent.
+    a beginning RegionEvent and a ending RegionEvent. The RegionEvents are
+    sorted in bulk over the columnar representation of the Regions, in the
+    same order as defined by RegionEvent.__lt__, and are only constructed
+    as they are iterated over.
 
     Args:
       dimension:
@@ -229,13 +232,34 @@ class RegionTimeln(MdTimeline[Region]):
     """
     assert 0 <= dimension < self.regions.dimension
 
+    bbox    = self.regions.bbox
+    regions = self.regions.regions
+    columns = self.regions.columns
+    count   = len(columns)
+
+    lowers  = columns['lower'][:, dimension]
+    uppers  = columns['upper'][:, dimension]
+    nonzero = where(lowers == uppers, 0, 1)
+    idrank  = empty(count, dtype=int)
+    idrank[argsort(columns['id'], kind='stable')] = range(count)
+
+    # Begin events at [0, count), End events at [count, 2 * count)
+    when  = concatenate((lowers, uppers))
+    order = concatenate((nonzero, -nonzero))
+    kind  = concatenate((full(count, int(RegionEvtKind.Begin)),
+                         full(count, int(RegionEvtKind.End))))
+    ranks = concatenate((idrank, idrank))
+    perm  = lexsort((kind, ranks, order, when))
+
     def _events() -> Iterator[RegionEvent]:
-      bbox = self.regions.bbox
       yield RegionEvent(RegionEvtKind.Init, bbox, dimension)
-      yield RegionEvent(RegionEvtKind.Done, bbox, dimension)
 
-      for region in self.regions:
-        yield RegionEvent(RegionEvtKind.Begin, region, dimension)
-        yield RegionEvent(RegionEvtKind.End,   region, dimension)
+      for i in perm.tolist():
+        if i < count:
+          yield RegionEvent(RegionEvtKind.Begin, regions[i], dimension)
+        else:
+          yield RegionEvent(RegionEvtKind.End, regions[i - count], dimension)
+
+      yield RegionEvent(RegionEvtKind.Done, bbox, dimension)
 
-    return iter(SortedList(_events()))
+    return _events()
@@ -19,18 +19,38 @@ Note:
     It is more general. An overlap is an intersect,
     but an intersect is not an overlap.
 
+  Besides JSON, provides a compact binary RIG file format,
+  storing the Region bounds as arrays and the overlaps as CSR
+  index arrays, which can be memory-mapped when loaded. Only
+  the header is parsed when loaded; the NetworkX graph is built
+  from the arrays on first access.
+
+  Besides the NetworkX node_link and adjacency JSON formats,
+  provides a compact 'node_index' JSON format, storing each
+  node once and each edge as a pair of node indices. The
+  intersecting Regions are recomputed on demand when loaded.
+
 Classes:
 - NxGraph
 """
 
-from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+from io import BufferedIOBase, TextIOBase
+from itertools import chain
+from json import dumps as JSONDump
+from json import loads as JSONParse
+from os.path import isfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 from uuid import uuid4
 
 from networkx import networkx as nx
+from numpy import arange, array, bincount, cumsum, frombuffer, lexsort
+from numpy import memmap, prod, repeat, searchsorted, uint8, zeros
 from networkx.readwrite import json_graph
 
-from sources.abstract import IOable
+from sources.abstract import IOable, IOableEncoder
+from sources.helpers import JSONStream, compressed, is_compressed
 
+from ..datasets import RegionIndex
 from ..shapes import Region, RegionId, RegionIdPair, RegionPair
 from .rigraph import RIGraph
 
@@ -50,9 +70,25 @@ class NxGraph(RIGraph[nx.Graph], IOable):
                   associated with each node.
     EdgeRegion:   The data property for the intersecting
                   Region associated with each node.
+    BinaryMagic:  The leading bytes that identify the
+                  binary RIG file format.
+
+  Note:
+    Once the spatial index is built, changes made directly
+    to the underlying NetworkX graph (self.G) bypass it and
+    do not increment the version counter. Use put_region,
+    put_overlap, insert_region(s), remove_region(s) or
+    del self[key] to keep both consistent.
+
+    When loaded from the binary RIG file format, the
+    NetworkX graph is built from the loaded arrays on
+    first access of self.G. Until then, the size, node and
+    edge membership and Region lookups are answered from
+    the arrays directly.
   """
-  NodeRegion = 'region'
-  EdgeRegion = 'intersect'
+  NodeRegion  = 'region'
+  EdgeRegion  = 'intersect'
+  BinaryMagic = b'\x93NXRIG\x01\n'
 
   def __init__(self, dimension: int, graph: nx.Graph = None, id: str = ''):
     """
@@ -75,7 +111,9 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     assert graph == None or isinstance(graph, nx.Graph)
 
     self.dimension = dimension
+    self.version = 0
     self.id = id = id if len(id) > 0 else str(uuid4())
+    self._binary = None
 
     if graph == None:
       self.G = nx.Graph(id=id, dimension=dimension)
@@ -86,6 +124,34 @@ class NxGraph(RIGraph[nx.Graph], IOable):
 
   ### Properties: Getters
 
+  @property
+  def G(self) -> nx.Graph:
+    """
+    The internal NetworkX graph of intersecting or overlapping Regions.
+    If loaded from the binary RIG file format, builds the nodes and edges
+    from the loaded arrays on first access.
+
+    Returns:
+      The internal NetworkX graph.
+    """
+    if self._binary is not None:
+      self._build_binary()
+
+    return self._G
+
+  @G.setter
+  def G(self, graph: nx.Graph):
+    """
+    Assigns the internal NetworkX graph of intersecting
+    or overlapping Regions, discarding any arrays loaded
+    from the binary RIG file format not yet built.
+
+    Args:
+      graph:  The internal NetworkX graph.
+    """
+    self._binary = None
+    self._G = graph
+
   @property
   def regions(self) -> Iterator[Tuple[str, Region, Dict]]:
     """
@@ -118,14 +184,95 @@ class NxGraph(RIGraph[nx.Graph], IOable):
       Region IDs of the two Regions involved, and
       the edge's data properties.
     """
-    edgekey   = self.EdgeRegion
-    intersect = lambda d: d[edgekey] if edgekey in d else None
-
     for u, v, data in self.G.edges(data=True):
-      yield (u, v, intersect(data), data)
+      yield (u, v, self._intersect(u, v, data), data)
+
+  @property
+  def index(self) -> RegionIndex:
+    """
+    The spatial index over the Regions within the graph, for finding
+    the Regions that overlap with a given Region. Built from the nodes
+    within the graph on first access, and kept up to date afterwards.
+
+    Returns:
+      The spatial index over the Regions
+      within the graph.
+    """
+    if not hasattr(self, '_index'):
+      self._index = RegionIndex([r for _, r, _ in self.regions if r is not None])
+
+    return self._index
 
   ### Methods: Private Helpers
 
+  def _binary_region(self, row: int) -> Region:
+    """
+    Retrieve the Region at the given row of the arrays loaded from
+    the binary RIG file format, constructing and caching it on first
+    retrieval, so that the built NetworkX graph shares the same Region.
+
+    Args:
+      row:  The row (node index) of the Region.
+
+    Returns:
+      The Region at the given row.
+    """
+    binary  = self._binary
+    regions = binary['regions']
+
+    if row not in regions:
+      rid = binary['ids'][row]
+      regions[row] = Region(binary['lowers'][row].tolist(),
+                            binary['uppers'][row].tolist(),
+                            id=rid, **binary['data'].get(rid, {}))
+
+    return regions[row]
+
+  def _binary_overlaps(self, u: int, v: int) -> bool:
+    """
+    Determine if the Regions at the given two rows of the arrays loaded
+    from the binary RIG file format overlap, by searching the sorted
+    CSR indices of the lower row for the higher row.
+
+    Args:
+      u, v:   The rows (node indices) of the two Regions.
+
+    Returns:
+      True:   If the two Regions overlap.
+      False:  Otherwise.
+    """
+    binary  = self._binary
+    u, v    = min(u, v), max(u, v)
+    start   = int(binary['indptr'][u])
+    end     = int(binary['indptr'][u + 1])
+    indices = binary['indices'][start:end]
+    i       = int(searchsorted(indices, v))
+
+    return i < len(indices) and int(indices[i]) == v
+
+  def _build_binary(self):
+    """
+    Builds the nodes and edges of the internal NetworkX graph from the
+    arrays loaded from the binary RIG file format, reusing any Regions
+    already constructed. The intersecting Regions of the edges are deferred
+    and recomputed on first access.
+    """
+    binary  = self._binary
+    ids     = binary['ids']
+    indptr  = binary['indptr']
+    rows    = repeat(arange(len(ids)), indptr[1:] - indptr[:-1])
+    nodes   = array(ids, dtype=str)
+    datakey = self.NodeRegion
+    edgekey = self.EdgeRegion
+
+    G = self._G
+    G.add_nodes_from([(rid, {datakey: self._binary_region(row)})
+                      for row, rid in enumerate(ids)])
+    G.add_edges_from(zip(nodes[rows].tolist(), nodes[binary['indices']].tolist()),
+                     **{edgekey: None})
+
+    self._binary = None
+
   def _convert(self, key: Union[RegionId, RegionIdPair]) -> Union[str, Tuple[str,str]]:
     """
     Converts the given Region or pair of Regions into the corresponding
@@ -146,6 +293,30 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     else:
       return regionid(key)
 
+  def _intersect(self, u: str, v: str, data: Dict) -> Region:
+    """
+    Retrieve the intersecting Region from the given edge's data properties.
+    Recomputes and stores the intersecting Region if it was deferred
+    (stored as None), as by from_binary.
+
+    Args:
+      u, v:   The Region IDs of the edge.
+      data:   The edge's data properties.
+
+    Returns:
+      The intersecting Region or None if the edge
+      has no intersecting Region.
+    """
+    edgekey = self.EdgeRegion
+
+    if edgekey not in data:
+      return None
+    if data[edgekey] is None:
+      a, b = self.region(u), self.region(v)
+      data[edgekey] = a.intersect(b, 'reference')
+
+    return data[edgekey]
+
   ### Methods: Queries
 
   def __getitem__(self, key: Union[RegionId, RegionIdPair]) -> Tuple[Region, Dict]:
@@ -177,7 +348,7 @@ class NxGraph(RIGraph[nx.Graph], IOable):
 
     if isinstance(key, Tuple):
       data = self.G.edges[key]
-      region = get(data, self.EdgeRegion)
+      region = self._intersect(*key, data)
     else:
       data = self.G.nodes[key]
       region = get(data, self.NodeRegion)
@@ -204,6 +375,10 @@ class NxGraph(RIGraph[nx.Graph], IOable):
       self.G.remove_edge(*key)
     else:
       self.G.remove_node(key)
+      if hasattr(self, '_index'):
+        self._index.remove(key)
+
+    self.version += 1
 
   def __len__(self) -> int:
     """
@@ -214,6 +389,9 @@ class NxGraph(RIGraph[nx.Graph], IOable):
       The number of Regions as nodes
       within this graph.
     """
+    if self._binary is not None:
+      return len(self._binary['ids'])
+
     return len(self.G)
 
   def __contains__(self, key: Union[RegionId, RegionIdPair]) -> bool:
@@ -235,11 +413,47 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     """
     key = self._convert(key)
 
+    if self._binary is not None:
+      rows = self._binary['rows']
+      if isinstance(key, Tuple):
+        return all([k in rows for k in key]) and \
+               self._binary_overlaps(rows[key[0]], rows[key[1]])
+      else:
+        return key in rows
+
     if isinstance(key, Tuple):
       return key in self.G.edges
     else:
       return key in self.G.nodes
 
+  def region(self, key: Union[RegionId, RegionIdPair]) -> Region:
+    """
+    Retrieve the Region or intersecting Region for the given Region ID or
+    pair of Region IDs. Returns None if Region or intersecting Region is not
+    contained as node or edge within the graph. Retrieves the Regions of
+    a graph loaded from the binary RIG file format without building the
+    NetworkX graph.
+
+    Overrides:
+      RIGraph.region
+
+    Args:
+      key:  The unique identifier for Region or
+            intersecting Region to be retrieved.
+
+    Returns:
+      The retrieved Region or intersecting Region.
+      None, if Region or intersecting Region is not
+      contained as node or edge within the graph.
+    """
+    key = self._convert(key)
+
+    if self._binary is not None and not isinstance(key, Tuple):
+      rows = self._binary['rows']
+      return self._binary_region(rows[key]) if key in rows else None
+
+    return super().region(key)
+
   ### Methods: Insertion
 
   def put_region(self, region: Region, **kwargs):
@@ -255,6 +469,10 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     """
     datakey = self.NodeRegion
     self.G.add_node(region.id, **{datakey: region})
+    self.version += 1
+
+    if hasattr(self, '_index'):
+      self._index.add(region)
 
   def put_overlap(self, overlap: RegionIdPair, intersect = True, **kwargs):
     """
@@ -304,6 +522,98 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     else:
       self.G.add_edge(a, b, intersect=intersect, **kwargs)
 
+    self.version += 1
+
+  ### Methods: Dynamic Maintenance
+
+  def insert_region(self, region: Region, **kwargs):
+    """
+    Add the given Region as a newly created node in the graph, and add
+    an edge between the new node and each of the Regions within the graph
+    that overlap with the given Region, found via the spatial index.
+    If a Region with the same ID is already within the graph, that Region
+    and its edges are replaced.
+
+    Args:
+      region:
+        The Region to be inserted.
+      kwargs:
+        Additional data properties to be added
+        to the newly created node.
+    """
+    assert isinstance(region, Region) and region.dimension == self.dimension
+
+    if region.id in self:
+      self.remove_region(region.id)
+
+    self.put_region(region, **kwargs)
+
+    for other in self.index.overlaps(region):
+      self.put_overlap((other, region))
+
+  def insert_regions(self, regions: Iterable[Region]):
+    """
+    Insert all of the given Regions into the graph, as a single batch.
+    Adds all of the new nodes and updates the spatial index once, before
+    finding the overlaps of each new Region. Equivalent to calling
+    insert_region for each Region.
+
+    Args:
+      regions:
+        The Regions to be inserted.
+    """
+    batch = dict((r.id, r) for r in regions)
+
+    assert all([isinstance(r, Region) and r.dimension == self.dimension \
+                for r in batch.values()])
+
+    self.remove_regions([rid for rid in batch.keys() if rid in self])
+
+    datakey = self.NodeRegion
+    index   = self.index
+
+    self.G.add_nodes_from([(rid, {datakey: r}) for rid, r in batch.items()])
+    self.version += 1
+    index.update(batch.values())
+
+    for region in batch.values():
+      for other in index.overlaps(region):
+        if (other.id, region.id) not in self:
+          self.put_overlap((other, region))
+
+  def remove_region(self, region: RegionId):
+    """
+    Remove the given Region or Region ID from the graph, along with all
+    of the edges of its overlaps with other Regions within the graph.
+
+    Args:
+      region:
+        The Region or Region ID to be removed.
+    """
+    assert isinstance(region, (Region, str))
+
+    del self[region]
+
+  def remove_regions(self, regions: Iterable[RegionId]):
+    """
+    Remove all of the given Regions or Region IDs from the graph,
+    as a single batch. Equivalent to calling remove_region for each Region.
+
+    Args:
+      regions:
+        The Regions or Region IDs to be removed.
+    """
+    rids = [self._convert(r) for r in regions]
+
+    assert all([isinstance(r, str) for r in rids])
+
+    self.G.remove_nodes_from(rids)
+    self.version += 1
+
+    if hasattr(self, '_index'):
+      for rid in rids:
+        self._index.remove(rid)
+
   ### Class Methods: Serialization
 
   @classmethod
@@ -322,7 +632,8 @@ class NxGraph(RIGraph[nx.Graph], IOable):
 
     kwargs:
       json_graph:
-        Allowed graph formats: 'node_link' or 'adjacency'.
+        Allowed graph formats: 'node_link', 'adjacency'
+        or 'node_index'.
         If not provided, defaults to: 'node_link'.
 
     Returns:
@@ -336,7 +647,10 @@ class NxGraph(RIGraph[nx.Graph], IOable):
 
     def to_data(G, datafmt):
       method_name = f'{datafmt}_data'
-      if hasattr(json_graph, method_name):
+      if datafmt == 'node_index':
+        return dict((k, list(v) if k in ['nodes', 'edges'] else v)
+                    for k, v in cls.node_index_data(G).items())
+      elif hasattr(json_graph, method_name):
         method = getattr(json_graph, method_name)
         assert isinstance(method, Callable)
         return method(G)
@@ -344,6 +658,12 @@ class NxGraph(RIGraph[nx.Graph], IOable):
         raise ValueError(f'Unsupported json_graph format.')
 
     datafmt = kwargs['json_graph'] if 'json_graph' in kwargs else 'node_link'
+
+    # Recompute any intersecting Regions deferred by from_binary
+    if datafmt != 'node_index':
+      for _ in object.overlaps:
+        pass
+
     data = {
       'id': object.id,
       'dimension': object.dimension,
@@ -353,6 +673,176 @@ class NxGraph(RIGraph[nx.Graph], IOable):
 
     return data
 
+  @classmethod
+  def to_chunks(cls, object: 'NxGraph', encoder: IOableEncoder,
+                     level: int, **kwargs) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given NxGraph object, writing the
+    node_link or node_index nodes and links (edges) one at a time, without
+    first generating the data for the entire graph. Produces the same JSON
+    text as encoding the object generated by to_object. Falls back to
+    to_object for other json_graph formats.
+
+    Overrides:
+      IOable.to_chunks
+
+    Args:
+      object:   The NxGraph to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      kwargs:   Additional arguments to be used to
+                customize and tweak the JSON text
+                generation process.
+
+    kwargs:
+      json_graph:
+        Allowed graph formats: 'node_link', 'adjacency'
+        or 'node_index'.
+        If not provided, defaults to: 'node_link'.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    assert isinstance(object, NxGraph) and isinstance(object.G, nx.Graph)
+
+    datafmt = kwargs['json_graph'] if 'json_graph' in kwargs else 'node_link'
+    G       = object.G
+
+    if datafmt not in ['node_link', 'node_index'] or G.is_multigraph():
+      yield from encoder.chunks(cls.to_object(object, **kwargs), level)
+      return
+
+    if datafmt == 'node_index':
+      graph = cls.node_index_data(G)
+    else:
+      # Recompute any intersecting Regions deferred by from_binary
+      for _ in object.overlaps:
+        pass
+
+      nodes = (dict(chain(G.nodes[n].items(), [('id', n)])) for n in G)
+      links = (dict(chain(d.items(), [('source', u), ('target', v)]))
+               for u, v, d in G.edges(data=True))
+      graph = {
+        'directed': G.is_directed(),
+        'multigraph': False,
+        'graph': G.graph,
+        'nodes': nodes,
+        'links': links
+      }
+
+    yield from encoder.dict_chunks([
+      ('id', object.id),
+      ('dimension', object.dimension),
+      ('json_graph', datafmt),
+      ('graph', graph)
+    ], level)
+
+  @classmethod
+  def node_index_data(cls, G: nx.Graph) -> Dict:
+    """
+    Generates the node_index data for the given NetworkX graph: the graph
+    properties, the nodes in the same form as the node_link data and the
+    edges as [i, j] pairs of node indices. The intersecting Regions of the
+    edges are not stored, since they are recomputed when loaded; any other
+    edge data properties are stored as a third item, [i, j, data]. The nodes
+    and edges are generated as they are iterated over.
+
+    Args:
+      G:  The NetworkX graph to generate the data for.
+
+    Returns:
+      The node_index data.
+    """
+    assert not G.is_directed() and not G.is_multigraph()
+
+    edgekey = cls.EdgeRegion
+    index   = dict((node, i) for i, node in enumerate(G))
+
+    def to_edge(u: str, v: str, data: Dict) -> List:
+      data = dict((k, d) for k, d in data.items() if k != edgekey)
+      return [index[u], index[v], data] if len(data) > 0 else [index[u], index[v]]
+
+    return {
+      'graph': G.graph,
+      'nodes': (dict(chain(G.nodes[n].items(), [('id', n)])) for n in G),
+      'edges': (to_edge(u, v, d) for u, v, d in G.edges(data=True))
+    }
+
+  @classmethod
+  def to_binary(cls, object: 'NxGraph', output: BufferedIOBase):
+    """
+    Outputs the given NxGraph object to the given binary output stream in the
+    binary RIG file format. The binary format consists of the BinaryMagic
+    bytes, the byte length of the JSON header, the JSON header and the arrays
+    described by the header, each aligned to 64 bytes: the Region IDs, the
+    lower and upper bounds of the Regions as (n, d) float arrays, and the
+    overlaps as compressed sparse row (CSR) index arrays, storing each
+    overlap once from the lower to the higher node index. The intersecting
+    Regions and any edge data properties are not stored; the intersecting
+    Regions are recomputed on demand when loaded.
+
+    Args:
+      object:   The NxGraph object to serialize.
+      output:   The binary output stream to serialize
+                the object to.
+    """
+    assert isinstance(object, NxGraph) and isinstance(object.G, nx.Graph)
+    assert output.writable()
+
+    nodes   = list(object.regions)
+    ids     = [node for node, _, _ in nodes]
+    index   = dict((node, i) for i, node in enumerate(ids))
+    regions = [region for _, region, _ in nodes]
+
+    assert all([isinstance(r, Region) for r in regions])
+
+    edges   = array([sorted((index[u], index[v])) for u, v in object.G.edges()],
+                    dtype='<i8').reshape(-1, 2)
+    edges   = edges[lexsort((edges[:, 1], edges[:, 0]))]
+    indptr  = zeros(len(ids) + 1, dtype='<i8')
+    indptr[1:] = cumsum(bincount(edges[:, 0], minlength=len(ids)))
+
+    arrays  = {
+      'ids':     array(ids, dtype=str).astype(f'<U{max(map(len, ids), default=1)}'),
+      'lowers':  array([r.lower for r in regions], dtype='<f8').reshape(-1, object.dimension),
+      'uppers':  array([r.upper for r in regions], dtype='<f8').reshape(-1, object.dimension),
+      'indptr':  indptr,
+      'indices': edges[:, 1].copy()
+    }
+
+    align  = lambda n: -(-n // 64) * 64
+    header = {
+      'id': object.id,
+      'dimension': object.dimension,
+      'data': dict((r.id, r.data) for r in regions if len(r.data) > 0),
+      'arrays': {}
+    }
+
+    # Array offsets depend on the header length; grow the reserved
+    # header length until the header fits before the first array.
+    reserved = 0
+    while True:
+      offset = align(len(cls.BinaryMagic) + 8 + reserved)
+      for name, values in arrays.items():
+        header['arrays'][name] = [values.dtype.str, list(values.shape), offset]
+        offset = align(offset + values.nbytes)
+      text = JSONDump(header).encode('utf-8')
+      if len(text) <= reserved:
+        break
+      reserved = len(text)
+
+    text = text.ljust(reserved)
+    output.write(cls.BinaryMagic)
+    output.write(reserved.to_bytes(8, 'little'))
+    output.write(text)
+
+    position = len(cls.BinaryMagic) + 8 + reserved
+    for name, values in arrays.items():
+      offset = header['arrays'][name][2]
+      output.write(bytes(offset - position))
+      output.write(values.tobytes())
+      position = offset + values.nbytes
+
   ### Class Methods: Deserialization
 
   @classmethod
@@ -371,8 +861,13 @@ class NxGraph(RIGraph[nx.Graph], IOable):
       id:
         The unique identifier for the generated RIGraph.
       json_graph:
-        Allowed graph formats: 'node_link' or 'adjacency'.
+        Allowed graph formats: 'node_link', 'adjacency'
+        or 'node_index'.
         If not provided, defaults to: 'node_link'.
+      intersect:
+        Boolean flag whether or not to recompute the
+        intersecting Regions of the node_index edges
+        when loaded, instead of on first access.
 
     Returns:
       The newly constructed NxGraph object.
@@ -386,6 +881,12 @@ class NxGraph(RIGraph[nx.Graph], IOable):
     assert all([k in object and isinstance(object[k], t) for k, t in types.items()])
     assert object['dimension'] > 0 and len(object['id']) > 0
 
+    if object['json_graph'] == 'node_index':
+      data = object['graph']
+      G    = nx.Graph(**data.get('graph', {}))
+      cls.add_node_index(G, data['nodes'], data['edges'])
+      return cls.from_node_index({**object, 'graph': G}, **kwargs)
+
     def to_graph(data: Dict, datafmt: str) -> nx.Graph:
       method_name = f'{datafmt}_graph'
       if hasattr(json_graph, method_name):
@@ -429,3 +930,267 @@ class NxGraph(RIGraph[nx.Graph], IOable):
       G.edges[u, v]['intersect'] = region
 
     return nxgraph
+
+  @classmethod
+  def add_node_index(cls, G: nx.Graph, nodes: Iterable[Dict],
+                          edges: Iterable[List], index: List[str] = None) -> List[str]:
+    """
+    Add the given node_index nodes and edges to the given NetworkX graph.
+    The Regions of the nodes are rematerialized, and the intersecting
+    Regions of the edges are deferred, to be recomputed on first access.
+
+    Args:
+      G:      The NetworkX graph to add to.
+      nodes:  The node_index nodes to be added.
+      edges:  The node_index edges to be added.
+      index:  The node IDs by node index of the
+              previously added nodes.
+
+    Returns:
+      The node IDs by node index.
+    """
+    datakey = cls.NodeRegion
+    edgekey = cls.EdgeRegion
+    index   = [] if index is None else index
+
+    for data in nodes:
+      data = dict(data)
+      node = data.pop('id')
+      if not isinstance(data[datakey], Region):
+        data[datakey] = Region.from_object(data[datakey])
+      G.add_node(node, **data)
+      index.append(node)
+
+    for edge in edges:
+      assert isinstance(edge, List) and len(edge) in [2, 3]
+      data = edge[2] if len(edge) == 3 else {}
+      G.add_edge(index[edge[0]], index[edge[1]], **{edgekey: None, **data})
+
+    return index
+
+  @classmethod
+  def from_node_index(cls, object: Dict, **kwargs) -> 'NxGraph':
+    """
+    Construct a new NxGraph object from the given node_index object,
+    whose 'graph' is the NetworkX graph with the node_index nodes and
+    edges added, as by NxGraph.add_node_index.
+
+    Args:
+      object:   The node_index object.
+      kwargs:   Additional arguments for customizing
+                and tweaking the NxGraph object
+                generation process.
+
+    Keyword Args:
+      id:
+        The unique identifier for the generated RIGraph.
+      intersect:
+        Boolean flag whether or not to recompute the
+        intersecting Regions of the edges when loaded,
+        instead of on first access.
+
+    Returns:
+      The newly constructed NxGraph object.
+    """
+    graphid = kwargs.get('id', object['id'])
+    nxgraph = NxGraph(object['dimension'], object['graph'], id=graphid)
+
+    assert nxgraph.dimension == nxgraph.G.graph['dimension']
+    assert all([r.dimension == nxgraph.dimension for _, r, _ in nxgraph.regions])
+
+    if kwargs.get('intersect', False):
+      for _ in nxgraph.overlaps:
+        pass
+
+    return nxgraph
+
+  @classmethod
+  def from_stream(cls, source: TextIOBase, compression: str = None, **kwargs) -> 'NxGraph':
+    """
+    Construct a new NxGraph object from the JSON text from the given text
+    input source, parsing the node_link 'nodes' and 'links' arrays, or the
+    node_index 'nodes' and 'edges' arrays, incrementally. Each node and
+    edge is added to the graph, with its Region rematerialized, as soon as
+    it is parsed. Falls back to from_object for other json_graph formats.
+
+    Overrides:
+      IOable.from_stream
+
+    Args:
+      source:       The input source whose JSON content is
+                    to be converted into an NxGraph object.
+      compression:  The compression format: 'gzip', 'bz2',
+                    'lzma', 'infer' from the input file
+                    name or None.
+      kwargs:       Additional arguments for customizing
+                    and tweaking the NxGraph object
+                    generation process.
+
+    Keyword Args:
+      id:
+        The unique identifier for the generated RIGraph.
+      intersect:
+        Boolean flag whether or not to recompute the
+        intersecting Regions of the node_index edges
+        when loaded, instead of on first access.
+
+    Returns:
+      The newly constructed NxGraph object.
+    """
+    if compression is not None:
+      with compressed(source, 'r', compression) as source:
+        return cls.from_stream(source, **kwargs)
+
+    stream  = JSONStream(source)
+    object  = {}
+    datakey = cls.NodeRegion
+    edgekey = cls.EdgeRegion
+
+    def to_graph() -> nx.Graph:
+      G = nx.Graph()
+      nodes = []
+      for key in stream.members():
+        if key == 'nodes':
+          for _ in stream.elements():
+            data = stream.value()
+            node = data.pop('id')
+            data[datakey] = Region.from_object(data[datakey])
+            G.add_node(node, **data)
+            nodes.append(node)
+        elif key == 'edges':
+          for _ in stream.elements():
+            cls.add_node_index(G, [], [stream.value()], nodes)
+        elif key == 'links':
+          for _ in stream.elements():
+            data = stream.value()
+            u, v = data.pop('source'), data.pop('target')
+            if edgekey in data:
+              data[edgekey] = Region.from_object(data[edgekey])
+            G.add_edge(u, v, **data)
+        elif key == 'graph':
+          G.graph.update(stream.value())
+        elif key in ['directed', 'multigraph']:
+          assert not stream.value()
+        else:
+          stream.value()
+      return G
+
+    for key in stream.members():
+      if key == 'graph' and object.get('json_graph', '') in ['node_link', 'node_index']:
+        object[key] = to_graph()
+      else:
+        object[key] = stream.value()
+
+    if not isinstance(object.get('graph'), nx.Graph):
+      return cls.from_object(object, **kwargs)
+    if object['json_graph'] == 'node_index':
+      return cls.from_node_index(object, **kwargs)
+
+    graphid = kwargs.get('id', object['id'])
+    nxgraph = NxGraph(object['dimension'], object['graph'], id=graphid)
+    G       = nxgraph.G
+
+    assert nxgraph.dimension == G.graph['dimension']
+
+    # Resolve backlinks amongst the edge, Region intersections
+    for (u, v, region) in G.edges(data=edgekey):
+      assert region is None or region.dimension == nxgraph.dimension
+      for field in ['intersect', 'union']:
+        if region is not None and field in region:
+          assert all([r in G.nodes for r in region[field]])
+          region[field] = [G.nodes[r][datakey] for r in region[field]]
+
+    return nxgraph
+
+  @classmethod
+  def is_binary(cls, source: Union[str, BufferedIOBase, TextIOBase]) -> bool:
+    """
+    Determine if the given input file path or input source is in the binary
+    RIG file format, by inspecting its leading bytes without consuming them.
+
+    Args:
+      source:   The input file path or input source.
+
+    Returns:
+      True:   If the input is in the binary RIG file format.
+      False:  Otherwise.
+    """
+    magic = cls.BinaryMagic
+
+    if isinstance(source, str):
+      with open(source, 'rb') as f:
+        return f.read(len(magic)) == magic
+
+    source = getattr(source, 'buffer', source)
+    if hasattr(source, 'peek'):
+      return source.peek(len(magic))[:len(magic)] == magic
+
+    return False
+
+  @classmethod
+  def from_binary(cls, source: Union[str, BufferedIOBase, TextIOBase],
+                       mmap: bool = True, **kwargs) -> 'NxGraph':
+    """
+    Construct a new NxGraph object from the given input file path or input
+    source in the binary RIG file format. If the input is a file on disk,
+    memory-maps the arrays instead of reading them. Only parses the header
+    and the Region IDs; the Regions, and the nodes and edges of the NetworkX
+    graph, are built from the arrays on first access. The intersecting
+    Regions of the edges are deferred and recomputed on first access.
+
+    Args:
+      source:   The input file path or input source.
+      mmap:     Boolean flag whether or not to memory-map
+                the arrays of files on disk.
+      kwargs:   Additional arguments for customizing
+                and tweaking the NxGraph object
+                generation process.
+
+    Keyword Args:
+      id:
+        The unique identifier for the generated RIGraph.
+
+    Returns:
+      The newly constructed NxGraph object.
+
+    Raises:
+      ValueError: If input is not in the binary RIG file format.
+    """
+    path   = source if isinstance(source, str) else getattr(source, 'name', None)
+    mapped = mmap and isinstance(path, str) and isfile(path) and not is_compressed(source)
+
+    if mapped:
+      buffer = memmap(path, dtype=uint8, mode='r')
+    else:
+      source = getattr(source, 'buffer', source)
+      assert source.readable()
+      buffer = source.read()
+
+    magic = cls.BinaryMagic
+    if bytes(buffer[:len(magic)]) != magic:
+      raise ValueError(f'Unsupported binary input format')
+
+    length = int.from_bytes(bytes(buffer[len(magic):len(magic) + 8]), 'little')
+    header = JSONParse(bytes(buffer[len(magic) + 8:len(magic) + 8 + length]))
+
+    def to_array(name: str):
+      dtype, shape, offset = header['arrays'][name]
+      return frombuffer(buffer, dtype=dtype, count=int(prod(shape)),
+                                offset=offset).reshape(shape)
+
+    ids     = to_array('ids').tolist()
+    graphid = kwargs.get('id', header['id'])
+    nxgraph = NxGraph(header['dimension'], id=graphid)
+
+    nxgraph._binary = {
+      'ids':     ids,
+      'rows':    dict((rid, row) for row, rid in enumerate(ids)),
+      'lowers':  to_array('lowers'),
+      'uppers':  to_array('uppers'),
+      'indptr':  to_array('indptr'),
+      'indices': to_array('indices'),
+      'data':    header['data'],
+      'regions': {}
+    }
+
+    return nxgraph
@@ -25,9 +25,9 @@ Abstract Classes:
 
 from abc import ABCMeta, abstractmethod
 from collections import abc
-from typing import Any, Dict, Generic, Iterator, Tuple, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, Iterator, Tuple, TypeVar, Union
 
-from ..shapes import Region, RegionIdPair, RegionPair
+from ..shapes import Region, RegionId, RegionIdPair, RegionPair
 
 
 G = TypeVar('G')
@@ -57,12 +57,17 @@ class RIGraph(Generic[G], abc.Sized): # pylint: disable=E1136
     G:
       The internal graph representation or implementation
       for a graph of intersecting or overlapping Regions.
+    version:
+      The modification counter for this RIGraph.
+      Incremented whenever a node or edge is added
+      or removed through this programming interface.
   """
   __metaclass__ = ABCMeta
 
   id: str
   dimension: int
   G: G
+  version: int
 
   @abstractmethod
   def __init__(self, dimension: int, graph: G = None, id: str = ''):
@@ -291,3 +296,58 @@ class RIGraph(Generic[G], abc.Sized): # pylint: disable=E1136
         to the newly created edge.
     """
     raise NotImplementedError
+
+  ### Methods: Dynamic Maintenance
+
+  @abstractmethod
+  def insert_region(self, region: Region, **kwargs):
+    """
+    Add the given Region as a newly created node in the graph, and add
+    an edge between the new node and each of the Regions within the graph
+    that overlap with the given Region. If a Region with the same ID is
+    already within the graph, that Region and its edges are replaced.
+
+    Args:
+      region:
+        The Region to be inserted.
+      kwargs:
+        Additional data properties to be added
+        to the newly created node.
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def insert_regions(self, regions: Iterable[Region]):
+    """
+    Insert all of the given Regions into the graph, as a single batch.
+    Equivalent to calling insert_region for each Region.
+
+    Args:
+      regions:
+        The Regions to be inserted.
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def remove_region(self, region: RegionId):
+    """
+    Remove the given Region or Region ID from the graph, along with all
+    of the edges of its overlaps with other Regions within the graph.
+
+    Args:
+      region:
+        The Region or Region ID to be removed.
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def remove_regions(self, regions: Iterable[RegionId]):
+    """
+    Remove all of the given Regions or Region IDs from the graph,
+    as a single batch. Equivalent to calling remove_region for each Region.
+
+    Args:
+      regions:
+        The Regions or Region IDs to be removed.
+    """
+    raise NotImplementedError
@@ -19,11 +19,11 @@ from collections import abc
 from dataclasses import asdict, astuple, dataclass
 from functools import reduce
 from numbers import Number, Real
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
-from numpy import floor
+from numpy import around, asarray, floor, maximum, minimum, where
 
-from sources.abstract import IOable
+from sources.abstract import IOable, IOableEncoder
 from sources.helpers import NDArray, RandomFn, Randoms
 
 
@@ -142,8 +142,9 @@ class Interval(IOable, abc.Container, abc.Hashable):
       lower, upper:
         the lower and upper bounding values.
     """
-    assert isinstance(lower, Real)
-    assert isinstance(upper, Real)
+    # Check float first, to skip the slower abstract Real check
+    assert isinstance(lower, (float, Real))
+    assert isinstance(upper, (float, Real))
 
     if lower > upper:
       object.__setattr__(self, 'lower', float(upper))
@@ -472,21 +473,16 @@ class Interval(IOable, abc.Container, abc.Hashable):
     assert isinstance(sizepc, Interval) and Interval(0, 1).encloses(sizepc)
     assert isinstance(posnrng, Callable) and isinstance(sizerng, Callable)
 
-    intervals = []
-    positions = self.random_values(nintervals, posnrng)
-    lengths   = [s * self.length for s in sizepc.random_values(nintervals, sizerng)]
+    positions = asarray(self.random_values(nintervals, posnrng), dtype=float).reshape(nintervals)
+    lengths   = asarray(sizepc.random_values(nintervals, sizerng), dtype=float).reshape(nintervals) * self.length
+    lowers    = where(positions <= self.midpoint, positions, maximum(positions - lengths, self.lower))
+    uppers    = minimum(lowers + lengths, self.upper)
 
-    for i in range(nintervals):
-      length = lengths[i]
-      position = positions[i]
-      lower = position if position <= self.midpoint else max(position - length, self.lower)
-      upper = min(lower + length, self.upper)
-      if precision != None:
-        lower = round(lower, precision)
-        upper = round(upper, precision)
-      intervals.append(Interval(lower, upper))
+    if precision != None:
+      lowers = around(lowers, precision)
+      uppers = around(uppers, precision)
 
-    return intervals
+    return [Interval(lower, upper) for lower, upper in zip(lowers.tolist(), uppers.tolist())]
 
   ### Class Methods: Generators
 
@@ -570,6 +566,66 @@ class Interval(IOable, abc.Container, abc.Hashable):
     else:
       return asdict(object)
 
+  @classmethod
+  def to_text(cls, object: 'Interval', encoder: IOableEncoder,
+                   level: int, compact: bool = False) -> str:
+    """
+    Generates the JSON text for the given Interval object directly from its
+    lower and upper bounds, as nested at the given indentation level.
+    Produces the same JSON text as encoding the object generated by
+    to_object.
+
+    Args:
+      object:   The Interval to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      compact:  Boolean flag for whether or not the data
+                representation of the output JSON is a
+                compact, abbreviated representation or the
+                full data representation with all fields.
+
+    Returns:
+      The JSON text of the Interval.
+    """
+    lower = encoder.scalar(object.lower)
+    upper = encoder.scalar(object.upper)
+
+    if compact:
+      return encoder.list_text([lower, upper], level)
+    else:
+      return encoder.dict_text([('lower', lower), ('upper', upper)], level)
+
+  @classmethod
+  def to_chunks(cls, object: 'Interval', encoder: IOableEncoder,
+                     level: int, **kwargs) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given Interval object.
+    Produces the same JSON text as encoding the object generated by
+    to_object.
+
+    Overrides:
+      IOable.to_chunks
+
+    Args:
+      object:   The Interval to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      kwargs:   Additional arguments or options to customize
+                and tweak the JSON text generation process.
+
+    kwargs:
+      compact:
+        Boolean flag for whether or not the data representation
+        of the output JSON is a compact, abbreviated representation or
+        the full data representation with all fields.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    assert isinstance(object, Interval)
+
+    yield cls.to_text(object, encoder, level, kwargs.get('compact', False))
+
   @classmethod
   def from_object(cls, object: Any) -> 'Interval':
     """
@@ -22,10 +22,12 @@ from collections import abc
 from dataclasses import asdict, astuple, dataclass, field
 from functools import reduce
 from numbers import Real
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 from uuid import uuid4
 
-from sources.abstract import IOable
+from numpy import around, array, asarray, column_stack, maximum, minimum, where
+
+from sources.abstract import IOable, IOableEncoder
 from sources.helpers import NDArray, RandomFn, Randoms
 
 from .interval import Interval
@@ -98,8 +100,9 @@ class Region(IOable, abc.Container):
       dimension = len(lower)
 
     assert len(id) > 0
-    assert isinstance(lower, List) and all([isinstance(l, Real) for l in lower])
-    assert isinstance(upper, List) and all([isinstance(u, Real) for u in upper])
+    # Check list and float first, to skip the slower typing and abstract Real checks
+    assert isinstance(lower, list) and all([isinstance(l, (float, Real)) for l in lower])
+    assert isinstance(upper, list) and all([isinstance(u, (float, Real)) for u in upper])
     assert dimension > 0 and len(lower) == len(upper) == dimension
 
     self.id = id
@@ -780,6 +783,80 @@ class Region(IOable, abc.Container):
 
     return randomng([npoints, self.dimension], self.lower, self.upper)
 
+  def random_bounds(self, nregions: int = 1, sizepc: 'Region' = None,
+                          posnrng: Union[RandomFn,List[RandomFn]] = Randoms.uniform(),
+                          sizerng: Union[RandomFn,List[RandomFn]] = Randoms.uniform(),
+                          precision: int = None) -> Tuple[NDArray, NDArray]:
+    """
+    Randomly generate the lower and upper bounding vertices of N Regions
+    within this Region, as (N, d) matrices, each with a random size as a
+    percentage of the total Region dimensions, bounded by the given size
+    percentage Region (enclosed by Region([0, ...], [1, ...])). The positions
+    and sizes are drawn with one call to each random number generator (or
+    one call for all dimensions, if the same generator is given for each
+    dimension), and are clamped to this Region and rounded to the given
+    precision with array operations.
+
+    Args:
+      nregions:   The number of Regions to be generated.
+      sizepc:     The size range as a percentage of the
+                  total Regions' dimensional length.
+      posnrng:    The random number generator or list of
+                  random number generator (per dimension)
+                  for choosing the position of the Region.
+      sizerng:    The random number generator or list of
+                  random number generator (per dimension)
+                  for choosing the size of the Region.
+      precision:  The number of digits after the decimal
+                  point for the lower and upper bounding
+                  values, or None for arbitrary precision.
+
+    Returns:
+      The lower and upper bounding vertices of the
+      randomly generated Regions, as (N, d) matrices.
+    """
+    ndunit_region = Region([0] * self.dimension, [1] * self.dimension)
+    if sizepc == None:
+      sizepc = ndunit_region
+    if precision != None:
+      assert isinstance(precision, int)
+
+    assert isinstance(nregions, int) and nregions > 0
+    assert isinstance(sizepc, Region) and self.dimension == sizepc.dimension
+    assert ndunit_region.encloses(sizepc)
+
+    if isinstance(posnrng, Callable):
+      posnrng = [posnrng] * self.dimension
+    if isinstance(sizerng, Callable):
+      sizerng = [sizerng] * self.dimension
+
+    for rng in [posnrng, sizerng]:
+      assert isinstance(rng, List) and \
+             all(isinstance(f, Callable) for f in rng) and \
+             len(rng) == self.dimension
+
+    shape = (nregions, self.dimension)
+
+    def draw(rngs: List[RandomFn], lower: NDArray, upper: NDArray) -> NDArray:
+      if all([f is rngs[0] for f in rngs]):
+        return asarray(rngs[0](list(shape), lower, upper), dtype=float).reshape(shape)
+      return column_stack([asarray(f(nregions, l, u), dtype=float).reshape(nregions)
+                           for f, l, u in zip(rngs, lower, upper)])
+
+    lower, upper = array(self.lower, dtype=float), array(self.upper, dtype=float)
+    positions    = draw(posnrng, lower, upper)
+    lengths      = draw(sizerng, array(sizepc.lower, dtype=float),
+                                 array(sizepc.upper, dtype=float)) * (upper - lower)
+    lowers       = where(positions <= (lower + upper) / 2, positions,
+                         maximum(positions - lengths, lower))
+    uppers       = minimum(lowers + lengths, upper)
+
+    if precision != None:
+      lowers = around(lowers, precision)
+      uppers = around(uppers, precision)
+
+    return (lowers, uppers)
+
   def random_regions(self, nregions: int = 1, sizepc: 'Region' = None,
                            posnrng: Union[RandomFn,List[RandomFn]] = Randoms.uniform(),
                            sizerng: Union[RandomFn,List[RandomFn]] = Randoms.uniform(),
@@ -797,7 +874,8 @@ class Region(IOable, abc.Container):
     Intervals where the lower and upper bounding values are rounded/truncated
     to the specified precision (number of digits after the decimal point).
     If precision is None, the lower and upper bounding values are of arbitrary
-    precision. Additional arguments passed through to Region.from_intervals.
+    precision. The bounding vertices are generated at once, as given by
+    random_bounds. Additional arguments passed through to Region.__init__.
 
     Args:
       nregions:   The number of Regions to be generated.
@@ -813,37 +891,16 @@ class Region(IOable, abc.Container):
                   point for the lower and upper bounding
                   values, or None for arbitrary precision.
       kwargs:     Additional arguments passed through to
-                  Region.from_intervals.
+                  Region.__init__.
 
     Returns:
       List of randonly generated Regions
       within this Region.
     """
-    ndunit_region = Region([0] * self.dimension, [1] * self.dimension)
-    if sizepc == None:
-      sizepc = ndunit_region
+    lowers, uppers = self.random_bounds(nregions, sizepc, posnrng, sizerng, precision)
 
-    assert isinstance(sizepc, Region) and self.dimension == sizepc.dimension
-    assert ndunit_region.encloses(sizepc)
-
-    if isinstance(posnrng, Callable):
-      posnrng = [posnrng] * self.dimension
-    if isinstance(sizerng, Callable):
-      sizerng = [sizerng] * self.dimension
-
-    for rng in [posnrng, sizerng]:
-      assert isinstance(rng, List) and \
-             all(isinstance(f, Callable) for f in rng) and \
-             len(rng) == self.dimension
-
-    regions = []
-    for _ in range(nregions):
-      region = []
-      for i, d in enumerate(self.dimensions):
-        dimension = d.random_intervals(1, sizepc[i], posnrng[i], sizerng[i], precision)[0]
-        region.append(dimension)
-      regions.append(Region.from_intervals(region, **kwargs))
-    return regions
+    return [Region(lower, upper, dimension=self.dimension, **kwargs)
+            for lower, upper in zip(lowers.tolist(), uppers.tolist())]
 
   ### Class Methods: Generators
 
@@ -1031,6 +1088,114 @@ class Region(IOable, abc.Container):
 
     return dictobj
 
+  @classmethod
+  def to_chunks(cls, object: 'Region', encoder: IOableEncoder,
+                     level: int, **kwargs) -> Iterator[str]:
+    """
+    Generates the JSON text chunks for the given Region object directly
+    from its bounds, data properties and the IDs of the Regions it links to,
+    without the deep copies made by to_object. Produces the same JSON text
+    as encoding the object generated by to_object; falls back to to_object
+    for data properties other than scalars or lists of scalars.
+
+    Overrides:
+      IOable.to_chunks
+
+    Args:
+      object:   The Region to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+      kwargs:   Additional arguments or options to customize
+                and tweak the JSON text generation process.
+
+    kwargs:
+      compact:
+        Boolean flag for whether or not the data
+        representation of the output JSON is a compact,
+        abbreviated representation or the full data
+        representation with all fields.
+
+    Returns:
+      An Iterator of the JSON text chunks.
+    """
+    assert isinstance(object, Region)
+
+    compact = 'compact' in kwargs and kwargs['compact']
+    scalar  = encoder.scalar
+    data    = []
+
+    def to_text(value: Any) -> str:
+      if isinstance(value, (list, tuple)):
+        texts = [scalar(v) for v in value]
+        return None if None in texts else encoder.list_text(texts, level + 2)
+      return scalar(value)
+
+    for k, v in object.data.items():
+      if not isinstance(k, str) or k.startswith('_'):
+        text = None
+      elif k in ['intersect', 'union'] and all([isinstance(r, Region) for r in v]):
+        text = to_text([r.id for r in v])
+      else:
+        text = to_text(v)
+      if text is None:
+        yield from encoder.chunks(cls.to_object(object, **kwargs), level)
+        return
+      data.append((k, text))
+
+    dimensions = [Interval.to_text(i, encoder, level + 2, compact) for i in object.dimensions]
+    items = [('id', scalar(object.id)),
+             ('dimension', scalar(object.dimension)),
+             ('dimensions', encoder.list_text(dimensions, level + 1))]
+
+    if len(data) > 0:
+      items.append(('data', encoder.dict_text(data, level + 1)))
+
+    yield encoder.dict_text(items, level)
+
+  @classmethod
+  def to_asdict_text(cls, object: 'Region', encoder: IOableEncoder, level: int) -> str:
+    """
+    Generates the JSON text for the given Region object, as converted by
+    dataclasses.asdict, directly from its bounds and data properties, as
+    nested at the given indentation level. Returns None for data properties
+    other than scalars, Regions or lists of these.
+
+    Args:
+      object:   The Region to be serialized.
+      encoder:  The encoder to generate the JSON text with.
+      level:    The current indentation level.
+
+    Returns:
+      The JSON text of the Region as converted
+      by dataclasses.asdict.
+      None, if the data properties are unsupported.
+    """
+    assert isinstance(object, Region)
+
+    def to_text(value: Any, level: int) -> str:
+      if isinstance(value, Region):
+        return cls.to_asdict_text(value, encoder, level)
+      if isinstance(value, (list, tuple)):
+        texts = [to_text(v, level + 1) for v in value]
+        return None if None in texts else encoder.list_text(texts, level)
+      return encoder.scalar(value)
+
+    data = []
+    for k, v in object.data.items():
+      text = to_text(v, level + 2) if isinstance(k, str) else None
+      if text is None:
+        return None
+      data.append((k, text))
+
+    dimensions = [Interval.to_text(i, encoder, level + 2) for i in object.dimensions]
+
+    return encoder.dict_text([
+      ('id', encoder.scalar(object.id)),
+      ('dimension', encoder.scalar(object.dimension)),
+      ('dimensions', encoder.list_text(dimensions, level + 1)),
+      ('data', encoder.dict_text(data, level + 1))
+    ], level)
+
   @classmethod
   def from_dict(cls, object: Dict, id: str = '') -> 'Region':
     """
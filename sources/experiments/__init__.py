@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
-from .onregions import *
-from .onrigscale import *
-from .onriqperf import *
+from sources.helpers import lazy_exports
+
+# Imports the experiments (and their dependencies) on first access.
+__getattr__, __dir__ = lazy_exports(__name__, ['fixtures', 'onregions', 'onrigscale', 'onriqperf', 'regression'])
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+
+"""
+Cached, Content-addressed Dataset + Graph Fixtures for Experiments
+
+Generates randomly generated collections of Regions (and their Region
+intersection graphs) from explicit parameters: the number of Regions, the
+dimensionality, the size of Regions, the random distribution and the seed.
+Each fixture is addressed by the hash of its parameters, and is stored on
+local disk: the Regions in the columnar NumPy file format, the graph in the
+binary RIG file format and the parameters in a JSON manifest file, written
+last so that partially written fixtures are ignored. Later experiments (or
+evaluations) with the same parameters memory-map the fixtures instead of
+generating and constructing them again.
+
+Types:
+- FixtureParams
+
+Classes:
+- ExperimentsFixtures
+"""
+
+from hashlib import sha256
+from json import dump, dumps, load
+from os import getpid, makedirs, replace
+from os.path import isfile, join
+from typing import Any, Dict, Tuple
+
+from sources.algorithms import NxGraphSweepCtor
+from sources.core import NxGraph, Region, RegionSet
+from sources.helpers import Randoms
+
+
+FixtureParams = Dict[str, Any]
+
+
+class ExperimentsFixtures:
+  """
+  Cached, content-addressed fixtures of randomly generated collections of
+  Regions and their Region intersection graphs.
+
+  Class Attributes:
+    FixtureDir:   The default directory of the fixture files.
+    Version:      The version of the fixtures' generation
+                  and file formats, part of the parameters,
+                  so that fixtures cached by other versions
+                  are not reused.
+  """
+  FixtureDir = 'data/fixtures'
+  Version    = 2
+
+  ### Class Methods: Helpers
+
+  @classmethod
+  def params(cls, nregions: int, dimension: int, sizepc: float,
+                  distribution: str = 'uniform', seed: int = 0,
+                  maxbound: float = 1000) -> FixtureParams:
+    """
+    Returns the parameters of the fixture, as a JSON-serializable object,
+    along with the version of the fixtures.
+
+    Args:
+      nregions:     The number of Regions.
+      dimension:    The dimensionality of Regions.
+      sizepc:       The maximum size of Regions as a percent
+                    of the bounding Region.
+      distribution: The name of the random distribution
+                    of the Regions' positions and sizes.
+      seed:         The seed of the random number generator.
+      maxbound:     The upper bound of the bounding Region,
+                    in each dimension.
+
+    Returns:
+      The parameters of the fixture.
+    """
+    assert distribution in Randoms.list()
+
+    return {'nregions': int(nregions), 'dimension': int(dimension),
+            'sizepc': float(sizepc), 'distribution': distribution,
+            'seed': int(seed), 'maxbound': float(maxbound),
+            'version': cls.Version}
+
+  @classmethod
+  def key(cls, params: FixtureParams) -> str:
+    """
+    Returns the content address of the fixture with the given parameters:
+    the hash of the parameters' canonical JSON representation.
+
+    Args:
+      params: The parameters of the fixture.
+
+    Returns:
+      The content address of the fixture.
+    """
+    return sha256(dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+  @classmethod
+  def paths(cls, params: FixtureParams, directory: str = None) -> Tuple[str, str, str]:
+    """
+    Returns the file paths of the fixture with the given parameters.
+
+    Args:
+      params:     The parameters of the fixture.
+      directory:  The directory of the fixture files.
+
+    Returns:
+      The file paths of the Regions (.npy), the graph
+      (.rig) and the manifest (.json), as a tuple.
+    """
+    path = join(directory or cls.FixtureDir, cls.key(params))
+
+    return (f'{path}.npy', f'{path}.rig', f'{path}.json')
+
+  ### Class Methods: Generation
+
+  @classmethod
+  def generate(cls, params: FixtureParams) -> RegionSet:
+    """
+    Randomly generate the collection of Regions with the given parameters.
+    The Regions are generated from independent random number generator
+    streams spawned from the parameters' seed (see RegionSet.random_chunks),
+    without using the global random number generator.
+
+    Args:
+      params: The parameters of the fixture.
+
+    Returns:
+      The newly generated collection of Regions.
+    """
+    dimension = params['dimension']
+    bounds    = Region([0]*dimension, [params['maxbound']]*dimension)
+    sizepc    = Region([0]*dimension, [params['sizepc']]*dimension)
+    rng       = params['distribution']
+
+    return RegionSet.from_random(params['nregions'], bounds=bounds, sizepc=sizepc,
+                                 posnrng=rng, sizerng=rng, seed=params['seed'])
+
+  ### Class Methods: Fixtures
+
+  @classmethod
+  def regions(cls, params: FixtureParams, directory: str = None) -> RegionSet:
+    """
+    Returns the collection of Regions with the given parameters, memory-mapped
+    from the fixture files if cached, or generated and cached otherwise.
+
+    Args:
+      params:     The parameters of the fixture.
+      directory:  The directory of the fixture files.
+
+    Returns:
+      The collection of Regions.
+    """
+    regionspath, _, manifestpath = cls.paths(params, directory)
+
+    if isfile(manifestpath) and isfile(regionspath):
+      return RegionSet.from_columnar(regionspath)
+
+    regions = cls.generate(params)
+    cls.store(params, regions, None, directory)
+
+    return regions
+
+  @classmethod
+  def graph(cls, params: FixtureParams, directory: str = None) -> Tuple[RegionSet, NxGraph]:
+    """
+    Returns the collection of Regions with the given parameters and its
+    Region intersection graph, memory-mapped from the fixture files if
+    cached, or generated, constructed and cached otherwise.
+
+    Args:
+      params:     The parameters of the fixture.
+      directory:  The directory of the fixture files.
+
+    Returns:
+      The collection of Regions + its associated
+      Region intersection graph.
+    """
+    regionspath, graphpath, manifestpath = cls.paths(params, directory)
+
+    if isfile(manifestpath) and isfile(regionspath) and isfile(graphpath):
+      return (RegionSet.from_columnar(regionspath), NxGraph.from_binary(graphpath))
+
+    if isfile(manifestpath) and isfile(regionspath):
+      regions = RegionSet.from_columnar(regionspath)
+    else:
+      regions = cls.generate(params)
+
+    graph = NxGraphSweepCtor.prepare(regions)()
+    cls.store(params, regions, graph, directory)
+
+    return (regions, graph)
+
+  @classmethod
+  def store(cls, params: FixtureParams, regions: RegionSet,
+                 graph: NxGraph = None, directory: str = None):
+    """
+    Store the given collection of Regions and Region intersection graph as
+    the fixture with the given parameters. Each file is written to a
+    temporary file first, unique to the writing process, so that concurrent
+    workers can store the same fixture, and the manifest is written last.
+
+    Args:
+      params:     The parameters of the fixture.
+      regions:    The collection of Regions.
+      graph:      The Region intersection graph, if any.
+      directory:  The directory of the fixture files.
+    """
+    regionspath, graphpath, manifestpath = cls.paths(params, directory)
+    makedirs(directory or cls.FixtureDir, exist_ok=True)
+    suffix = f'{getpid()}.tmp'
+
+    if not isfile(regionspath):
+      RegionSet.to_columnar(regions, f'{regionspath[:-4]}.{suffix}.npy')
+      replace(RegionSet.columnar_metapath(f'{regionspath[:-4]}.{suffix}.npy'),
+              RegionSet.columnar_metapath(regionspath))
+      replace(f'{regionspath[:-4]}.{suffix}.npy', regionspath)
+
+    if graph is not None:
+      with open(f'{graphpath}.{suffix}', 'wb') as output:
+        NxGraph.to_binary(graph, output)
+      replace(f'{graphpath}.{suffix}', graphpath)
+
+    with open(f'{manifestpath}.{suffix}', 'w') as output:
+      dump({'key': cls.key(params), 'params': params,
+            'graph': graph is not None or isfile(graphpath)}, output, indent=2)
+    replace(f'{manifestpath}.{suffix}', manifestpath)
+
+  @classmethod
+  def manifest(cls, params: FixtureParams, directory: str = None) -> Dict:
+    """
+    Returns the manifest of the cached fixture with the given parameters.
+
+    Args:
+      params:     The parameters of the fixture.
+      directory:  The directory of the fixture files.
+
+    Returns:
+      The manifest of the fixture.
+      None, if the fixture is not cached.
+    """
+    manifestpath = cls.paths(params, directory)[2]
+    if not isfile(manifestpath):
+      return None
+
+    with open(manifestpath, 'r') as source:
+      return load(source)
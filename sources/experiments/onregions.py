@@ -5,7 +5,9 @@ Abstract Experiments for Regions + Region Intersection Graphs
 
 Experiments to analyze relationship involving Regions and Region Intersection
 Graphs. Provide methods common for constructing Region Sets, Graphs, and
-Experiments.
+Experiments. The Region Sets and Graphs can be generated as fixtures, keyed
+by their parameters and seed, and cached on disk, so that later experiments
+memory-map them instead of generating and constructing them again.
 
 Classes:
 - ExperimentsOnRegions
@@ -15,6 +17,7 @@ from abc import ABCMeta, abstractmethod
 from inspect import stack
 from io import FileIO
 from numbers import Number
+from os.path import join
 from re import fullmatch, match
 from sys import stdout
 from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
@@ -22,6 +25,9 @@ from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 from sources.abstract import Experiment
 from sources.algorithms import NxGraphSweepCtor
 from sources.core import NxGraph, Region, RegionSet
+from sources.helpers import Randoms
+
+from .fixtures import ExperimentsFixtures
 
 
 class ExperimentsOnRegions(metaclass=ABCMeta):
@@ -48,12 +54,15 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
       X or series values (full experiment). True for
       test mode with reduced X or series values;
       False for full experiment.
+    experiments:
+      The Experiments constructed, in order.
   """
   xmap:       Dict[str, List[Number]]
   seriesmap:  Dict[str, List[Number]]
   data:       Dict[str, Any]
   measures:   Dict[str, Callable]
   istest:     bool
+  experiments: List[Experiment]
 
   def __init__(self, logger: FileIO, istest: bool = True):
     """
@@ -71,9 +80,11 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
     self.xmap      = {}
     self.seriesmap = {}
     self.measures  = {}
+    self.experiments = []
     self.data = {
       'logger': logger,
       'maxbound': 1000,
+      'distribution': 'uniform',
       'msgprefix': '{name} {function}'
     }
 
@@ -135,7 +146,9 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
     """
     bounds  = Region([0]*dimension, [experiment.data['maxbound']]*dimension)
     sizepr  = Region([0]*dimension, [sizepc]*dimension)
-    regions = RegionSet.from_random(nregions, bounds=bounds, sizepc=sizepr)
+    rng     = Randoms.get(experiment.data.get('distribution', 'uniform'))
+    regions = RegionSet.from_random(nregions, bounds=bounds, sizepc=sizepr,
+                                    posnrng=rng, sizerng=rng)
 
     self.output_log(experiment, {
       'nregions': nregions,
@@ -146,11 +159,13 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
     return regions
 
   def construct_graph(self, experiment: Experiment, nregions: int,
-                            sizepc: float, dimension: int) \
+                            sizepc: float, dimension: int,
+                            cache: bool = False, replicate: int = 0) \
                             -> Tuple[RegionSet, NxGraph]:
     """
     Construct a random collection of Regions + the associated Region
-    intersection graph for the given Experiment.
+    intersection graph for the given Experiment. If cache is True, returns
+    the fixture of the given replicate instead, as given by fixture_graph.
 
     Args:
       experiment:   The experiment for this graph.
@@ -158,11 +173,17 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
       sizepc:       The maximum size of Regions as a percent
                     of the bounding Region.
       dimension:    The dimensionality of Regions.
+      cache:        Boolean flag whether or not to return
+                    the (cached) fixture.
+      replicate:    The index of the fixture's replicate.
 
     Returns:
       The newly constructed randomly generated collection
       of Regions + its associated Region intersection graph.
     """
+    if cache:
+      return self.fixture_graph(experiment, nregions, sizepc, dimension, replicate)
+
     regions = self.construct_regions(experiment, nregions, sizepc, dimension)
     graph   = NxGraphSweepCtor.prepare(regions)()
 
@@ -174,6 +195,49 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
 
     return (regions, graph)
 
+  def fixture_graph(self, experiment: Experiment, nregions: int,
+                          sizepc: float, dimension: int, replicate: int = 0) \
+                          -> Tuple[RegionSet, NxGraph]:
+    """
+    Returns the fixture of a random collection of Regions + the associated
+    Region intersection graph for the given Experiment, generated from the
+    Experiment's seed for the given replicate (without affecting the state
+    of the random number generator). The fixtures are cached within the
+    Experiment's fixtures directory, if any, or otherwise within the
+    Experiment's checkpoint directory, if any.
+
+    Args:
+      experiment:   The experiment for this graph.
+      nregions:     The number of Regions in this graph.
+      sizepc:       The maximum size of Regions as a percent
+                    of the bounding Region.
+      dimension:    The dimensionality of Regions.
+      replicate:    The index of the fixture's replicate.
+
+    Returns:
+      The cached or newly constructed randomly generated
+      collection of Regions + its associated Region
+      intersection graph.
+    """
+    directory = experiment.data.get('fixtures')
+    if directory is None and experiment.checkpoint is not None:
+      directory = join(experiment.checkpoint, 'fixtures')
+
+    params = ExperimentsFixtures.params(nregions, dimension, sizepc,
+                                        experiment.data.get('distribution', 'uniform'),
+                                        experiment.fixtureseed(replicate),
+                                        experiment.data['maxbound'])
+
+    if directory is None:
+      regions = ExperimentsFixtures.generate(params)
+      graph   = NxGraphSweepCtor.prepare(regions)()
+    else:
+      regions, graph = ExperimentsFixtures.graph(params, directory)
+
+    self.output_log(experiment, {'fixture': ExperimentsFixtures.key(params), **params})
+
+    return (regions, graph)
+
   def construct_experiment(self, seriesx: Tuple[str, str] = None,
                                  name: str = None, **data):
     """
@@ -209,6 +273,7 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
     series, x   = self.seriesmap[sname], self.xmap[xname]
     expargs     = {'xname': xname, 'ynames': ynames, 'series': series, 'x': x}
     experiment  = Experiment(name, **{**expargs, **self.data, **data})
+    self.experiments.append(experiment)
 
     self.output_log(experiment, {'name': name, **expargs})
 
@@ -234,7 +299,7 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
   @classmethod
   def evaluate(cls, experiments: List[str] = [],
                     logger: FileIO = stdout,
-                    istest: bool = True):
+                    istest: bool = True, **data) -> List[Experiment]:
     """
     Evaluate the specified Experiments with whether or not the experiments
     are evaluated with full parameters: X-values or subsetted X-values for
@@ -252,8 +317,20 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
         X or series values (full experiment).
         True for test mode with reduced X or series values;
         False for full experiment.
+      data:
+        Additional controlled variables values for
+        each Experiment, such as the benchmark mode
+        parameters: warmup and mintime, and the
+        parallel evaluation parameters: jobs, pin
+        and seed, the checkpoint parameters:
+        checkpoint and resume, and the fixtures
+        directory: fixtures.
+
+    Returns:
+      The evaluated Experiments, in order.
     """
     exp = cls(logger, istest)
+    exp.data.update(data)
 
     def get_experiment_methods(exp) -> Iterator[str]:
       for name in dir(exp):
@@ -272,3 +349,5 @@ class ExperimentsOnRegions(metaclass=ABCMeta):
           for name in get_experiment_methods(exp):
             if name.startswith(method) or match(experiment, name) is not None:
               getattr(exp, name)()
+
+    return exp.experiments
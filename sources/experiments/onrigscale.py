@@ -17,12 +17,21 @@ X:      - nregions:   10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000
 Y:      - edges:      The number of overlapping Regions
         - isolated:   The percentage of unoverlapped Regions
         - degrees:    The average number of overlaps per Regions
+Y (memory experiments), for each phase (regions, graph, enumerate
+   for 2 dimensions only):
+        - elapsed:    The elapsed time of the phase (while tracing,
+                      excluding the tracemalloc snapshots)
+        - peak:       The peak traced memory during the phase
+        - retained:   The memory retained by the phase's result
+                      (the RegionSet or the NxGraph)
+        - blocks:     The number of traced memory blocks retained
 
 Implements the Experiments:
 - series(nregions),  x(sizepc)   -> y, fixed(dimension=2)
 - series(sizepc),    x(nregions) -> y, fixed(dimension=2)
 - series(dimension), x(sizepc)   -> y, fixed(nregions=1000)
 - series(dimension), x(nregions) -> y, fixed(sizepc=0.01)
+- memory: the same series and x-values, for the memory measures
 
 Classes:
 - ExperimentsOnRIGScale
@@ -32,13 +41,14 @@ from inspect import stack
 from io import FileIO
 from numbers import Number
 from sys import stdout
-from typing import Any, Callable, Dict, List, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from networkx import networkx as nx
 from numpy import mean
 
 from sources.abstract import Experiment
-from sources.algorithms import NxGraphSweepCtor
+from sources.algorithms import Enumerate, NxGraphSweepCtor
 from sources.core import Region, RegionSet
 
 from .onregions import ExperimentsOnRegions
@@ -55,7 +65,15 @@ class ExperimentsOnRIGScale(ExperimentsOnRegions):
 
   Extends:
     ExperimentsOnRegions
+
+  Class Attributes:
+    Phases: The phases of the memory experiments: generating
+            the Regions, constructing the Region intersection
+            graph and enumerating the Region intersections.
+            Enumeration is not measured across dimensions,
+            as it grows combinatorially in one dimension.
   """
+  Phases = ['regions', 'graph', 'enumerate']
 
   def __init__(self, logger: FileIO, istest: bool = True):
     """
@@ -88,7 +106,10 @@ class ExperimentsOnRIGScale(ExperimentsOnRegions):
 
   def common_experiment(self, exp: Experiment, ctor: GraphCtor):
     """
-    Evaluate the given experiment.
+    Evaluate the given experiment. Each round of each x-value and series
+    is an independent cell, evaluated in parallel if the experiment has
+    more than one job, and recorded to the experiment's checkpoint log
+    (skipped if already recorded, when resumed).
 
     Args:
       exp:
@@ -96,15 +117,19 @@ class ExperimentsOnRIGScale(ExperimentsOnRegions):
       ctor:
         The constructor of Region intersection graph.
     """
-    for x in exp.x:
-      self.output_log(exp, {'x': x})
-      for n in range(0, exp.rounds):
-        self.output_log(exp, {'x': x, 'n': n})
-        for s in exp.series:
-          G = ctor(exp, s, x)
-          y = [v(G) for _, v in self.measures.items()]
-          self.output_log(exp, {'x': x, 'n': n, 'series': s, 'y': y})
-          exp.sety((x, s), tuple(y))
+    def evaluate(x: Number, n: int, s: str):
+      if exp.restore((x, s), n):
+        return
+      self.output_log(exp, {'x': x, 'n': n, 'series': s})
+      start = perf_counter()
+      G = ctor(exp, s, x)
+      elapsed = perf_counter() - start
+      y = [v(G) for _, v in self.measures.items()]
+      self.output_log(exp, {'x': x, 'n': n, 'series': s, 'y': y})
+      exp.record((x, s), n, tuple(y), elapsed)
+
+    cells = [(x, n, s) for x in exp.x for n in range(0, exp.rounds) for s in exp.series]
+    list(exp.evaluate_cells(evaluate, cells))
 
     for measure in self.measures.keys():
       name  = f'{exp.name}_{measure}'
@@ -116,6 +141,81 @@ class ExperimentsOnRIGScale(ExperimentsOnRegions):
       with open(f'data/{name}_barchart.png', 'wb') as f:
         exp.output_barchart(f, measure, title=name, yscale=scale)
 
+  def common_experiment_memory(self, exp: Experiment, nregions: Callable[[str, Number], int],
+                                     sizepc: Callable[[str, Number], float],
+                                     dimension: Callable[[str, Number], int]):
+    """
+    Evaluate the given memory experiment. For each round of each x-value and
+    series, measures the elapsed time and memory of each of the experiment's
+    phases: generating the Regions, constructing the Region intersection
+    graph and enumerating all Region intersections. Each round of each
+    x-value and series is an independent cell, evaluated in parallel if
+    the experiment has more than one job, and recorded to the experiment's
+    checkpoint log (skipped if already recorded, when resumed).
+
+    Args:
+      exp:
+        The memory experiment to be evaluated.
+      nregions, sizepc, dimension:
+        The methods for computing the number of Regions,
+        the Region size and the dimensionality from the
+        series and x-value.
+    """
+    phases = exp.data['phases']
+
+    def measure(function: Callable, *args) -> Tuple[Any, List[Number]]:
+      elapsed = []
+      def timed(*args):
+        start  = perf_counter()
+        result = function(*args)
+        elapsed.append(perf_counter() - start)
+        return result
+      result, memory = exp.memit(timed, *args)
+      return result, [elapsed[0], *[memory[m] for m in exp.MemoryMeasures]]
+
+    def evaluate(x: Number, n: int, s: str):
+      if exp.restore((x, s), n):
+        return
+      self.output_log(exp, {'x': x, 'n': n, 'series': s})
+      params = (nregions(s, x), sizepc(s, x), dimension(s, x))
+      R, yr  = measure(self.construct_regions, exp, *params)
+      G, yg  = measure(lambda R: NxGraphSweepCtor.prepare(R)(), R)
+      y = [*yr, *yg]
+      if 'enumerate' in phases:
+        _, ye = measure(lambda G: sum([1 for _ in Enumerate.get('slig', G)()]), G)
+        y.extend(ye)
+      self.output_log(exp, {'x': x, 'n': n, 'series': s, 'y': y})
+      exp.record((x, s), n, tuple(y))
+
+    cells = [(x, n, s) for x in exp.x for n in range(0, exp.rounds) for s in exp.series]
+    list(exp.evaluate_cells(evaluate, cells))
+
+    for yname in exp.ynames:
+      name = f'{exp.name}_{yname}'
+      with open(f'data/{name}.csv', 'w', newline='') as f:
+        exp.output_csv(f, yname)
+      with open(f'data/{name}_lineplot.png', 'wb') as f:
+        exp.output_lineplot(f, yname, title=name, xscale='log', yscale='symlog')
+
+  def construct_experiment_memory(self, phases: List[str]) -> Experiment:
+    """
+    Constructs a new memory Experiment with the series and x-values from the
+    caller function's name, and with the elapsed time and memory measures of
+    each of the given phases as the Y components.
+
+    Args:
+      phases: The phases to measure, in order.
+
+    Returns:
+      The newly constructed memory Experiment.
+    """
+    assert phases == self.Phases[:len(phases)]
+
+    name   = stack()[1].function
+    ynames = [f'{p}_{m}' for p in phases for m in ['elapsed', *Experiment.MemoryMeasures]]
+
+    return self.construct_experiment(name=name, ynames=ynames, rounds=3, phases=phases)
+
   ### Methods: Experiments
 
   def experiment_nregions_sizepc(self):
@@ -137,3 +237,19 @@ class ExperimentsOnRIGScale(ExperimentsOnRegions):
     exp  = self.construct_experiment()
     ctor = lambda exp, s, x: self.construct_graph(exp, x, 0.01, s)[1].G
     self.common_experiment(exp, ctor)
+
+  def experiment_nregions_sizepc_memory(self):
+    exp = self.construct_experiment_memory(self.Phases)
+    self.common_experiment_memory(exp, lambda s, x: s, lambda s, x: x, lambda s, x: 2)
+
+  def experiment_sizepc_nregions_memory(self):
+    exp = self.construct_experiment_memory(self.Phases)
+    self.common_experiment_memory(exp, lambda s, x: x, lambda s, x: s, lambda s, x: 2)
+
+  def experiment_dimension_sizepc_memory(self):
+    exp = self.construct_experiment_memory(self.Phases[:2])
+    self.common_experiment_memory(exp, lambda s, x: 1000, lambda s, x: x, lambda s, x: s)
+
+  def experiment_dimension_nregions_memory(self):
+    exp = self.construct_experiment_memory(self.Phases[:2])
+    self.common_experiment_memory(exp, lambda s, x: x, lambda s, x: 0.01, lambda s, x: s)
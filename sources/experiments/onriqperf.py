@@ -8,7 +8,9 @@ intersection graphs. Analyzes the performance of the baseline Region cycle
 sweep-line algorithm, Region intersection graph construction + clique
 enumeration, and pre-constructed Region intersection graph clique enumeration
 algorithms for enumerating all Region intersections, Region intersections with
-a given subset, and a specific Region + its neighbors.
+a given subset, and a specific Region + its neighbors. The Regions and Region
+intersection graph of each x-value are fixtures, generated from the experiment's
+seed, and cached on disk if given a fixtures (or checkpoint) directory.
 
 Fixed:  - bounds:     0, 1000
         - dimension:  2
@@ -17,6 +19,9 @@ X:      - nregions:   10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000
         - qsizepc:    0.01, 0.02, 0.05, 0.1, 0.2, 0.5
         - sizepc:     0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1
 Y:      - elapsed:    The average elapsed time to evaluate each query.
+                      In benchmark mode, the median elapsed time,
+                      also output with its IQR and confidence
+                      interval as JSON.
 
 Implements the Experiments:
 - enumerate:  series(method), x(nregions) -> y, fixed(rounds=10, sizepc=0.01)
@@ -141,27 +146,33 @@ class ExperimentsOnRIQPerf(ExperimentsOnRegions):
     Returns:
       The elapsed time for the enumeration of
       the query with the given evaluation method.
+      In benchmark mode, the average elapsed time
+      over the repeated, timed enumerations.
     """
-    level = 0
     counter = {'length': 0}
-    startclk = perf_counter()
 
-    for _, (_, intersect) in enumerate(alg(regions, graph, query)):
-      if level < len(intersect):
-        level = len(intersect)
-        counter[level] = 0
+    def evaluate():
+      level = 0
+      counter.clear()
+      counter['length'] = 0
+      for _, (_, intersect) in enumerate(alg(regions, graph, query)):
+        if level < len(intersect):
+          level = len(intersect)
+          counter[level] = 0
 
-      counter[level] += 1
-      counter['length'] += 1
+        counter[level] += 1
+        counter['length'] += 1
 
+    startclk = perf_counter()
+    elapsed, repeats = exp.timeit(evaluate)
     stopclk  = perf_counter()
-    elapsed  = stopclk - startclk
 
     self.output_log(exp, {
       'params':   params,
       'start':    startclk,
       'stop':     stopclk,
       'elapsed':  elapsed,
+      'repeats':  repeats,
       'count':    counter
     })
 
@@ -173,7 +184,11 @@ class ExperimentsOnRIQPerf(ExperimentsOnRegions):
                               query: RegionQueryRnd,
                               algs: Dict[str, Algorithm]):
     """
-    Evaluate the given experiment.
+    Evaluate the given experiment. Each x-value is an independent cell
+    (its Regions and Region intersection graph are shared by each round
+    and series), evaluated in parallel if the experiment has more than
+    one job. Each measurement is recorded to the experiment's checkpoint
+    log (skipped if already recorded, when resumed).
 
     Args:
       exp:    The experiment to be evaluated.
@@ -185,23 +200,40 @@ class ExperimentsOnRIQPerf(ExperimentsOnRegions):
       algs:   The methods for generating the Iterators
               for each query method.
     """
-    for x in exp.x:
+    def evaluate(x: Number):
+      rounds = range(0, exp.rounds)
+      if all([exp.isrecorded((x, s), n) for n in rounds for s in exp.series]):
+        for n in rounds:
+          for s in exp.series:
+            exp.restore((x, s), n)
+        return
+
       self.output_log(exp, {'x': x})
       R, G = ctor(exp, x)
-      for n in range(0, exp.rounds):
+      for n in rounds:
         self.output_log(exp, {'x': x, 'n': n})
         Q = query(exp, R, x)
         for s in exp.series:
+          if exp.restore((x, s), n):
+            continue
           y = self.measures[exp.ynames](exp, (s, x, n), R, G, Q, algs[s])
           self.output_log(exp, {'x': x, 'n': n, 'series': s, 'y': y})
-          exp.sety((x, s), y)
+          exp.record((x, s), n, y, y)
+
+    cells = [(x,) for x in exp.x]
+    list(exp.evaluate_cells(evaluate, cells))
+
+    measure = (exp.ynames, 'median') if exp.benchmark else None
 
     with open(f'data/{exp.name}.csv', 'w', newline='') as f:
-      exp.output_csv(f)
+      exp.output_csv(f, measure)
     with open(f'data/{exp.name}_lineplot.png', 'wb') as f:
-      exp.output_lineplot(f, title=exp.name)
+      exp.output_lineplot(f, measure, title=exp.name)
     with open(f'data/{exp.name}_barchart.png', 'wb') as f:
-      exp.output_barchart(f, title=exp.name)
+      exp.output_barchart(f, measure, title=exp.name)
+    if exp.benchmark:
+      with open(f'data/{exp.name}.json', 'w') as f:
+        exp.output_json(f)
 
   def common_experiment_enumerate(self, exp: Experiment, ctor: RegionDSCtor):
     """
@@ -265,46 +297,46 @@ class ExperimentsOnRIQPerf(ExperimentsOnRegions):
   def experiment_enumerate_nregions(self):
     self.common_experiment_enumerate(
       self.construct_experiment(('method', 'nregions'), rounds=10),
-      lambda exp, x: self.construct_graph(exp, x, 0.01, 2)
+      lambda exp, x: self.construct_graph(exp, x, 0.01, 2, cache=True)
     )
 
   def experiment_enumerate_sizepc(self):
     self.common_experiment_enumerate(
       self.construct_experiment(('method', 'sizepc'), rounds=10),
-      lambda exp, x: self.construct_graph(exp, 1000, x, 2)
+      lambda exp, x: self.construct_graph(exp, 1000, x, 2, cache=True)
     )
 
   def experiment_mrqenum_nregions(self):
     self.common_experiment_mrqenum(
       self.construct_experiment(('method', 'nregions'), rounds=100),
-      lambda exp, x: self.construct_graph(exp, x, 0.01, 2),
+      lambda exp, x: self.construct_graph(exp, x, 0.01, 2, cache=True),
       lambda exp, r, x: self.choose_query_subset(r, 0.1)
     )
 
   def experiment_mrqenum_sizepc(self):
     self.common_experiment_mrqenum(
       self.construct_experiment(('method', 'sizepc'), rounds=100),
-      lambda exp, x: self.construct_graph(exp, 1000, x, 2),
+      lambda exp, x: self.construct_graph(exp, 1000, x, 2, cache=True),
       lambda exp, r, x: self.choose_query_subset(r, 0.1)
     )
 
   def experiment_mrqenum_qsizepc(self):
     self.common_experiment_mrqenum(
       self.construct_experiment(('method', 'qsizepc'), rounds=100),
-      lambda exp, x: self.construct_graph(exp, 1000, 0.01, 2),
+      lambda exp, x: self.construct_graph(exp, 1000, 0.01, 2, cache=True),
       lambda exp, r, x: self.choose_query_subset(r, x)
     )
 
   def experiment_srqenum_nregions(self):
     self.common_experiment_srqenum(
       self.construct_experiment(('method', 'nregions'), rounds=100),
-      lambda exp, x: self.construct_graph(exp, x, 0.01, 2),
+      lambda exp, x: self.construct_graph(exp, x, 0.01, 2, cache=True),
       lambda exp, r, x: self.choose_query_region(r)
     )
 
   def experiment_srqenum_sizepc(self):
     self.common_experiment_srqenum(
       self.construct_experiment(('method', 'sizepc'), rounds=100),
-      lambda exp, x: self.construct_graph(exp, 1000, x, 2),
+      lambda exp, x: self.construct_graph(exp, 1000, x, 2, cache=True),
       lambda exp, r, x: self.choose_query_region(r)
     )
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+
+"""
+Performance Regression Baselines for Experiments
+
+Saves the per-point timings (for each experiment, x-value and series) of an
+evaluation of the experiments as a named baseline file, and compares the
+timings of a new evaluation against a baseline. A point is flagged as a
+regression if its median timing is slower than the baseline's median by more
+than the threshold (as a fraction of the baseline's median), and if the slow
+down is statistically significant: the confidence intervals of the medians
+do not overlap. Outputs the comparison as a report Experiment, whose
+x-values are the compared points and whose series are 'baseline' and
+'current', as CSV and as a bar chart.
+
+Types:
+- PointKey
+
+Classes:
+- ExperimentsRegression
+"""
+
+from json import dump, load
+from os import makedirs
+from os.path import dirname, join
+from time import strftime
+from typing import Any, Dict, List, Tuple
+
+from sources.abstract import Experiment
+
+
+PointKey = Tuple[str, str, str]
+
+
+class ExperimentsRegression:
+  """
+  Performance regression baselines and comparisons
+  for the timings of evaluated Experiments.
+
+  Class Attributes:
+    BaselineDir:  The default directory of the named
+                  baseline files.
+    Threshold:    The default fraction of the baseline's
+                  median timing by which a point must be
+                  slower to be flagged as a regression.
+    Confidence:   The confidence level of the confidence
+                  intervals of the median timings.
+  """
+  BaselineDir = 'data/baselines'
+  Threshold   = 0.1
+  Confidence  = 0.95
+
+  ### Class Methods: Helpers
+
+  @classmethod
+  def baseline_path(cls, name: str, directory: str = None) -> str:
+    """
+    Returns the file path of the named baseline.
+
+    Args:
+      name:       The name of the baseline.
+      directory:  The directory of the baseline files.
+
+    Returns:
+      The file path of the baseline.
+    """
+    return join(directory or cls.BaselineDir, f'{name}.json')
+
+  @classmethod
+  def points(cls, experiments: List[Experiment]) -> Dict[PointKey, List[float]]:
+    """
+    Returns the timings of each point of the given Experiments, keyed on the
+    experiment name, series and x-value (as strings, so that the keys remain
+    stable through JSON serialization).
+
+    Args:
+      experiments:  The evaluated Experiments.
+
+    Returns:
+      The mapping of points to their timings.
+    """
+    points = {}
+    for exp in experiments:
+      for (x, s), timings in exp.timings.items():
+        if len(timings) > 0:
+          points[(exp.name, str(s), str(x))] = list(timings)
+    return points
+
+  ### Class Methods: Baselines
+
+  @classmethod
+  def to_baseline(cls, name: str, experiments: List[Experiment]) -> Dict[str, Any]:
+    """
+    Returns the baseline with the given name, for the timings of the
+    given Experiments.
+
+    Args:
+      name:         The name of the baseline.
+      experiments:  The evaluated Experiments.
+
+    Returns:
+      The baseline, as a JSON-serializable object.
+    """
+    return {
+      'baseline': name,
+      'created': strftime('%Y-%m-%d %H:%M:%S %z'),
+      'points': [{'experiment': e, 'series': s, 'x': x, 'timings': t}
+                 for (e, s, x), t in cls.points(experiments).items()]
+    }
+
+  @classmethod
+  def save_baseline(cls, name: str, experiments: List[Experiment], directory: str = None) -> str:
+    """
+    Save the timings of the given Experiments as the named baseline file.
+    Replaces any existing baseline with the same name.
+
+    Args:
+      name:         The name of the baseline.
+      experiments:  The evaluated Experiments.
+      directory:    The directory of the baseline files.
+
+    Returns:
+      The file path of the saved baseline.
+    """
+    path = cls.baseline_path(name, directory)
+    makedirs(dirname(path) or '.', exist_ok=True)
+
+    with open(path, 'w') as output:
+      dump(cls.to_baseline(name, experiments), output, indent=2)
+
+    return path
+
+  @classmethod
+  def load_baseline(cls, name: str, directory: str = None) -> Dict[PointKey, List[float]]:
+    """
+    Load the timings of each point of the named baseline file.
+
+    Args:
+      name:       The name of the baseline.
+      directory:  The directory of the baseline files.
+
+    Returns:
+      The mapping of points to their timings.
+    """
+    with open(cls.baseline_path(name, directory), 'r') as source:
+      baseline = load(source)
+
+    return dict(((p['experiment'], p['series'], p['x']), p['timings'])
+                for p in baseline['points'])
+
+  ### Class Methods: Comparison
+
+  @classmethod
+  def compare(cls, baseline: Dict[PointKey, List[float]],
+                   experiments: List[Experiment],
+                   threshold: float = None,
+                   name: str = 'regression') -> Tuple[Experiment, List[Dict]]:
+    """
+    Compare the timings of the given Experiments against the given baseline
+    timings, for the points within both. Flags a point as a regression if
+    its median timing exceeds the baseline's median by more than the given
+    threshold, and the confidence intervals of the medians do not overlap.
+
+    Args:
+      baseline:     The mapping of points to the baseline
+                    timings.
+      experiments:  The evaluated Experiments.
+      threshold:    The fraction of the baseline's median
+                    by which a point must be slower to be
+                    flagged as a regression.
+      name:         The name of the report Experiment.
+
+    Returns:
+      The report Experiment, with the compared points as the
+      x-values and 'baseline' and 'current' as the series,
+      and the comparison of each point, as a tuple.
+    """
+    threshold = cls.Threshold if threshold is None else threshold
+    current   = cls.points(experiments)
+    keys      = [k for k in current.keys() if k in baseline]
+    labels    = [f'{e}[{s}]@{x}' for e, s, x in keys]
+
+    report = Experiment(name, 'point', 'elapsed', ['baseline', 'current'],
+                        labels, confidence=cls.Confidence)
+    comparisons = []
+
+    for label, key in zip(labels, keys):
+      for t in baseline[key]:
+        report.sety((label, 'baseline'), t)
+      for t in current[key]:
+        report.sety((label, 'current'), t)
+
+      before = Experiment.summarize(baseline[key], cls.Confidence)
+      after  = Experiment.summarize(current[key], cls.Confidence)
+      ratio  = after['median'] / before['median'] if before['median'] > 0 else float('inf')
+
+      comparisons.append({
+        'experiment': key[0],
+        'series': key[1],
+        'x': key[2],
+        'baseline': before['median'],
+        'current': after['median'],
+        'ratio': ratio,
+        'significant': after['ci_lower'] > before['ci_upper'],
+        'regression': ratio > 1 + threshold and after['ci_lower'] > before['ci_upper']
+      })
+
+    return report, comparisons
+
+  @classmethod
+  def output_report(cls, report: Experiment, output: str):
+    """
+    Output the given report Experiment as CSV (one row per compared point,
+    with the baseline and current median timings) and as a bar chart, to
+    the given output path prefix.
+
+    Args:
+      report: The report Experiment.
+      output: The output path prefix of the CSV (.csv)
+              and bar chart (_barchart.png) files.
+    """
+    measure = (report.ynames, 'median')
+
+    with open(f'{output}.csv', 'w', newline='') as f:
+      report.output_csv(f, measure, orientation=False)
+    with open(f'{output}_barchart.png', 'wb') as f:
+      report.output_barchart(f, measure, title=report.name)
@@ -1,4 +1,7 @@
 #!/usr/bin/env python
 
 from .base26 import *
+from .compression import *
+from .jsonstream import *
+from .lazyimport import *
 from .randoms import *
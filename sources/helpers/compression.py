@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+"""
+Transparent Compression for Streams
+
+Implements methods for reading and writing text or binary streams that are
+compressed in the gzip, bz2 or lzma (xz) formats, chosen by name or inferred
+from the file extension. The data is compressed or decompressed incrementally
+as it is written or read, without holding the decompressed content in memory.
+
+Types:
+- Compressions
+
+Methods:
+- compression_of
+- is_compressed
+- open_compressed
+- compressed
+"""
+
+from bz2 import BZ2File, open as bz2open
+from contextlib import contextmanager
+from gzip import GzipFile, open as gzipopen
+from io import TextIOBase, TextIOWrapper
+from lzma import LZMAFile, open as lzmaopen
+from os import PathLike, fspath
+from typing import IO, Callable, Dict, Iterator, List, Tuple, Union
+
+
+Compressions: Dict[str, Tuple[List[str], Callable[..., IO]]] = {
+  'gzip': (['.gz', '.gzip'], gzipopen),
+  'bz2':  (['.bz2'],         bz2open),
+  'lzma': (['.xz', '.lzma'], lzmaopen)
+}
+
+
+def compression_of(path: Union[str, PathLike, None], compression: str = 'infer') -> str:
+  """
+  Resolve the compression format for the given file path. If compression is
+  'infer', infers the compression format from the file extension. Returns
+  None if the file is not compressed.
+
+  Args:
+    path:
+      The file path, or None if unknown.
+    compression:
+      The compression format: 'gzip', 'bz2', 'lzma',
+      'infer' from the file extension or None.
+
+  Returns:
+    The resolved compression format.
+    None, if not compressed.
+
+  Raises:
+    ValueError: If compression format is unsupported.
+  """
+  if compression is None:
+    return None
+  if compression in Compressions:
+    return compression
+  if compression != 'infer':
+    raise ValueError(f'Unsupported "{compression}" compression format')
+  if not isinstance(path, (str, PathLike)):
+    return None
+
+  path = fspath(path).lower()
+  for name, (extensions, _) in Compressions.items():
+    if any([path.endswith(ext) for ext in extensions]):
+      return name
+
+  return None
+
+
+def is_compressed(stream: IO) -> bool:
+  """
+  Determine if the given text or binary stream
+  is read or written through a compressed stream.
+
+  Args:
+    stream: The text or binary stream.
+
+  Returns:
+    True:   If the stream is compressed.
+    False:  Otherwise.
+  """
+  stream = getattr(stream, 'buffer', stream)
+  return isinstance(stream, (GzipFile, BZ2File, LZMAFile))
+
+
+def open_compressed(path: Union[str, PathLike], mode: str = 'r',
+                    compression: str = 'infer', **kwargs) -> IO:
+  """
+  Open the given file path in the given mode, compressed in the given
+  compression format or the format inferred from the file extension.
+  Text modes return a text stream that compresses or decompresses the
+  underlying file incrementally. Closing the stream closes the file.
+
+  Args:
+    path:         The file path to open.
+    mode:         The file mode, as for open().
+    compression:  The compression format: 'gzip', 'bz2',
+                  'lzma', 'infer' from the file extension
+                  or None.
+    kwargs:       Additional arguments to be passed to
+                  the text stream: encoding, errors and
+                  newline.
+
+  Returns:
+    The opened text or binary stream.
+  """
+  compression = compression_of(path, compression)
+
+  if compression is None:
+    return open(path, mode, **kwargs)
+
+  _, opener = Compressions[compression]
+  stream = opener(fspath(path), mode.replace('t', '').replace('b', '') + 'b')
+
+  if 'b' in mode:
+    return stream
+
+  kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
+  return TextIOWrapper(stream, **{'encoding': 'utf-8', **kwargs})
+
+
+@contextmanager
+def compressed(stream: IO, mode: str = 'r', compression: str = 'infer') -> Iterator[IO]:
+  """
+  Context manager that compresses or decompresses the given, already open,
+  text or binary stream incrementally in the given compression format or
+  the format inferred from the stream's file name. Yields a stream of the
+  same kind (text or binary) as the given stream. Yields the given stream
+  unchanged if not compressed or if already read or written through a
+  compressed stream. On exit, flushes and finalizes the compressed stream,
+  leaving the given stream open.
+
+  Args:
+    stream:       The open text or binary stream.
+    mode:         The stream mode: 'r' or 'w'.
+    compression:  The compression format: 'gzip', 'bz2',
+                  'lzma', 'infer' from the file name
+                  or None.
+
+  Returns:
+    An Iterator of the single (de)compressed stream.
+  """
+  assert mode in ['r', 'w']
+
+  compression = compression_of(getattr(stream, 'name', None), compression)
+
+  if compression is None or is_compressed(stream):
+    yield stream
+    return
+
+  istext = isinstance(stream, TextIOBase)
+  assert not istext or hasattr(stream, 'buffer')
+
+  if istext and mode == 'w':
+    stream.flush()
+
+  _, opener = Compressions[compression]
+  cstream   = opener(stream.buffer if istext else stream, mode + 'b')
+  wrapper   = TextIOWrapper(cstream, encoding='utf-8') if istext else None
+
+  try:
+    yield wrapper if istext else cstream
+  finally:
+    if istext:
+      wrapper.flush()
+      wrapper.detach()
+    cstream.close()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+"""
+Streaming JSON Reader
+
+Implements an incremental, pull-based JSON reader over a text input source.
+Reads the input source in chunks and parses the JSON document one value at
+a time, so that large arrays can be iterated over element by element
+without first loading the entire document or its full Python object tree
+into memory.
+
+Classes:
+- JSONStream
+"""
+
+from io import TextIOBase
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Iterator
+
+
+class JSONStream:
+  """
+  Incremental, pull-based JSON reader over a text input source.
+
+  The caller walks the JSON document in order: members() iterates over the
+  keys of the next JSON object, elements() iterates over the indices of the
+  next JSON array, and value() parses the next complete JSON value. After
+  each key or index is yielded, the caller must consume the corresponding
+  value with exactly one call to value(), members() or elements() before
+  advancing the iterator.
+
+  Attributes:
+    source:     The text input source to be read.
+    chunksize:  The minimum number of characters to read
+                from the input source at a time.
+    buffer:     The characters read but not yet consumed.
+    position:   The position of the next unconsumed
+                character within the buffer.
+    eof:        Whether or not the end of the input
+                source has been reached.
+  """
+  source: TextIOBase
+  chunksize: int
+  buffer: str
+  position: int
+  eof: bool
+
+  decoder    = JSONDecoder()
+  whitespace = ' \t\n\r'
+  numeric    = '0123456789+-.eE'
+
+  def __init__(self, source: TextIOBase, chunksize: int = 2**16):
+    """
+    Initialize a new streaming JSON reader over the given text input source.
+
+    Args:
+      source:     The text input source to be read.
+      chunksize:  The minimum number of characters to read
+                  from the input source at a time.
+    """
+    assert source.readable()
+    assert isinstance(chunksize, int) and chunksize > 0
+
+    self.source    = source
+    self.chunksize = chunksize
+    self.buffer    = ''
+    self.position  = 0
+    self.eof       = False
+
+  ### Methods: Helpers
+
+  def _fill(self) -> bool:
+    """
+    Read the next chunk from the input source into the buffer, discarding
+    the consumed characters. Reads at least as many characters as remain
+    unconsumed, so that values spanning many chunks are parsed in amortized
+    linear time.
+
+    Returns:
+      True:   If more characters were read.
+      False:  If the end of the input source was reached.
+    """
+    remaining = len(self.buffer) - self.position
+    chunk     = self.source.read(max(self.chunksize, remaining))
+
+    self.buffer   = self.buffer[self.position:] + chunk
+    self.position = 0
+    self.eof      = len(chunk) == 0
+
+    return not self.eof
+
+  def _expect(self, chars: str) -> str:
+    """
+    Consume the next non-whitespace character, which must be one of the
+    given characters.
+
+    Args:
+      chars:  The allowed characters.
+
+    Returns:
+      The consumed character.
+
+    Raises:
+      ValueError: If the next character is not allowed.
+    """
+    char = self.peek()
+
+    if len(char) == 0 or char not in chars:
+      raise ValueError(f'Expected one of "{chars}", found "{char}"')
+
+    self.position += 1
+    return char
+
+  ### Methods: Parsing
+
+  def peek(self) -> str:
+    """
+    Skip any whitespace and return the next character without consuming it.
+    Returns an empty string at the end of the input source.
+
+    Returns:
+      The next non-whitespace character.
+    """
+    while True:
+      while self.position < len(self.buffer):
+        if self.buffer[self.position] not in self.whitespace:
+          return self.buffer[self.position]
+        self.position += 1
+      if not self._fill():
+        return ''
+
+  def value(self) -> Any:
+    """
+    Parse and consume the next complete JSON value.
+
+    Returns:
+      The parsed JSON value.
+
+    Raises:
+      ValueError: If the next JSON value is malformed.
+    """
+    self.peek()
+
+    while True:
+      try:
+        value, end = self.decoder.raw_decode(self.buffer, self.position)
+        # A number at the end of the buffer may continue in the next chunk.
+        if self.eof or (end < len(self.buffer) and self.buffer[end] not in self.numeric):
+          self.position = end
+          return value
+      except JSONDecodeError:
+        if self.eof:
+          raise
+      self._fill()
+
+  def members(self) -> Iterator[str]:
+    """
+    Iterate over the keys of the next JSON object. The value
+    of each key must be consumed before advancing the iterator.
+
+    Returns:
+      An Iterator of the JSON object's keys.
+
+    Raises:
+      ValueError: If the next JSON value is not an object.
+    """
+    self._expect('{')
+
+    if self.peek() == '}':
+      self.position += 1
+      return
+
+    while True:
+      key = self.value()
+      if not isinstance(key, str):
+        raise ValueError(f'Expected object key, found "{key}"')
+
+      self._expect(':')
+      yield key
+
+      if self._expect(',}') == '}':
+        return
+
+  def elements(self) -> Iterator[int]:
+    """
+    Iterate over the indices of the elements of the next JSON array.
+    Each element must be consumed before advancing the iterator.
+
+    Returns:
+      An Iterator of the JSON array's indices.
+
+    Raises:
+      ValueError: If the next JSON value is not an array.
+    """
+    self._expect('[')
+
+    if self.peek() == ']':
+      self.position += 1
+      return
+
+    index = 0
+    while True:
+      yield index
+      index += 1
+
+      if self._expect(',]') == ']':
+        return
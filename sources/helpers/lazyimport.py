@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""
+Lazy Importing of Submodules
+
+Implements module-level attribute hooks (PEP 562) for packages that re-export
+the contents of submodules with heavy or optional dependencies (such as
+matplotlib or pandas). The submodules are only imported the first time one
+of their attributes is accessed on the package, so that importing the
+package, or any of its other submodules, does not pay for their imports.
+
+Methods:
+- lazy_exports
+"""
+
+from importlib import import_module
+from sys import modules
+from typing import Any, Callable, List, Tuple
+
+
+def lazy_exports(package: str, submodules: List[str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+  """
+  Create the module-level __getattr__ and __dir__ functions for the given
+  package, that lazily re-export the given submodules and their public
+  attributes. On the first access of an attribute that is not defined on
+  the package, imports each of the given submodules in order, until one of
+  them defines the attribute, and caches the attribute on the package. On
+  the first access of __all__ (from a star import), imports all of the given
+  submodules and exports the submodules and their public attributes, as the
+  eager star imports of the submodules would.
+
+  Args:
+    package:    The fully qualified name of the package.
+    submodules: The names of the submodules, relative
+                to the package, to be lazily re-exported.
+
+  Returns:
+    The __getattr__ and __dir__ functions for the
+    package, as a tuple.
+  """
+  def __getattr__(name: str) -> Any:
+    if name == '__all__':
+      exports = [n for n in vars(modules[package]) if not n.startswith('_')]
+      for submodule in submodules:
+        module  = import_module(f'.{submodule}', package)
+        public  = [n for n in vars(module) if not n.startswith('_')]
+        exports = exports + [submodule] + list(getattr(module, '__all__', public))
+      exports = list(dict.fromkeys(exports))
+      setattr(modules[package], '__all__', exports)
+      return exports
+    if name.startswith('__'):
+      raise AttributeError(f'module {package!r} has no attribute {name!r}')
+    if name in submodules:
+      return import_module(f'.{name}', package)
+
+    for submodule in submodules:
+      module = import_module(f'.{submodule}', package)
+      if hasattr(module, name) and not name.startswith('_'):
+        value = getattr(module, name)
+        setattr(modules[package], name, value)
+        return value
+
+    raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+  def __dir__() -> List[str]:
+    return sorted(set(vars(modules[package])) | set(submodules))
+
+  return __getattr__, __dir__
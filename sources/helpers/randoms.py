@@ -7,7 +7,11 @@ Implements the Randoms class, a static class that provides factory methods
 that each return Callable (lambdas) that are preconfigured to generate random
 values based on a particular distribution or random number generation
 function. The only missing parameters is the lower and upper bounds of the
-values generated and the sample size of the output.
+values generated and the sample size of the output. Each function draws from
+the global NumPy random number generator, or from the explicitly given
+(seeded) random number generator. Independent random number generator
+streams can be spawned from a single master seed, for reproducible
+generation in parallel.
 
 Types:
 - ShapeSize
@@ -21,6 +25,7 @@ Classes:
 from typing import Callable, Dict, List, Union
 
 from numpy import ndarray, mean, random
+from numpy.random import Generator, SeedSequence, default_rng
 
 
 ShapeSize = Union[None, int, List[int]]
@@ -35,6 +40,10 @@ class Randoms:
   particular distribution or random number generation function. The only
   missing parameters is the lower and upper bounds of the values generated
   and the sample size of the output.
+
+  Each factory method accepts an explicit random number generator
+  (a numpy.random.Generator), or draws from the global NumPy random
+  number generator if none is given.
   """
 
   @classmethod
@@ -81,33 +90,61 @@ class Randoms:
       The list of available random number
       generators (distributions).
     """
-    excluded = ['get', 'list']
+    excluded = ['get', 'list', 'stream']
     israndng = lambda f: all([callable(getattr(cls, f)), f not in excluded,
                               not f.startswith('_')])
 
     return [f for f in dir(cls) if israndng(f)]
 
+  @classmethod
+  def stream(cls, seed: int, index: int = 0) -> Generator:
+    """
+    Returns an independent random number generator stream, spawned from the
+    given master seed for the given stream index. The streams of different
+    indices are statistically independent, and the same master seed and
+    index always returns the same stream, so that the random values can be
+    drawn in any order or by any number of worker processes.
+
+    Args:
+      seed:   The master seed.
+      index:  The index of the stream.
+
+    Returns:
+      The seeded random number generator.
+    """
+    assert isinstance(index, int) and index >= 0
+
+    return default_rng(SeedSequence(seed, spawn_key=(index,)))
+
   ### Class Methods: Random Number Generators
 
   @classmethod
-  def uniform(cls) -> RandomFn:
+  def uniform(cls, generator: Generator = None) -> RandomFn:
     """
     Returns a function that draws samples from a uniform distribution.
     Samples are uniformly distributed over the half-open interval [low, high)
     (includes low, but excludes high). In other words, any value within the
     given interval is equally likely to be drawn by uniform.
 
+    Args:
+      generator:
+        The random number generator to draw from,
+        or None for the global random number
+        generator.
+
     Returns:
       A factory function that draws samples
       from a uniform distribution.
     """
+    rng = random if generator is None else generator
+
     def uniform_rng(size: int = 1, lower: float = 0, upper: float = 1):
-      return random.uniform(lower, upper, size)
+      return rng.uniform(lower, upper, size)
 
     return uniform_rng
 
   @classmethod
-  def triangular(cls, mode: float = 0.5) -> RandomFn:
+  def triangular(cls, mode: float = 0.5, generator: Generator = None) -> RandomFn:
     """
     Returns a function that draws samples from the triangular distribution
     over the interval [left, right]. The triangular distribution is a
@@ -120,12 +157,18 @@ class Randoms:
         The peak value of the triangular
         distribution as a percentage of the
         total length.
+      generator:
+        The random number generator to draw from,
+        or None for the global random number
+        generator.
 
     Returns:
       A factory function that draws samples
       from a triangular distribution.
     """
+    rng = random if generator is None else generator
+
     def triangular_rng(size: int = 1, left: float = 0, right: float = 1):
-      return random.triangular(left, (right - left)*mode + left, right, size)
+      return rng.triangular(left, (right - left)*mode + left, right, size)
 
     return triangular_rng
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for Visualization for Intersecting Regions
+
+- test_rasterize_regions
+- test_rasterize_subpixel
+- test_draw_regions_threshold
+- test_draw_regions_overlay
+"""
+
+from unittest import TestCase
+
+from matplotlib import pyplot
+from numpy import array
+
+from sources.core import Region, RegionSet
+from sources.visualize import drawregions
+from sources.visualize.drawregions import draw_regions, rasterize_regions
+
+
+class TestDrawRegions(TestCase):
+
+  def setUp(self):
+    self.figure, self.plot = pyplot.subplots()
+
+  def tearDown(self):
+    pyplot.close(self.figure)
+
+  def regionset(self, nregions: int) -> RegionSet:
+    regions = RegionSet(bounds=Region([0]*2, [100]*2))
+    for i in range(nregions):
+      regions.add(Region([i, i], [i + 10, i + 10], id=f'R{i}'))
+    return regions
+
+  def test_rasterize_regions(self):
+    bbox   = Region([0]*2, [4]*2)
+    lowers = array([[0, 0], [1, 1]], dtype=float)
+    uppers = array([[2, 2], [3, 3]], dtype=float)
+    colors = array([[1, 0, 0], [0, 0, 1]], dtype=float)
+
+    depth = rasterize_regions(lowers, uppers, bbox, (4, 4))
+    self.assertListEqual(depth.tolist(), [[1, 1, 0, 0],
+                                          [1, 2, 1, 0],
+                                          [0, 1, 1, 0],
+                                          [0, 0, 0, 0]])
+
+    sums = rasterize_regions(lowers, uppers, bbox, (4, 4), colors)
+    self.assertEqual(sums.shape, (4, 4, 3))
+    self.assertListEqual(sums[1, 1].tolist(), [1, 0, 1])
+    self.assertListEqual(sums[0, 0].tolist(), [1, 0, 0])
+    self.assertListEqual(sums[2, 2].tolist(), [0, 0, 1])
+
+    # Rows follow the second dimension, columns the first
+    depth = rasterize_regions(array([[0, 2]], dtype=float), array([[1, 4]], dtype=float), bbox, (4, 2))
+    self.assertListEqual(depth.tolist(), [[0, 0], [0, 0], [1, 0], [1, 0]])
+
+  def test_rasterize_subpixel(self):
+    bbox   = Region([0]*2, [4]*2)
+    lowers = array([[1.2, 2.4], [4, 4], [0, 0]], dtype=float)
+    uppers = array([[1.3, 2.5], [4, 4], [0, 0]], dtype=float)
+
+    depth = rasterize_regions(lowers, uppers, bbox, (4, 4))
+    self.assertEqual(depth.sum(), 3)
+    self.assertEqual(depth[2, 1], 1)
+    self.assertEqual(depth[3, 3], 1)
+    self.assertEqual(depth[0, 0], 1)
+
+  def test_draw_regions_threshold(self):
+    threshold = drawregions.RasterThreshold
+    drawregions.RasterThreshold = 5
+
+    try:
+      for nregions, raster in [(5, False), (6, True)]:
+        self.plot.cla()
+        draw_regions(self.regionset(nregions), self.plot)
+        self.assertEqual(len(self.plot.images), 1 if raster else 0)
+        self.assertEqual(len(self.plot.patches), 0 if raster else nregions)
+
+      # The overlay Regions do not count towards the threshold
+      self.plot.cla()
+      regions = self.regionset(6)
+      draw_regions(regions, self.plot, overlay=[regions[0]])
+      self.assertEqual(len(self.plot.images), 0)
+      self.assertEqual(len(self.plot.patches), 6)
+
+      # An explicit raster flag overrides the threshold
+      self.plot.cla()
+      draw_regions(self.regionset(2), self.plot, raster=True)
+      self.assertEqual(len(self.plot.images), 1)
+      self.assertEqual(len(self.plot.patches), 0)
+    finally:
+      drawregions.RasterThreshold = threshold
+
+  def test_draw_regions_overlay(self):
+    regions = self.regionset(20)
+    overlay = [regions['R3'], regions['R7']]
+
+    for region in regions:
+      region['color'] = [0, 1, 0]
+
+    draw_regions(regions, self.plot, overlay=overlay, raster=True, colored=True)
+
+    self.assertEqual(len(self.plot.images), 1)
+    self.assertListEqual(sorted(p.get_xy() for p in self.plot.patches),
+                         sorted((r[0].lower, r[1].lower) for r in overlay))
+
+    image = self.plot.images[0].get_array()
+    self.assertEqual(image.shape, (drawregions.RasterSize, drawregions.RasterSize, 4))
+    self.assertTrue((image[..., 1][image[..., 3] > 0] == 1).all())
+
+    lowers, _, rows, _ = drawregions._raster_bounds(regions, set(r.id for r in overlay), False)
+    self.assertEqual(len(lowers), len(regions) - len(overlay))
+    self.assertNotIn(regions.get('R3'), [regions[i] for i in rows.tolist()])
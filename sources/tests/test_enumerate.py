@@ -4,13 +4,19 @@
 Unit tests for Enumeration of Region Intersections
 
 - test_enumerate_results
+- test_enumerate_batch
 """
 
+from io import StringIO
+from json import loads
+from os import remove
+from tempfile import mkstemp
 from time import perf_counter
 from typing import Dict, Iterator, List, NamedTuple, Tuple
 from unittest import TestCase
 
 from sources.algorithms.queries import Enumerate, RegionIntersect
+from sources.algorithms.rigctor import NxGraphSweepCtor
 from sources.algorithms.sweepln import RegionSweepDebug, SweepTaskRunner
 from sources.core import Region, RegionIntxn, RegionSet
 
@@ -81,6 +87,10 @@ class TestEnumerate(TestCase):
 
     return TestEnumerateResult(length, levels, enumeration)
 
+  def intersects(self, result: Dict) -> List[Tuple[str]]:
+    regions = result['results']['regions']
+    return sorted(tuple(sorted(r['data']['intersect'])) for r in regions)
+
   def test_enumerate_results(self):
     for name in self.regions.keys():
       nxg = self.run_evaluator(name, Enumerate.get('slig'))
@@ -91,3 +101,49 @@ class TestEnumerate(TestCase):
 
       for intersect in nxg.intersects:
         self.assertIn(intersect, rcs.intersects)
+
+  def test_enumerate_batch(self):
+    # Imports the console command-line (and its dependencies) only if tested.
+    from sources.console.common import CommonConsoleNS
+
+    regions = self.regions['definedset']
+    graph   = NxGraphSweepCtor.prepare(regions)()
+    batch   = '# queries\nA\n\nB, C\nA Y D Z\nA D G\n  \nE,F\n'
+    queries = [['A'], ['B', 'C'], ['A', 'Y', 'D', 'Z'], ['A', 'D', 'G'], ['E', 'F']]
+
+    self.assertListEqual(CommonConsoleNS.read_queries(StringIO(batch)), queries)
+
+    _, path = mkstemp(suffix='.json')
+    try:
+      with open(path, 'w') as output:
+        RegionSet.to_output(regions, output, options={'compact': True})
+
+      for jobs in [1, 2]:
+        with open(path, 'r') as source, StringIO() as output:
+          CommonConsoleNS.enumerate_batch(source, output, 'regions',
+                                          batch=StringIO(batch), jobs=jobs)
+          lines = [loads(line) for line in output.getvalue().splitlines()]
+
+        results, header = lines[:-1], lines[-1]['header']
+
+        # The query of unknown Region IDs is reported, the others evaluated
+        self.assertListEqual([r['query'] for r in results], queries)
+        self.assertDictEqual(results.pop(2), {'query': queries[2],
+                                              'error': 'Unknown queried Region ID(s): Y, Z'})
+        self.assertEqual(header['errors'], 1)
+
+        elapses = [r['elapse_query'] for r in results]
+        self.assertTrue(all(len(r['results']['regions']) > 0 for r in results))
+        for query, result in zip(queries[:2] + queries[3:], results):
+          _, line = CommonConsoleNS.enumerate_query('slig', graph, query)
+          expected = loads(line)
+          self.assertDictEqual(result['count'], expected['count'])
+          self.assertListEqual(self.intersects(result), self.intersects(expected))
+
+        self.assertTrue(all(elapse > 0 for elapse in elapses))
+        self.assertEqual(header['queries'], len(queries))
+        self.assertEqual(header['jobs'], jobs)
+        self.assertEqual(header['length'], len(regions))
+        self.assertDictEqual(header['latency'], CommonConsoleNS.latency(elapses))
+    finally:
+      remove(path)
@@ -7,12 +7,28 @@ Unit tests for Base Experiment
 - test_experiment_lineplot
 - test_experiment_barchart
 - test_experiment_log
+- test_experiment_stats
+- test_experiment_benchmark
+- test_experiment_regression
+- test_experiment_memory
+- test_experiment_parallel
+- test_experiment_checkpoint
+- test_experiment_fixtures
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from gc import isenabled
+from io import StringIO
+from json import loads
+from numpy import random
+from os import listdir
+from tempfile import TemporaryDirectory
 from typing import Tuple
 from unittest import TestCase
+from unittest.mock import patch
 
-from sources.abstract import Experiment
+from sources.abstract import Experiment, experiment
+from sources.experiments import ExperimentsFixtures, ExperimentsRegression
 
 
 class TestExperiment(TestCase):
@@ -58,3 +74,204 @@ class TestExperiment(TestCase):
         for x in exp.x:
           for s in exp.series:
             exp.output_log(output, exp.gety((x, s)))
+
+  def test_experiment_stats(self):
+    exp = Experiment('Test Stats', 'X', 'Y', series=['a'], x=[0])
+
+    for y in [*range(1, 20), 1000]:
+      exp.sety((0, 'a'), float(y))
+
+    stats = exp.getstats((0, 'a'))
+    self.assertEqual(stats['n'], 20)
+    self.assertEqual(stats['median'], 10.5)
+    self.assertEqual(stats['iqr'], stats['q3'] - stats['q1'])
+    self.assertEqual(stats['outliers'], 1)
+    self.assertLessEqual(stats['ci_lower'], stats['median'])
+    self.assertGreaterEqual(stats['ci_upper'], stats['median'])
+    self.assertEqual(exp.gety((0, 'a'), ('Y', 'median')), 10.5)
+    self.assertIsNone(exp.getstats((1, 'a')))
+
+    stats = self.experiment.getstats((3, 2), 'X^2')
+    self.assertEqual(stats['n'], 1)
+    self.assertEqual(stats['median'], 18)
+
+  def test_experiment_benchmark(self):
+    calls = []
+    exp = Experiment('Test Benchmark', 'X', 'Y', series=['a'], x=[0],
+                     rounds=2, warmup=3, mintime=0.02)
+
+    self.assertTrue(exp.benchmark)
+    self.assertFalse(Experiment('Test', 'X', 'Y', series=['a'], x=[0]).benchmark)
+
+    for _ in range(exp.rounds):
+      elapsed, repeats = exp.timeit(lambda: calls.append(isenabled()))
+      self.assertGreater(elapsed, 0)
+      self.assertGreaterEqual(repeats * elapsed, 0.01)
+      self.assertTrue(all(calls[:3]))
+      self.assertFalse(any(calls[3:]))
+      self.assertEqual(len(calls), 3 + repeats)
+      self.assertTrue(isenabled())
+      exp.sety((0, 'a'), elapsed)
+      calls.clear()
+
+    with StringIO() as output:
+      exp.output_json(output)
+      result = loads(output.getvalue())
+
+    self.assertEqual(result['warmup'], 3)
+    self.assertEqual(len(result['points']), 1)
+    self.assertEqual(result['points'][0]['stats']['n'], 2)
+    self.assertEqual(len(result['points'][0]['y']), 2)
+
+  def test_experiment_regression(self):
+    def evaluate(slowdown):
+      exp = Experiment('Test Regression', 'X', 'Y', series=['a', 'b'], x=[1, 2])
+      for x in exp.x:
+        for n in range(20):
+          exp.settiming((x, 'a'), 1.0 + n/100)
+          exp.settiming((x, 'b'), (1.0 + n/100) * (slowdown if x == 2 else 1))
+      return exp
+
+    with TemporaryDirectory() as directory:
+      ExperimentsRegression.save_baseline('base', [evaluate(1)], directory)
+      baseline = ExperimentsRegression.load_baseline('base', directory)
+
+    self.assertEqual(len(baseline), 4)
+
+    report, comparisons = ExperimentsRegression.compare(baseline, [evaluate(1.05)], 0.1)
+    self.assertEqual(len(comparisons), 4)
+    self.assertFalse(any([c['regression'] for c in comparisons]))
+
+    report, comparisons = ExperimentsRegression.compare(baseline, [evaluate(2)], 0.1)
+    regressions = [c for c in comparisons if c['regression']]
+    self.assertEqual(len(regressions), 1)
+    self.assertEqual((regressions[0]['series'], regressions[0]['x']), ('b', '2'))
+    self.assertAlmostEqual(regressions[0]['ratio'], 2)
+    self.assertEqual(report.series, ['baseline', 'current'])
+    self.assertEqual(len(report.x), 4)
+
+    ExperimentsRegression.output_report(report, 'data/test_experiment_regression')
+
+  def test_experiment_memory(self):
+    exp = Experiment('Test Memory', 'X', Experiment.MemoryMeasures, series=['a'], x=[0])
+
+    result, memory = exp.memit(lambda n: [0]*n, 100000)
+    self.assertEqual(len(result), 100000)
+    self.assertGreaterEqual(memory['retained'], 8*100000)
+    self.assertGreaterEqual(memory['peak'], memory['retained'])
+    self.assertGreater(memory['blocks'], 0)
+
+    result, memory = exp.memit(lambda n: len([0]*n), 100000)
+    self.assertGreaterEqual(memory['peak'], 8*100000)
+    self.assertLess(memory['retained'], 8*100000)
+    self.assertLess(memory['blocks'], 100)
+
+    result, memory = exp.memit(lambda n: [[i] for i in range(n)], 1000)
+    self.assertGreaterEqual(memory['blocks'], 1000)
+
+    exp.sety((0, 'a'), tuple([memory[m] for m in exp.MemoryMeasures]))
+    self.assertEqual(exp.gety((0, 'a'), 'peak'), memory['peak'])
+
+  def test_experiment_parallel(self):
+    def evaluate(jobs):
+      exp = Experiment('Test Parallel', 'X', 'Y', series=['a', 'b'], x=[1, 2, 3],
+                       rounds=2, jobs=jobs, seed=42, logger=StringIO())
+      cells = [(x, n, s) for x in exp.x for n in range(exp.rounds) for s in exp.series]
+      cell  = lambda x, n, s: (x, n, s, random.uniform(0, 1, 3).tolist())
+      return list(exp.evaluate_cells(cell, cells)), cells
+
+    results, cells = evaluate(1)
+    self.assertEqual([r[:3] for r in results], cells)
+    self.assertEqual(len(set([tuple(r[3]) for r in results])), len(cells))
+
+    for jobs in [2, 3]:
+      self.assertEqual(evaluate(jobs)[0], results)
+
+    # Unsupported platforms fail on construction, not on evaluation
+    with patch.object(experiment, 'get_all_start_methods', lambda: ['spawn']):
+      self.assertRaises(ValueError, evaluate, 2)
+      self.assertEqual(evaluate(1)[0], results)
+    with patch.object(experiment, 'os', object()):
+      self.assertRaises(ValueError, Experiment, 'Test Pin', 'X', 'Y', ['a'], [1], pin=True)
+
+  def test_experiment_checkpoint(self):
+    def evaluate(directory, resume, jobs, stop = None):
+      exp = Experiment('Test Checkpoint', 'X', ['A', 'B'], series=['a', 'b'], x=[1, 2],
+                       rounds=2, jobs=jobs, checkpoint=directory, resume=resume)
+      cells = [(x, n, s) for x in exp.x for n in range(exp.rounds) for s in exp.series]
+      measured = []
+
+      def cell(x, n, s):
+        if exp.restore((x, s), n):
+          return
+        if (x, n, s) == stop:
+          raise KeyboardInterrupt
+        measured.append((x, n, s))
+        exp.record((x, s), n, (x*n, float(random.uniform(0, 1))), 0.5)
+
+      try:
+        list(exp.evaluate_cells(cell, cells))
+      except KeyboardInterrupt:
+        pass
+      return exp, measured
+
+    with TemporaryDirectory() as directory:
+      expected, _ = evaluate(None, False, 1)
+      interrupted, measured = evaluate(directory, False, 1, stop=(2, 0, 'b'))
+      self.assertEqual(len(measured), 5)
+
+      resumed, measured = evaluate(directory, True, 1)
+      self.assertEqual(measured, [(2, 0, 'b'), (2, 1, 'a'), (2, 1, 'b')])
+      self.assertEqual(resumed.seed, interrupted.seed)
+      self.assertEqual(len(resumed.recorded), 5)
+      self.assertEqual(resumed.timings[(1, 'a')], [0.5, 0.5])
+
+      parallel, _ = evaluate(directory, True, 2)
+      self.assertEqual(parallel.y, resumed.y)
+      self.assertEqual(len(parallel.recorded), 8)
+
+      restarted, measured = evaluate(directory, False, 1)
+      self.assertEqual(len(measured), 8)
+      self.assertNotEqual(restarted.y, resumed.y)
+      self.assertEqual(len(expected.y), len(restarted.y))
+
+      for mismatch in [{'x': [1, 2, 3]}, {'rounds': 3}, {'warmup': 1}, {'mintime': 0.1}]:
+        expkw = {'series': ['a', 'b'], 'x': [1, 2], 'rounds': 2, **mismatch}
+        with self.assertRaises(ValueError):
+          Experiment('Test Checkpoint', 'X', ['A', 'B'], checkpoint=directory, resume=True, **expkw)
+        Experiment('Test Checkpoint', 'X', ['A', 'B'], checkpoint=directory, resume=False, **expkw)
+
+  def test_experiment_fixtures(self):
+    params = ExperimentsFixtures.params(100, 2, 0.1, 'uniform', seed=7)
+    state  = random.get_state()[1].tolist()
+
+    with TemporaryDirectory() as directory:
+      self.assertIsNone(ExperimentsFixtures.manifest(params, directory))
+
+      regions, graph = ExperimentsFixtures.graph(params, directory)
+      self.assertEqual(random.get_state()[1].tolist(), state)
+      self.assertEqual(ExperimentsFixtures.manifest(params, directory)['params'], params)
+
+      cached, cachedgraph = ExperimentsFixtures.graph(params, directory)
+      self.assertEqual(len(cached), 100)
+      self.assertEqual(cached.columns['lower'].tolist(), regions.columns['lower'].tolist())
+      self.assertEqual(ExperimentsFixtures.generate(params).columns['upper'].tolist(),
+                       regions.columns['upper'].tolist())
+      self.assertEqual(sorted(map(sorted, cachedgraph.G.edges())), sorted(map(sorted, graph.G.edges())))
+
+      other = ExperimentsFixtures.params(100, 2, 0.1, 'uniform', seed=8)
+      self.assertNotEqual(ExperimentsFixtures.key(other), ExperimentsFixtures.key(params))
+      self.assertNotEqual(ExperimentsFixtures.regions(other, directory).columns['lower'].tolist(),
+                          regions.columns['lower'].tolist())
+
+      versioned = {**params, 'version': ExperimentsFixtures.Version + 1}
+      self.assertNotEqual(ExperimentsFixtures.key(versioned), ExperimentsFixtures.key(params))
+      self.assertIsNone(ExperimentsFixtures.manifest(versioned, directory))
+
+      concurrent = ExperimentsFixtures.params(100, 2, 0.1, 'uniform', seed=9)
+      with ProcessPoolExecutor(3) as executor:
+        stored = list(executor.map(ExperimentsFixtures.store, [concurrent]*3, [regions]*3,
+                                   [graph]*3, [directory]*3))
+      self.assertEqual(len(stored), 3)
+      self.assertTrue(ExperimentsFixtures.manifest(concurrent, directory)['graph'])
+      self.assertListEqual([f for f in listdir(directory) if '.tmp' in f], [])
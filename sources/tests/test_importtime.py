@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Import-time Regression Benchmark for Console Command-lines
+
+- test_importtime_lazy
+- test_importtime_star
+- test_importtime_budget
+"""
+
+from json import loads
+from os import environ, getcwd, pathsep
+from subprocess import run
+from sys import executable
+from typing import Dict, List
+from unittest import TestCase, skipUnless
+
+
+class TestImportTime(TestCase):
+  """
+  Class Attributes:
+    Consoles:     The console modules whose startup is measured.
+    Dependencies: The third-party modules that the consoles
+                  require, as the baseline startup time.
+    Optional:     The heavy modules that must not be imported
+                  until a command that uses them is evaluated.
+    Rounds:       The number of fresh interpreters to measure,
+                  keeping the fastest (least noisy) time.
+    Budget:       The maximum startup time of each console over
+                  the baseline, as the number of seconds, given by
+                  the IMPORT_TIME_BUDGET variable. As it depends on
+                  the machine, only checked if the variable is set.
+  """
+  Consoles     = ['sources.console.regions', 'sources.console.rigraph',
+                  'sources.console.experiments']
+  Dependencies = ['numpy', 'networkx', 'sortedcontainers', 'click', 'rx',
+                  'docutils.parsers.rst', 'sphinxcontrib.napoleon']
+  Optional     = ['matplotlib', 'pandas']
+  Rounds       = 3
+  Budget       = float(environ.get('IMPORT_TIME_BUDGET', 0.5))
+
+  def measure(self, modules: List[str], star: str = None) -> Dict:
+    script = ';'.join([
+      'import json, sys, time',
+      'start = time.perf_counter()',
+      *[f'import {m}' for m in modules],
+      *([f'from {star} import *'] if star else []),
+      'elapsed = time.perf_counter() - start',
+      'names = sorted(n for n in dir() if not n.startswith("_"))',
+      'print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules), "names": names}))'
+    ])
+
+    env = dict(environ)
+    env['PYTHONPATH'] = pathsep.join([getcwd(), *filter(None, [env.get('PYTHONPATH')])])
+
+    measures = []
+    for _ in range(self.Rounds):
+      process = run([executable, '-c', script], capture_output=True, text=True, env=env)
+      self.assertEqual(process.returncode, 0, process.stderr)
+      measures.append(loads(process.stdout.splitlines()[-1]))
+
+    return min(measures, key=lambda m: m['elapsed'])
+
+  def test_importtime_lazy(self):
+    for console in self.Consoles:
+      modules = self.measure([console])['modules']
+      for optional in self.Optional:
+        self.assertNotIn(optional, modules, f'{console} imports {optional}')
+
+  def test_importtime_star(self):
+    names = self.measure([], 'sources')['names']
+    for name in ['RegionSet', 'NxGraph', 'Experiment', 'visualize', 'draw_regions',
+                 'draw_rigraph', 'experiments', 'ExperimentsFixtures', 'console']:
+      self.assertIn(name, names)
+
+  @skipUnless('IMPORT_TIME_BUDGET' in environ, 'IMPORT_TIME_BUDGET is not set')
+  def test_importtime_budget(self):
+    baseline = self.measure(self.Dependencies)['elapsed']
+    for console in self.Consoles:
+      elapsed = self.measure([console])['elapsed']
+      self.assertLessEqual(elapsed - baseline, self.Budget,
+                           f'{console} startup exceeds budget')
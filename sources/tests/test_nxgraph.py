@@ -8,12 +8,22 @@ Unit tests for Regional Intersection Graph -- NetworkX
 - test_nxgraph_mdsweepctor
 - test_nxgraph_sweepctor_graph
 - test_nxgraph_sweepctor_random
+- test_nxgraph_insert_remove
+- test_nxgraph_binary
+- test_nxgraph_from_stream
+- test_nxgraph_to_output_chunks
+- test_nxgraph_node_index
 """
 
-from io import StringIO
+from io import BufferedReader, BytesIO, StringIO
+from json import JSONDecoder, JSONEncoder
+from os import remove
+from random import Random
+from tempfile import mkstemp
 from typing import List, Tuple
 from unittest import TestCase
 
+from sources.abstract import IOable
 from sources.algorithms.rigctor import NxGraphMdSweepCtor, NxGraphSweepCtor
 from sources.algorithms.sweepln import RegionSweep, RegionSweepDebug
 from sources.core import \
@@ -165,3 +175,197 @@ class TestNxGraph(TestCase):
     nxgraphmdsweepln = self._nxgraphmdctor(regions)
 
     self._check_nxgraph(nxgraphsweepln, nxgraphmdsweepln)
+
+  def test_nxgraph_insert_remove(self):
+    random  = Random(0)
+    bounds  = Region([0]*2, [100]*2)
+    sizepc  = Region([0]*2, [0.2]*2)
+    regions = RegionSet.from_random(200, bounds, sizepc=sizepc, seed=0).regions
+    actives = regions[:100]
+    pending = regions[100:]
+    nxgraph = NxGraph(dimension=2)
+
+    nxgraph.insert_regions(actives)
+
+    for _ in range(50):
+      op = random.choice(['insert', 'remove', 'inserts', 'removes'])
+      if op == 'insert' and len(pending) > 0:
+        region = pending.pop(random.randrange(len(pending)))
+        nxgraph.insert_region(region)
+        actives.append(region)
+      elif op == 'remove' and len(actives) > 0:
+        region = actives.pop(random.randrange(len(actives)))
+        nxgraph.remove_region(region)
+        pending.append(region)
+      elif op == 'inserts':
+        batch = random.sample(pending, min(len(pending), 10))
+        nxgraph.insert_regions(batch)
+        actives.extend(batch)
+        pending = [r for r in pending if r not in batch]
+      elif op == 'removes':
+        batch = random.sample(actives, min(len(actives), 10))
+        nxgraph.remove_regions(batch)
+        pending.extend(batch)
+        actives = [r for r in actives if r not in batch]
+
+    # The maximum length shrinks once the longest Region is removed
+    longest = max(actives, key=lambda r: r[0].length)
+    nxgraph.remove_region(longest)
+    actives.remove(longest)
+    self.assertEqual(nxgraph.index.maxlength, max(r[0].length for r in actives))
+    self.assertLess(nxgraph.index.maxlength, longest[0].length)
+
+    regionset = RegionSet(dimension=2)
+    regionset.streamadd(actives)
+    rebuilt = self._nxgraphctor(regionset)
+
+    self.assertEqual(set(nxgraph.G.nodes), set(rebuilt.G.nodes))
+    self.assertEqual(set(map(frozenset, nxgraph.G.edges)),
+                     set(map(frozenset, rebuilt.G.edges)))
+
+    for (u, v, aregion) in nxgraph.G.edges(data='intersect'):
+      bregion = rebuilt.G.edges[u, v]['intersect']
+      self.assertEqual(aregion, bregion)
+      self.assertEqual(set(r.id for r in aregion['intersect']),
+                       set(r.id for r in bregion['intersect']))
+
+  def test_nxgraph_binary(self):
+    bounds  = Region([0]*2, [100]*2)
+    sizepc  = Region([0]*2, [0.2]*2)
+    regions = RegionSet.from_random(100, bounds, sizepc=sizepc)
+    nxgraph = self._nxgraphctor(regions)
+    regions[0]['color'] = [1, 0, 0]
+
+    with BytesIO() as output:
+      NxGraph.to_binary(nxgraph, output)
+      binary = output.getvalue()
+
+    _, path = mkstemp(suffix='.rig')
+    with open(path, 'wb') as output:
+      output.write(binary)
+
+    try:
+      self.assertTrue(NxGraph.is_binary(path))
+      self.assertFalse(NxGraph.is_binary(BufferedReader(BytesIO(b'{}'))))
+
+      with open(path, 'r') as source:
+        self.assertTrue(NxGraph.is_binary(source))
+        mapped = NxGraph.from_binary(source)
+
+      loaded = NxGraph.from_binary(BufferedReader(BytesIO(binary)))
+
+      # Answers size, membership and Region lookups before building the graph
+      (u, v), first = next(iter(nxgraph.G.edges)), mapped.region(regions[0].id)
+      self.assertEqual(len(nxgraph), len(mapped))
+      self.assertTrue(regions[0].id in mapped and (u, v) in mapped and (v, u) in mapped)
+      self.assertFalse('missing' in mapped or (u, 'missing') in mapped)
+      self.assertEqual(first, regions[0])
+      self.assertIsNone(mapped.region('missing'))
+      self.assertIsNotNone(mapped._binary)
+      self.assertEqual(mapped.G.number_of_edges(), nxgraph.G.number_of_edges())
+      self.assertIs(mapped.region(regions[0].id), first)
+
+      for newgraph in [mapped, loaded]:
+        self.assertEqual(nxgraph.id, newgraph.id)
+        self.assertEqual(nxgraph.dimension, newgraph.dimension)
+        self.assertEqual(set(nxgraph.G.nodes), set(newgraph.G.nodes))
+        self.assertEqual(set(map(frozenset, nxgraph.G.edges)),
+                         set(map(frozenset, newgraph.G.edges)))
+        self.assertEqual(newgraph.region(regions[0].id)['color'], [1, 0, 0])
+
+        for node, region, _ in nxgraph.regions:
+          self.assertEqual(region, newgraph.region(node))
+
+        for (u, v, aregion, _) in nxgraph.overlaps:
+          bregion = newgraph.region((u, v))
+          self.assertEqual(aregion, bregion)
+          self.assertEqual(set(r.id for r in aregion['intersect']),
+                           set(r.id for r in bregion['intersect']))
+    finally:
+      remove(path)
+
+  def test_nxgraph_from_stream(self):
+    bounds  = Region([0]*2, [100]*2)
+    sizepc  = Region([0]*2, [0.2]*2)
+    regions = RegionSet.from_random(100, bounds, sizepc=sizepc)
+    nxgraph = self._nxgraphctor(regions)
+
+    for compact in [True, False]:
+      with StringIO() as output:
+        NxGraph.to_output(nxgraph, output, options={'compact': compact})
+        newgraph = NxGraph.from_stream(self._reset_output(output))
+
+      self.assertEqual(nxgraph.id, newgraph.id)
+      self.assertEqual(nxgraph.dimension, newgraph.dimension)
+      self.assertEqual(set(nxgraph.G.nodes), set(newgraph.G.nodes))
+
+      for node, region, _ in nxgraph.regions:
+        self.assertEqual(region, newgraph.region(node))
+
+      for (u, v, aregion, _) in nxgraph.overlaps:
+        bregion = newgraph.region((u, v))
+        self.assertEqual(aregion, bregion)
+        self.assertTrue(all([r is newgraph.region(r.id) for r in bregion['intersect']]))
+        self.assertEqual([r.id for r in aregion['intersect']],
+                         [r.id for r in bregion['intersect']])
+
+  def test_nxgraph_node_index(self):
+    bounds  = Region([0]*2, [100]*2)
+    sizepc  = Region([0]*2, [0.2]*2)
+    regions = RegionSet.from_random(100, bounds, sizepc=sizepc)
+    nxgraph = self._nxgraphctor(regions)
+    edge    = next(iter(nxgraph.G.edges))
+    nxgraph.G.edges[edge]['weight'] = 2
+    options = {'compact': True, 'json_graph': 'node_index'}
+
+    with StringIO() as output:
+      NxGraph.to_output(nxgraph, output, options=options)
+      text = output.getvalue()
+
+    with StringIO() as output:
+      IOable.to_output(NxGraph.to_object(nxgraph, **options), output, options=options)
+      self.assertEqual(text, output.getvalue())
+
+    object = JSONDecoder().decode(text)
+    self.assertTrue(all([isinstance(e, list) for e in object['graph']['edges']]))
+
+    for intersect in [False, True]:
+      graphs = [NxGraph.from_stream(StringIO(text), intersect=intersect),
+                NxGraph.from_object(JSONDecoder().decode(text), intersect=intersect)]
+
+      for newgraph in graphs:
+        self.assertEqual(nxgraph.id, newgraph.id)
+        self.assertEqual(set(nxgraph.G.nodes), set(newgraph.G.nodes))
+        self.assertEqual(newgraph.G.edges[edge]['weight'], 2)
+        deferred = [d for _, _, d in newgraph.G.edges(data='intersect') if d is None]
+        self.assertEqual(len(deferred), 0 if intersect else len(nxgraph.G.edges))
+
+        for node, region, _ in nxgraph.regions:
+          self.assertEqual(region, newgraph.region(node))
+
+        for (u, v, aregion, _) in nxgraph.overlaps:
+          bregion = newgraph.region((u, v))
+          self.assertEqual(aregion, bregion)
+          self.assertEqual(set(r.id for r in aregion['intersect']),
+                           set(r.id for r in bregion['intersect']))
+
+        with StringIO() as output:
+          NxGraph.to_output(newgraph, output, options=options)
+          self.assertEqual(text, output.getvalue())
+
+  def test_nxgraph_to_output_chunks(self):
+    bounds  = Region([0]*2, [100]*2)
+    sizepc  = Region([0]*2, [0.2]*2)
+    regions = RegionSet.from_random(50, bounds, sizepc=sizepc)
+    nxgraph = self._nxgraphctor(regions)
+
+    for json_graph in ['node_link', 'adjacency']:
+      for compact in [True, False]:
+        options  = {'json_graph': json_graph, 'compact': compact}
+        default  = lambda o: o.__class__.to_object(o, **options)
+        encoder  = JSONEncoder(default=default, indent=2)
+        expected = ''.join(encoder.iterencode(nxgraph))
+
+        with StringIO() as output:
+          NxGraph.to_output(nxgraph, output, options=options)
+          self.assertEqual(expected, output.getvalue())
@@ -17,6 +17,7 @@ Unit tests for Region Data Class
 - test_region_project
 - test_region_random_points
 - test_region_random_regions
+- test_region_random_bounds
 - test_region_from_intervals
 - test_region_from_interval
 - test_region_from_intersect
@@ -282,6 +283,18 @@ class TestRegion(TestCase):
       #print(f'- {subregion}')
       self.assertTrue(subregion in region)
 
+  def test_region_random_bounds(self):
+    region = Region([-5, 0], [15, 10])
+    sizepc = Region([0.25, 0.25], [0.75, 0.75])
+    lowers, uppers = region.random_bounds(50, sizepc, precision=1)
+    #print(f'{region}: {lowers}, {uppers}')
+    self.assertEqual(lowers.shape, (50, 2))
+    self.assertEqual(uppers.shape, (50, 2))
+    self.assertTrue(((lowers >= region.lower) & (uppers <= region.upper)).all())
+    self.assertTrue((lowers <= uppers).all())
+    self.assertTrue((lowers.round(1) == lowers).all())
+    self.assertTrue((uppers.round(1) == uppers).all())
+
   def test_region_from_intervals(self):
     ndimens = 5
     base_interval = Interval(1, 5)
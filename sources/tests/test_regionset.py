@@ -10,16 +10,31 @@ Unit tests for Regions Collection
 - test_regionset_from_random
 - test_regionset_tofrom_output
 - test_regionset_tofrom_output_backlinks
+- test_regionset_from_stream
+- test_regionset_to_output_chunks
+- test_regionset_tofrom_columnar
+- test_regionset_tofrom_output_compressed
+- test_regionset_tofrom_lines
+- test_regionset_random_chunks
+- test_regionset_random_streams
+- test_regionset_shuffle
 - test_regionset_filter
 - test_regionset_subset
 - test_regionset_merge
 """
 
 from io import StringIO
+from json import JSONEncoder, dumps
+from os import remove
+from tempfile import mkstemp
 from typing import Iterable, List
 from unittest import TestCase
 
-from sources.core import Region, RegionSet
+from numpy import random
+
+from sources.abstract import IOable
+from sources.core import Region, RegionEvent, RegionEvtKind, RegionSet
+from sources.helpers import Randoms, open_compressed
 
 
 class TestRegionSet(TestCase):
@@ -131,6 +146,294 @@ class TestRegionSet(TestCase):
             self.assertTrue(all([isinstance(r, Region) for r in newregionset[region.id][field]]))
             self.assertListEqual(region[field], newregionset[region.id][field])
 
+  def test_regionset_from_stream(self):
+    nregions = 50
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1)
+    regions = [a.intersect(b, 'reference') for a, b in regionset.overlaps()]
+
+    for region in regions:
+      regionset.add(region)
+
+    with StringIO() as output:
+      RegionSet.to_output(regionset, output, options={'compact': True})
+      before = output.getvalue()
+      output.seek(0)
+      newregionset = RegionSet.from_stream(output)
+
+      self.assertEqual(regionset.id, newregionset.id)
+      self.assertEqual(regionset.bounds, newregionset.bounds)
+      self.assertEqual(len(regionset), len(newregionset))
+      for region in regionset:
+        self.assertEqual(region, newregionset[region.id])
+      for region in regions:
+        self.assertListEqual(region['intersect'], newregionset[region.id]['intersect'])
+
+      output.truncate(0)
+      output.seek(0)
+      RegionSet.to_output(newregionset, output, options={'compact': True})
+      self.assertEqual(before, output.getvalue())
+
+    newregionset = RegionSet.from_stream(StringIO('{"id": "empty", "dimension": 2, "regions": []}'))
+    self.assertEqual(newregionset.id, 'empty')
+    self.assertEqual(newregionset.dimension, 2)
+    self.assertEqual(len(newregionset), 0)
+
+    for empty in ['[]', ' [ ] ', '{"id": "empty", "regions": []}']:
+      with self.assertRaises(ValueError):
+        RegionSet.from_stream(StringIO(empty))
+    with self.assertRaises(ValueError):
+      RegionSet.from_object([])
+
+  def test_regionset_to_output_chunks(self):
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(20, bounds, sizepc=sizepc)
+    regions = [a.intersect(b, 'reference') for a, b in regionset.overlaps()]
+    regionset[0]['color'] = (0.5, 1, 0)
+    regionset[1]['other'] = regionset[2]
+
+    for region in regions:
+      regionset.add(region)
+
+    for options in [{'compact': True}, {}]:
+      for kwargs in [{'indent': 2}, {'indent': None}, {'indent': '\t', 'ensure_ascii': False}]:
+        default  = lambda o: o.__class__.to_object(o, **options)
+        encoder  = JSONEncoder(default=default, **kwargs)
+        expected = ''.join(encoder.iterencode({'regions': regionset, 'first': regionset[0]}))
+
+        with StringIO() as output:
+          IOable.to_output({'regions': regionset, 'first': regionset[0]}, output, options=options, **kwargs)
+          self.assertEqual(expected, output.getvalue())
+
+      default = lambda o: o.__class__.to_object(o, **options)
+      value   = {'regions': regionset, 'first': regionset[0], 'flags': [True, None]}
+      with StringIO() as output:
+        IOable.to_output(value, output, options=options, sort_keys=True)
+        self.assertEqual(dumps(value, default=default, indent=2, sort_keys=True), output.getvalue())
+
+    circular = [regionset[0]]
+    circular.append({'circular': circular})
+    with StringIO() as output:
+      self.assertRaises(ValueError, IOable.to_output, circular, output)
+    with StringIO() as output:
+      self.assertRaises(RecursionError, IOable.to_output, circular, output, check_circular=False)
+
+  def test_regionset_tofrom_columnar(self):
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(50, bounds, sizepc=sizepc, precision=1)
+    regions = [a.intersect(b, 'reference') for a, b in regionset.overlaps()]
+
+    for region in regions:
+      regionset.add(region)
+    regionset[0]['color'] = [1, 0, 0]
+
+    # Zero-length Regions that tie with each other on both dimensions
+    for rid in ['Z2', 'Z1']:
+      regionset.add(Region([50, 50], [50, 60], id=rid))
+
+    _, path = mkstemp(suffix='.npy')
+    metapath = RegionSet.columnar_metapath(path)
+
+    try:
+      RegionSet.to_columnar(regionset, path)
+      self.assertTrue(RegionSet.is_columnar(path))
+      with open(path, 'r') as source:
+        self.assertTrue(RegionSet.is_columnar(source))
+
+      newregionset = RegionSet.from_columnar(path)
+      columns = newregionset.columns
+
+      self.assertEqual(regionset.id, newregionset.id)
+      self.assertEqual(regionset.bounds, newregionset.bounds)
+      self.assertEqual(len(regionset), len(columns))
+      for field in ['id', 'lower', 'upper']:
+        self.assertListEqual(regionset.columns[field].tolist(), columns[field].tolist())
+      self.assertEqual(newregionset[0]['color'], [1, 0, 0])
+      for i, region in enumerate(regionset):
+        self.assertEqual(region, newregionset[i])
+      for region in regions:
+        self.assertListEqual(region['intersect'], newregionset[region.id]['intersect'])
+
+      for d in range(regionset.dimension):
+        events = [(e.kind, e.when, e.context.id) for e in regionset.timeline.events(d)]
+        newevents = [(e.kind, e.when, e.context.id) for e in newregionset.timeline.events(d)]
+        self.assertListEqual(events[1:-1], newevents[1:-1])
+        oracle = sorted([RegionEvent(kind, r, d) for r in newregionset
+                         for kind in [RegionEvtKind.Begin, RegionEvtKind.End]])
+        self.assertListEqual([(e.kind, e.when, e.context.id) for e in oracle], newevents[1:-1])
+
+      newregionset.add(Region([0]*2, [1]*2))
+      self.assertEqual(len(newregionset.columns), len(columns) + 1)
+    finally:
+      remove(path)
+      remove(metapath)
+
+  def test_regionset_tofrom_output_compressed(self):
+    bounds = Region([0]*2, [100]*2)
+    regionset = RegionSet.from_random(50, bounds, precision=1)
+
+    with StringIO() as output:
+      RegionSet.to_output(regionset, output, options={'compact': True})
+      before = output.getvalue()
+
+    for suffix in ['.json.gz', '.json.bz2', '.json.xz']:
+      _, path = mkstemp(suffix=suffix)
+      try:
+        with open(path, 'w') as output:
+          RegionSet.to_output(regionset, output, options={'compact': True}, compression='infer')
+        with open(path, 'rb') as source:
+          self.assertNotEqual(before.encode('utf-8'), source.read())
+        with open_compressed(path, 'r') as source:
+          self.assertEqual(before, source.read())
+        with open(path, 'r') as source:
+          newregionset = RegionSet.from_stream(source, compression='infer')
+        with open(path, 'r') as source:
+          self.assertEqual(len(regionset), len(RegionSet.from_source(source, compression='infer')))
+
+        self.assertEqual(regionset.id, newregionset.id)
+        for region in regionset:
+          self.assertEqual(region, newregionset[region.id])
+      finally:
+        remove(path)
+
+  def test_regionset_tofrom_lines(self):
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionset = RegionSet.from_random(50, bounds, sizepc=sizepc, precision=1)
+    regionset[0]['color'] = [1, 0, 0]
+
+    _, path = mkstemp(suffix='.jsonl')
+
+    try:
+      with open(path, 'w') as output:
+        RegionSet.to_lines(regionset, output)
+      self.assertTrue(RegionSet.is_lines(path))
+      self.assertTrue(RegionSet.is_lines(f'{path}.gz'))
+      self.assertFalse(RegionSet.is_lines('regions.json'))
+
+      for jobs in [1, 3, 8]:
+        newregionset = RegionSet.from_lines(path, jobs=jobs)
+        self.assertEqual(regionset.id, newregionset.id)
+        self.assertEqual(regionset.bounds, newregionset.bounds)
+        self.assertEqual(len(regionset), len(newregionset.columns))
+
+        # The Regions are constructed from the columns on first access
+        self.assertIsNotNone(newregionset._pending)
+        self.assertEqual(len(regionset), len(newregionset))
+        self.assertListEqual(list(regionset.keys()), list(newregionset.keys()))
+        self.assertIn(regionset[1], newregionset)
+        self.assertNotIn('unknown', newregionset)
+        self.assertIsNotNone(newregionset._pending)
+        self.assertEqual(newregionset[0]['color'], [1, 0, 0])
+        self.assertIsNone(newregionset._pending)
+        self.assertIs(newregionset[1], newregionset.get(regionset[1].id))
+        for i, region in enumerate(regionset):
+          self.assertEqual(region.id, newregionset[i].id)
+          self.assertEqual(region, newregionset[i])
+
+      with open(path, 'r') as source:
+        self.assertEqual(len(regionset), len(RegionSet.from_lines(source)))
+
+      lines = ['{"id": "a", "dimensions": [[5, 1], [0, 2]], "data": {"_hidden": 1}}',
+               '{"id": "b", "lower": [0, 0], "upper": [1, 1]}',
+               '{"id": "c", "dimensions": [{"lower": 0, "upper": 3}, [1, 2]]}']
+      newregionset = RegionSet.from_lines(StringIO('\n'.join(lines)))
+      self.assertEqual(newregionset['a'], Region([1, 0], [5, 2], id='a'))
+      self.assertEqual(newregionset['b'], Region([0, 0], [1, 1], id='b'))
+      self.assertEqual(newregionset['c'], Region([0, 1], [3, 2], id='c'))
+      self.assertNotIn('_hidden', newregionset['a'].data)
+
+      for invalid in ['{"id": "d", "dimensions": [["0", 1], [0, 1]]}',
+                      '{"id": "d", "dimensions": [[0, 1]]}']:
+        with self.assertRaises(ValueError):
+          RegionSet.from_lines(StringIO('\n'.join(lines + [invalid])))
+    finally:
+      remove(path)
+
+  def test_regionset_random_chunks(self):
+    nregions = 250
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+
+    random.seed(0)
+    chunks = list(RegionSet.random_chunks(nregions, bounds, 100, sizepc=sizepc, precision=1))
+    random.seed(0)
+    rechunks = list(RegionSet.random_chunks(nregions, bounds, 100, sizepc=sizepc, precision=1))
+
+    self.assertListEqual([len(c) for c in chunks], [100, 100, 50])
+    for chunk, rechunk in zip(chunks, rechunks):
+      for field in ['id', 'lower', 'upper']:
+        self.assertListEqual(chunk[field].tolist(), rechunk[field].tolist())
+
+    regionset = RegionSet(bounds=bounds)
+    regionset.streamadd([Region(l, u, id=i) for c in chunks
+                         for i, l, u in zip(c['id'].tolist(), c['lower'].tolist(), c['upper'].tolist())])
+    self._test_regionset(regionset, nregions, bounds, regionset)
+    self.assertEqual(len(set(r.id for r in regionset)), nregions)
+
+    _, path = mkstemp(suffix='.npy')
+    metapath = RegionSet.columnar_metapath(path)
+    _, linespath = mkstemp(suffix='.jsonl')
+
+    try:
+      metadata = {'id': regionset.id, 'dimension': 2, 'bounds': bounds, 'data': {}}
+      RegionSet.to_columnar_chunks(iter(chunks), path, nregions, metadata)
+      with open(linespath, 'w') as output:
+        header = {'id': regionset.id, 'dimension': 2, 'length': nregions, 'bounds': bounds}
+        RegionSet.to_lines_chunks(iter(chunks), output, header)
+
+      for newregionset in [RegionSet.from_columnar(path), RegionSet.from_lines(linespath)]:
+        self.assertEqual(regionset.id, newregionset.id)
+        self.assertEqual(regionset.bounds, newregionset.bounds)
+        for field in ['id', 'lower', 'upper']:
+          self.assertListEqual(regionset.columns[field].tolist(), newregionset.columns[field].tolist())
+        for i, region in enumerate(regionset):
+          self.assertEqual(region, newregionset[i])
+    finally:
+      remove(path)
+      remove(metapath)
+      remove(linespath)
+
+  def test_regionset_random_streams(self):
+    nregions = 500
+    bounds = Region([0]*2, [100]*2)
+    sizepc = Region([0]*2, [0.5]*2)
+    regionsets = [RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1,
+                                        chunksize=64, seed=7, jobs=jobs) for jobs in [1, 2, 3]]
+
+    for regionset in regionsets:
+      self._test_regionset(regionset, nregions, bounds, regionset)
+      for field in ['id', 'lower', 'upper']:
+        self.assertListEqual(regionsets[0].columns[field].tolist(), regionset.columns[field].tolist())
+
+    chunks = RegionSet.random_chunks(nregions, bounds, 64, seed=7, sizepc=sizepc, precision=1)
+    self.assertListEqual(regionsets[0].columns['lower'].tolist(),
+                         [l for c in chunks for l in c['lower'].tolist()])
+
+    other = RegionSet.from_random(nregions, bounds, sizepc=sizepc, precision=1, chunksize=64, seed=8)
+    self.assertNotEqual(regionsets[0].columns['lower'].tolist(), other.columns['lower'].tolist())
+
+    generated = []
+    for _ in range(2):
+      generator = random.default_rng(7)
+      regionset = RegionSet.from_random(nregions, bounds, base26_ids=False, generator=generator,
+                                        posnrng=Randoms.triangular(generator=generator))
+      generated.append(regionset.columns)
+    for field in ['id', 'lower', 'upper']:
+      self.assertListEqual(generated[0][field].tolist(), generated[1][field].tolist())
+
+  def test_regionset_shuffle(self):
+    regionset = RegionSet.from_random(100, Region([0]*2, [100]*2))
+    shuffled = [regionset.shuffle(Randoms.uniform(random.default_rng(1))) for _ in range(2)]
+
+    self.assertEqual(len(regionset), len(regionset.shuffle()))
+    self.assertListEqual([r.id for r in shuffled[0]], [r.id for r in shuffled[1]])
+    self.assertNotEqual([r.id for r in regionset], [r.id for r in shuffled[0]])
+    self.assertListEqual(sorted(r.id for r in regionset), sorted(r.id for r in shuffled[0]))
+
   def test_regionset_filter(self):
     nregions = 50
     bounds = Region([0]*2, [10]*2)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for Region Query Results Cache
+
+- test_rqcache_hits
+- test_rqcache_invalidate
+- test_rqcache_identity
+- test_rqcache_evict
+"""
+
+from typing import List
+from unittest import TestCase
+
+from sources.algorithms.queries import MRQEnum, RQCache, RQEnum, SRQEnum
+from sources.algorithms.rigctor import NxGraphSweepCtor
+from sources.core import NxGraph, Region, RegionSet
+
+
+class TestRQCache(TestCase):
+
+  regions: RegionSet
+  graph: NxGraph
+
+  def setUp(self):
+    self.regions = RegionSet(dimension=2)
+    self.regions.streamadd([
+      Region([0, 0], [5, 5], 'A'),
+      Region([2, 2], [5, 10], 'B'),
+      Region([1, 5], [3, 7], 'C'),
+      Region([3, 3], [4, 7], 'D'),
+      Region([-5, 5], [1, 7], 'E'),
+      Region([-5, 5], [2, 7], 'F'),
+      Region([3, 4], [5, 6], 'G')
+    ])
+    self.graph = NxGraphSweepCtor.prepare(self.regions)()
+    RQEnum.cache = RQCache()
+
+  def tearDown(self):
+    RQEnum.cache = None
+
+  def _ids(self, results: RegionSet) -> List[str]:
+    return sorted([tuple(sorted([r.id for r in region['intersect']])) for region in results])
+
+  def test_rqcache_hits(self):
+    cache = RQEnum.cache
+    first = self._ids(MRQEnum.results('slig', self.graph, ['A', 'C', 'D', 'G']))
+    again = self._ids(MRQEnum.results('slig', self.graph, ['G', 'D', 'C', 'A']))
+
+    self.assertEqual(first, again)
+    self.assertEqual(cache.stats['misses'], 1)
+    self.assertEqual(cache.stats['hits'], 1)
+
+    SRQEnum.results('slig', self.graph, 'A')
+    SRQEnum.results('slig', self.graph, self.regions['A'])
+    SRQEnum.results('naive', self.regions, 'A')
+
+    self.assertEqual(cache.stats['misses'], 2)
+    self.assertEqual(cache.stats['hits'], 2)
+    self.assertEqual(len(cache), 2)
+
+  def test_rqcache_invalidate(self):
+    cache = RQEnum.cache
+    before = self._ids(SRQEnum.results('slig', self.graph, 'A'))
+
+    del self.graph['D']
+    after = self._ids(SRQEnum.results('slig', self.graph, 'A'))
+
+    self.assertEqual(cache.stats['misses'], 2)
+    self.assertEqual(cache.stats['hits'], 0)
+    self.assertEqual(len(cache), 1)
+    self.assertTrue(any(['D' in i for i in before]))
+    self.assertFalse(any(['D' in i for i in after]))
+
+    self.graph.put_region(Region([3, 3], [4, 7], 'D'))
+    for other in ['A', 'B', 'C', 'G']:
+      self.graph.put_overlap(('D', other))
+
+    self.assertEqual(before, self._ids(SRQEnum.results('slig', self.graph, 'A')))
+    self.assertEqual(cache.stats['misses'], 3)
+
+  def test_rqcache_identity(self):
+    cache = RQEnum.cache
+    before = self._ids(SRQEnum.results('slig', self.graph, 'A'))
+
+    # A distinct graph object with the same ID and version, but without D
+    regions = self.regions.copy()
+    regions.id = self.regions.id
+    regions.regions = [r if r.id != 'D' else Region([20, 20], [21, 21], 'D') for r in regions]
+    graph = NxGraphSweepCtor.prepare(regions)()
+    graph.version = self.graph.version
+
+    self.assertEqual(graph.id, self.graph.id)
+    after = self._ids(SRQEnum.results('slig', graph, 'A'))
+
+    self.assertEqual(cache.stats['misses'], 2)
+    self.assertEqual(cache.stats['hits'], 0)
+    self.assertTrue(any(['D' in i for i in before]))
+    self.assertFalse(any(['D' in i for i in after]))
+
+    self.assertEqual(before, self._ids(SRQEnum.results('slig', self.graph, 'A')))
+    self.assertEqual(after, self._ids(SRQEnum.results('slig', graph, 'A')))
+    self.assertEqual(cache.stats['hits'], 2)
+
+  def test_rqcache_evict(self):
+    sizes = [RQCache.sizeof(list(SRQEnum.get('slig', self.graph, r)())) for r in 'AB']
+    RQEnum.cache = cache = RQCache(maxsize=max(sizes) + 1)
+
+    for region in ['A', 'B', 'A']:
+      SRQEnum.results('slig', self.graph, region)
+
+    self.assertEqual(cache.stats['misses'], 3)
+    self.assertGreater(cache.stats['evictions'], 0)
+    self.assertLessEqual(cache.size, cache.maxsize)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for Region Intersection Graph Query Server and Client
+
+- test_server_enumerate
+- test_server_invalid_requests
+- test_server_insert_delete
+- test_server_delete_during_reads
+- test_server_loadgen
+"""
+
+import asyncio
+from io import StringIO
+from json import loads
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from typing import Dict, List
+from unittest import TestCase
+
+from sources.algorithms.rigctor import NxGraphSweepCtor
+from sources.console.server import RIGClient, RIGServer
+from sources.core import NxGraph, Region, RegionSet
+
+
+class TestServer(TestCase):
+
+  tmpdir: TemporaryDirectory
+  regions: RegionSet
+  graph: NxGraph
+  server: RIGServer
+  client: RIGClient
+  thread: Thread
+
+  def setUp(self):
+    self.tmpdir  = TemporaryDirectory()
+    self.regions = RegionSet.from_random(200, Region([0]*2, [100]*2), sizepc=Region([0]*2, [0.1]*2),
+                                         precision=1, seed=3)
+    self.graph   = NxGraphSweepCtor.prepare(self.regions)()
+    self.server  = RIGServer(self.graph, threads=4)
+
+    address = join(self.tmpdir.name, 'rig.sock')
+    started = Event()
+
+    self.thread = Thread(target=asyncio.run,
+                         args=(self.server.serve(address, lambda _: started.set()),))
+    self.thread.start()
+    self.assertTrue(started.wait(10))
+
+    self.address = f'unix:{address}'
+    self.client  = RIGClient(address)
+
+  def tearDown(self):
+    self.send([{'op': 'shutdown'}])
+    self.thread.join(10)
+    self.tmpdir.cleanup()
+
+  def send(self, requests: List[Dict]) -> List[Dict]:
+    return asyncio.run(self.client.send(requests))
+
+  def test_server_enumerate(self):
+    queries = [[], ['A'], ['A', 'B', 'C', 'D']]
+    replies = self.send([{'op': 'enumerate', 'query': q, 'seq': i} for i, q in enumerate(queries)])
+
+    for i, (query, reply) in enumerate(zip(queries, replies)):
+      expected = RIGServer.evaluate(self.graph, query, counts=True)['count']
+      self.assertTrue(reply['ok'])
+      self.assertEqual(reply['seq'], i)
+      self.assertDictEqual(reply['count'], {str(k): v for k, v in expected.items()})
+      self.assertEqual(len(reply['results']['regions']), sum(expected.values()))
+
+    reply, = self.send([{'op': 'enumerate', 'query': ['A', 'missing']}])
+    self.assertFalse(reply['ok'])
+    self.assertIn('missing', reply['error'])
+
+  def test_server_invalid_requests(self):
+    replies = self.send([[1], 'x', {'op': 'unknown', 'seq': 1},
+                         {'op': 'enumerate', 'query': ['A'], 'seq': 2}])
+
+    for reply in replies[0:2]:
+      self.assertFalse(reply['ok'])
+      self.assertIsNone(reply['seq'])
+      self.assertIn('Request must be a JSON object', reply['error'])
+    self.assertFalse(replies[2]['ok'])
+    self.assertEqual(replies[2]['seq'], 1)
+    self.assertTrue(replies[3]['ok'])
+    self.assertEqual(replies[3]['seq'], 2)
+
+  def test_server_insert_delete(self):
+    region = {'id': 'inserted', 'dimension': 2, 'dimensions': [[10, 90], [10, 90]]}
+    inserted, stats, deleted, after, query = self.send([
+      {'op': 'insert', 'regions': [region]},
+      {'op': 'stats'},
+      {'op': 'delete', 'regions': ['inserted', 'A', 'missing']},
+      {'op': 'stats'},
+      {'op': 'enumerate', 'query': ['A']}
+    ])
+
+    self.assertTrue(all(r['ok'] for r in [inserted, stats, deleted, after]))
+    self.assertEqual(inserted['inserted'], 1)
+    self.assertEqual(stats['length'], len(self.regions) + 1)
+    self.assertEqual(deleted['deleted'], 2)
+    self.assertEqual(after['length'], len(self.regions) - 1)
+    self.assertEqual(after['errors'], 0)
+    self.assertFalse(query['ok'])
+
+  def test_server_delete_during_reads(self):
+    ids      = [r.id for r in self.regions][0:50]
+    reads    = [{'op': 'enumerate', 'query': [rid], 'counts': True} for rid in ids] * 4
+    deletes  = [{'op': 'delete', 'regions': [rid]} for rid in ids[0:25]]
+    stats    = [{'op': 'stats'}] * 50
+
+    async def overlapped():
+      return await asyncio.gather(self.client.load(reads, concurrency=4),
+                                  self.client.load(deletes, concurrency=2),
+                                  self.client.load(stats, concurrency=2))
+
+    (_, readreplies), (_, deletereplies), (_, statsreplies) = asyncio.run(overlapped())
+
+    self.assertTrue(all(r['ok'] for r in statsreplies))
+    for reply in statsreplies:
+      self.assertLessEqual(len(self.regions) - 25, reply['length'])
+      self.assertLessEqual(reply['length'], len(self.regions))
+
+    self.assertTrue(all(r['ok'] for r in deletereplies))
+    self.assertEqual(sum(r['deleted'] for r in deletereplies), 25)
+    for request, reply in zip(reads, readreplies):
+      if not reply['ok']:
+        self.assertIn(request['query'][0], ids[0:25])
+        self.assertIn('Unknown queried Region ID', reply['error'])
+
+    stats, = self.send([{'op': 'stats'}])
+    self.assertEqual(stats['length'], len(self.regions) - 25)
+    self.assertEqual(stats['errors'], len([r for r in readreplies if not r['ok']]))
+
+  def test_server_loadgen(self):
+    # Imports the console command-line (and its dependencies) only if tested.
+    from sources.console.common import CommonConsoleNS
+
+    queries = StringIO('# queries\nA\nB, C\n\nD E F\n')
+    with StringIO() as output:
+      CommonConsoleNS.loadgen(queries, output, self.address, concurrency=2, repeat=2, counts=True)
+      lines = [loads(line) for line in output.getvalue().splitlines()]
+
+    replies, header = lines[:-1], lines[-1]['header']
+    self.assertEqual(len(replies), 6)
+    self.assertTrue(all(r['ok'] and r['elapse'] > 0 for r in replies))
+    self.assertListEqual([r['seq'] for r in replies], list(range(6)))
+    self.assertEqual(header['requests'], 6)
+    self.assertEqual(header['errors'], 0)
+    for latency in ['latency', 'latency_server']:
+      self.assertLessEqual(header[latency]['p50'], header[latency]['p99'])
+      self.assertLessEqual(header[latency]['p99'], header[latency]['max'])
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
 
-from .drawregions import *
-from .drawrigraph import *
+from sources.helpers import lazy_exports
+
+# Imports matplotlib on first access of a drawing method.
+__getattr__, __dir__ = lazy_exports(__name__, ['drawregions', 'drawrigraph'])
@@ -4,23 +4,41 @@
 Visualization for Intersecting Regions
 
 Draws the Regions on a 1D or 2D plot, to visualize the
-overlapping or intersecting Regions.
+overlapping or intersecting Regions. Large collections of
+Regions are drawn as a density raster image instead of one
+artist per Region, with highlighted Regions overlaid on top.
+
+Constants:
+- RasterThreshold
+- RasterSize
 
 Methods:
 - draw_regions
 - draw_regions1d
 - draw_regions2d
+- draw_raster
+- rasterize_regions
 """
 
 from dataclasses import astuple
+from typing import Set, Tuple
 
 from matplotlib import pyplot
 from matplotlib.axes import Axes
 from matplotlib.patches import Rectangle
+from numpy import \
+  array, bincount, ceil, clip, column_stack, concatenate, \
+  floor, isin, maximum, ndarray, ones, zeros
 
 from sources.core import Region, RegionSet
 
 
+# The number of Regions above which Regions are drawn as a raster image.
+RasterThreshold = 50000
+# The number of pixels of the raster image, along each dimension.
+RasterSize      = 1024
+
+
 def draw_regions(regions: RegionSet, plot: Axes, **kwargs):
   """
   Draws the Regions on a 1D or 2D plot, to visualize the
@@ -67,6 +85,14 @@ def draw_regions1d(regions: RegionSet, plot: Axes, **kwargs):
       Boolean flag for whether or not to reduce the
       bounding size to the minimum bounding Region,
       instead of the defined bounds.
+    overlay:
+      The highlighted Regions (within the set of
+      Regions) to always draw as lines, on top.
+    raster:
+      Boolean flag for whether or not to draw the
+      Regions (except the overlay) as a density
+      raster image. If None, only draws a raster
+      image for more than RasterThreshold Regions.
   """
   assert regions.dimension == 1
 
@@ -76,10 +102,15 @@ def draw_regions1d(regions: RegionSet, plot: Axes, **kwargs):
   colored     = kwargs.get('colored', False)
   communities = kwargs.get('communities', False)
   tightbounds = kwargs.get('tightbounds', False)
+  overlayids  = set(r.id for r in kwargs.get('overlay', []))
+  raster      = kwargs.get('raster')
 
   bbox    = regions.bbox if tightbounds else regions.minbounds
   spacing = max(bbox[0].length / len(regions), 10)
 
+  if raster is None:
+    raster = len(regions) - len(overlayids) > RasterThreshold
+
   if colored and communities:
     for region in regions:
       color = region.getdata('color')
@@ -93,10 +124,19 @@ def draw_regions1d(regions: RegionSet, plot: Axes, **kwargs):
       w, h   = (gbbox.length, spacing*(len(regions) + 2))
 
       rectangle = Rectangle(lows, w, h, facecolor=(*color,0.05), edgecolor='none')
-      rectangle.set_clip_box(plot)
+      rectangle.set_clip_box(plot.bbox)
       plot.add_artist(rectangle)
 
+  if raster:
+    lowers, uppers, rows, colors = _raster_bounds(regions, overlayids, colored)
+    lowers = column_stack([lowers[:, 0], spacing*(rows + 0.5)])
+    uppers = column_stack([uppers[:, 0], spacing*(rows + 1.5)])
+    extent = Region([bbox[0].lower, spacing*0.5], [bbox[0].upper, spacing*(len(regions) + 0.5)])
+    draw_raster(plot, lowers, uppers, extent, (min(RasterSize, len(regions)), RasterSize), colors)
+
   for i, region in enumerate(regions):
+    if raster and region.id not in overlayids:
+      continue
     color = region.getdata('color', black) if colored else black
     plot.plot(list(astuple(region[0])), [spacing*(i + 1)]*2, color=color)
 
@@ -128,6 +168,14 @@ def draw_regions2d(regions: RegionSet, plot: Axes, **kwargs):
       Boolean flag for whether or not to reduce the
       bounding size to the minimum bounding Region,
       instead of the defined bounds.
+    overlay:
+      The highlighted Regions (within the set of
+      Regions) to always draw as rectangles, on top.
+    raster:
+      Boolean flag for whether or not to draw the
+      Regions (except the overlay) as a density
+      raster image. If None, only draws a raster
+      image for more than RasterThreshold Regions.
   """
   assert regions.dimension == 2
 
@@ -137,9 +185,14 @@ def draw_regions2d(regions: RegionSet, plot: Axes, **kwargs):
   colored     = kwargs.get('colored', False)
   communities = kwargs.get('communities', False)
   tightbounds = kwargs.get('tightbounds', False)
+  overlayids  = set(r.id for r in kwargs.get('overlay', []))
+  raster      = kwargs.get('raster')
 
   bbox = regions.bbox if tightbounds else regions.minbounds
 
+  if raster is None:
+    raster = len(regions) - len(overlayids) > RasterThreshold
+
   def mkrectangle(region: Region):
     lower = tuple(region[d].lower  for d in range(2))
     w, h  = tuple(region[d].length for d in range(2))
@@ -155,14 +208,126 @@ def draw_regions2d(regions: RegionSet, plot: Axes, **kwargs):
 
     for color, group in groups.items():
       rectangle = Rectangle(*mkrectangle(group.bbox), facecolor=(*color,0.05), edgecolor='none')
-      rectangle.set_clip_box(plot)
+      rectangle.set_clip_box(plot.bbox)
       plot.add_artist(rectangle)
 
-  for region in regions:
+  if raster:
+    lowers, uppers, _, colors = _raster_bounds(regions, overlayids, colored)
+    draw_raster(plot, lowers, uppers, bbox, (RasterSize, RasterSize), colors)
+
+  base    = [] if raster else [r for r in regions if r.id not in overlayids]
+  overlay = [r for r in regions if r.id in overlayids]
+
+  for region in base + overlay:
     color = region.getdata('color', black) if colored else black
     rectangle = Rectangle(*mkrectangle(region), facecolor=(*color,0.1), edgecolor=color)
-    rectangle.set_clip_box(plot)
+    rectangle.set_clip_box(plot.bbox)
     plot.add_artist(rectangle)
 
   plot.set_xlim(astuple(bbox[0]))
   plot.set_ylim(astuple(bbox[1]))
+
+
+def draw_raster(plot: Axes, lowers: ndarray, uppers: ndarray, bbox: Region,
+                shape: Tuple[int, int], colors: ndarray = None):
+  """
+  Draws the given bounds of 2D Regions on the plot as a density raster
+  image, spanning the given bounding Region. Each pixel is shaded as if the
+  Regions covering it were stacked as translucent faces (each 10% opaque),
+  in the average color of those Regions, or black if no colors given.
+
+  Args:
+    lowers: The (N, 2) lower bounds of the Regions.
+    uppers: The (N, 2) upper bounds of the Regions.
+    bbox:   The bounding Region spanned by the image.
+    shape:  The number of pixel rows and columns.
+    colors: The (N, 3) RGB colors of the Regions,
+            or None for black.
+  """
+  depth = rasterize_regions(lowers, uppers, bbox, shape)
+  image = zeros((*shape, 4))
+
+  if colors is not None:
+    sums = rasterize_regions(lowers, uppers, bbox, shape, colors)
+    image[..., :3] = clip(sums / maximum(depth, 1)[..., None], 0, 1)
+
+  image[..., 3] = 1 - 0.9 ** depth
+
+  plot.imshow(image, extent=(bbox[0].lower, bbox[0].upper, bbox[1].lower, bbox[1].upper),
+              origin='lower', interpolation='nearest', aspect=plot.get_aspect())
+
+
+def rasterize_regions(lowers: ndarray, uppers: ndarray, bbox: Region,
+                      shape: Tuple[int, int], weights: ndarray = None) -> ndarray:
+  """
+  Computes the depth of each pixel (the number of Regions covering it) in a
+  grid of pixels spanning the given bounding Region, for the given bounds of
+  2D Regions. Adds the four corners of each Region's pixel bounds into a
+  difference array, then takes its cumulative sums along both dimensions.
+  Each Region covers at least one pixel. If weights are given, computes the
+  sum of the weights of the Regions covering each pixel instead.
+
+  Args:
+    lowers:   The (N, 2) lower bounds of the Regions.
+    uppers:   The (N, 2) upper bounds of the Regions.
+    bbox:     The bounding Region spanned by the grid.
+    shape:    The number of pixel rows and columns.
+    weights:  The (N, K) weights of the Regions,
+              or None to count the Regions.
+
+  Returns:
+    The (rows, columns) grid of depths, or the
+    (rows, columns, K) grid of summed weights.
+  """
+  rows, cols = shape
+  lower  = array(bbox.lower, dtype=float)
+  length = array(bbox.upper, dtype=float) - lower
+  length[length == 0] = 1
+  scale  = array([cols, rows]) / length
+
+  x0, y0 = clip(floor((lowers - lower) * scale), 0, [cols - 1, rows - 1]).astype(int).T
+  x1, y1 = clip(ceil((uppers - lower) * scale), 1, [cols, rows]).astype(int).T
+  x1, y1 = maximum(x1, x0 + 1), maximum(y1, y0 + 1)
+
+  corners = concatenate([y0*(cols + 1) + x0, y0*(cols + 1) + x1,
+                         y1*(cols + 1) + x0, y1*(cols + 1) + x1])
+  signs   = concatenate([ones(len(x0)), -ones(len(x0)), -ones(len(x0)), ones(len(x0))])
+  columns = ones((len(x0), 1)) if weights is None else weights.reshape(len(x0), -1)
+
+  grid = zeros((rows + 1, cols + 1, columns.shape[1]))
+  for k in range(columns.shape[1]):
+    diff = bincount(corners, signs * concatenate([columns[:, k]]*4), (rows + 1)*(cols + 1))
+    grid[..., k] = diff.reshape(rows + 1, cols + 1).cumsum(0).cumsum(1)
+
+  grid = grid[:rows, :cols]
+
+  return grid[..., 0] if weights is None else grid
+
+
+def _raster_bounds(regions: RegionSet, overlayids: Set[str],
+                   colored: bool) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+  """
+  Returns the bounds, positions and colors of the Regions to draw as a
+  raster image: all Regions except the overlay, taken from the columnar
+  representation of the Regions.
+
+  Args:
+    regions:    The set of Regions to draw.
+    overlayids: The IDs of the Regions to exclude.
+    colored:    Boolean flag whether or not to return
+                the colors of the Regions.
+
+  Returns:
+    The (N, d) lower and upper bounds, the positions
+    within the set and the (N, 3) colors (or None) of
+    the Regions, as a tuple.
+  """
+  columns = regions.columns
+  rows    = (~isin(columns['id'], list(overlayids))).nonzero()[0]
+  colors  = None
+
+  if colored:
+    black  = (0,0,0)
+    colors = array([tuple(regions[i].getdata('color', black))[:3] for i in rows.tolist()], dtype=float)
+
+  return columns['lower'][rows], columns['upper'][rows], rows, colors
@@ -13,7 +13,6 @@ Methods:
 
 from matplotlib.axes import Axes
 from networkx import networkx as nx
-from pandas import DataFrame
 
 from sources.core import NxGraph, Region
 
@@ -53,6 +52,8 @@ def draw_rigraph(graph: NxGraph, plot: Axes, **kwargs):
   colored = kwargs.get('colored', False)
 
   def force(G: nx.Graph):
+    from pandas import DataFrame
+
     df = DataFrame(index=G.nodes(), columns=G.nodes())
     for row, data in nx.shortest_path_length(G):
       for col, dist in data.items():